@@ -22,7 +22,7 @@ from . import finance
 from . import gens
 from . import utils
 from .utils.calendars import get_calendar
-from .utils.run_algo import run_algorithm
+from .utils.run_algo import run_algorithm, run_sweep
 from ._version import get_versions
 
 # These need to happen after the other imports.
@@ -76,5 +76,6 @@ __all__ = [
     'get_calendar',
     'gens',
     'run_algorithm',
+    'run_sweep',
     'utils',
 ]
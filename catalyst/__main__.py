@@ -14,7 +14,8 @@ from catalyst.data import bundles as bundles_module
 from catalyst.exchange.exchange_bundle import ExchangeBundle
 from catalyst.exchange.utils.exchange_utils import delete_algo_folder
 from catalyst.utils.cli import Date, Timestamp
-from catalyst.utils.run_algo import _run, load_extensions
+from catalyst.utils.run_algo import _run, _run_sweep, _get_sweep_variants, \
+    load_extensions
 from catalyst.exchange.utils.bundle_utils import EXCHANGE_NAMES
 from catalyst.utils.remote import remote_backtest, get_remote_status
 
@@ -211,6 +212,27 @@ def ipython_only(option):
     help='The quote currency used to calculate statistics '
          '(e.g. usd, btc, eth).',
 )
+@click.option(
+    '--sweep',
+    multiple=True,
+    metavar='NAME=VALUES',
+    help="Run a backtest for each combination of the values of the names,"
+         " bound in the namespace before executing the algotext. For"
+         " example '--sweep fast=[5,10] --sweep slow=range(20,60,10)'."
+         " The values may be any python expression of an iterable.",
+)
+@click.option(
+    '--sweep-symbols',
+    help='The comma-delimited trading pairs of the sweep to load once in '
+         'shared memory (e.g. btc_usdt,eth_usdt).',
+)
+@click.option(
+    '--sweep-processes',
+    type=int,
+    default=None,
+    help='The number of processes running the backtests of the sweep.\n'
+         '[default: <number of cpus>]',
+)
 @click.pass_context
 def run(ctx,
         algofile,
@@ -227,7 +249,10 @@ def run(ctx,
         local_namespace,
         exchange_name,
         algo_namespace,
-        quote_currency):
+        quote_currency,
+        sweep,
+        sweep_symbols,
+        sweep_processes):
     """Run a backtest for the given algorithm.
     """
 
@@ -262,6 +287,45 @@ def run(ctx,
     if capital_base is None:
         ctx.fail("must specify a capital base with '--capital-base'")
 
+    if sweep:
+        variants = _get_sweep_variants(sweep)
+        click.echo(
+            'Running a sweep of {} backtests.'.format(len(variants)),
+            sys.stdout
+        )
+
+        perfs = _run_sweep(
+            initialize=None,
+            handle_data=None,
+            before_trading_start=None,
+            analyze=None,
+            algofile=algofile,
+            algotext=algotext,
+            defines=define,
+            variants=variants,
+            symbols=sweep_symbols,
+            processes=sweep_processes,
+            data_frequency=data_frequency,
+            capital_base=capital_base,
+            start=start,
+            end=end,
+            environ=os.environ,
+            exchange=exchange_name,
+            quote_currency=quote_currency,
+        )
+        results = list(zip(variants, perfs))
+
+        if output == '-':
+            for params, perf in results:
+                click.echo(
+                    '{}: {}'.format(params, perf['portfolio_value'].iloc[-1]),
+                    sys.stdout
+                )
+        elif output != os.devnull:
+            pd.to_pickle(results, output)
+
+        return results
+
     click.echo('Running in backtesting mode.', sys.stdout)
 
     perf = _run(
@@ -437,6 +501,15 @@ def catalyst_magic(line, cell=None):
          'specified like this: "[exchange_name],[alias],..." For example, '
          '"binance,auth2" or "binance,auth2,bittrex,auth2".',
 )
+@click.option(
+    '--feed',
+    multiple=True,
+    help='The address of a streaming market data feed of an exchange, '
+         'used for the tickers, order books and bars instead of polling '
+         'the exchange. It should be specified like this: '
+         '"[exchange_name]=[host]:[port]". For example, '
+         '"--feed binance=127.0.0.1:9000".',
+)
 @click.pass_context
 def live(ctx,
          algofile,
@@ -453,7 +526,8 @@ def live(ctx,
          end,
          live_graph,
          auth_aliases,
-         simulate_orders):
+         simulate_orders,
+         feed):
     """Trade live with the given algorithm.
     """
     if (algotext is not None) == (algofile is not None):
@@ -508,6 +582,7 @@ def live(ctx,
         simulate_orders=simulate_orders,
         auth_aliases=auth_aliases,
         stats_output=None,
+        feeds=feed,
     )
 
     if output == '-':
@@ -824,10 +899,24 @@ def remote_status(ctx, algo_id, data_output, log_output):
     default=False,
     help='Report potential anomalies found in data bundles.'
 )
+@click.option(
+    '-j',
+    '--jobs',
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help='The number of bundle chunks to download and decode concurrently.',
+)
+@click.option(
+    '--incremental/--no-incremental',
+    default=False,
+    help='Ingest the bars more recent than the bundle from the exchange '
+         'API instead of the bundle chunks.'
+)
 @click.pass_context
 def ingest_exchange(ctx, exchange_name, data_frequency, start, end,
                     include_symbols, exclude_symbols, csv, show_progress,
-                    verbose, validate):
+                    verbose, validate, jobs, incremental):
     """
     Ingest data for the given exchange.
     """
@@ -854,10 +943,58 @@ def ingest_exchange(ctx, exchange_name, data_frequency, start, end,
         show_progress=show_progress,
         show_breakdown=verbose,
         show_report=validate,
-        csv=csv
+        csv=csv,
+        jobs=jobs,
+        incremental=incremental
     )
 
 
+@main.command(name='hot-tier-exchange')
+@click.option(
+    '-x',
+    '--exchange-name',
+    help='The name of the exchange bundle.',
+)
+@click.option(
+    '-f',
+    '--data-frequency',
+    type=click.Choice({'daily', 'minute'}),
+    default='minute',
+    show_default=True,
+    help='The data frequency of the bundle.',
+)
+@click.option(
+    '-s',
+    '--start',
+    default=None,
+    type=Date(tz='utc', as_timestamp=True),
+    help='The start date of the range.',
+)
+@click.option(
+    '-e',
+    '--end',
+    default=None,
+    type=Date(tz='utc', as_timestamp=True),
+    help='The end date of the range.',
+)
+@click.pass_context
+def hot_tier_exchange(ctx, exchange_name, data_frequency, start, end):
+    """
+    Copy a date range of an exchange bundle to its uncompressed hot tier.
+    """
+    if exchange_name is None:
+        ctx.fail("must specify an exchange name '-x'")
+    if start is None or end is None:
+        ctx.fail("must specify a start '-s' and an end '-e' date")
+
+    exchange_bundle = ExchangeBundle(exchange_name)
+
+    click.echo('Building the hot tier of exchange bundle {}...'.format(
+        exchange_name), sys.stdout)
+    exchange_bundle.build_hot_tier(data_frequency, start, end)
+    click.echo('Done', sys.stdout)
+
+
 @main.command(name='clean-algo')
 @click.option(
     '-n',
@@ -138,7 +138,7 @@ from catalyst.gens.sim_engine import MinuteSimulationClock
 from catalyst.sources.benchmark_source import BenchmarkSource
 from catalyst.catalyst_warnings import ZiplineDeprecationWarning
 
-from catalyst.constants import LOG_LEVEL
+from catalyst.constants import LOG_LEVEL, PIPELINE_THREADS
 
 log = logbook.Logger("CatalystLog", level=LOG_LEVEL)
 
@@ -445,6 +445,7 @@ class TradingAlgorithm(object):
                 get_loader,
                 all_dates,
                 self.asset_finder,
+                num_threads=PIPELINE_THREADS,
             )
         else:
             self.engine = ExplodingPipelineEngine()
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
 import os
+
 import logbook
 
 ''' You can override the LOG level from your environment.
@@ -56,3 +57,35 @@ ALPHA_WARNING_MESSAGE = 'Catalyst is currently in ALPHA. It is going ' \
 TERMS_AND_CONDITIONS = 'https://raw.githubusercontent.com/enigmampc/' \
                        'catalyst/master/catalyst/marketplace/' \
                        'terms_and_conditions.txt'
+
+''' The seconds during which a ticker fetched in the current bar can be
+    served again without a new request.
+'''
+TICKER_TTL = float(os.environ.get('CATALYST_TICKER_TTL', 30))
+
+''' The number of bars journaled between two snapshots of the state of a
+    live algorithm.
+'''
+JOURNAL_SNAPSHOT_INTERVAL = int(
+    os.environ.get('CATALYST_JOURNAL_SNAPSHOT_INTERVAL', 60)
+)
+
+''' The number of journal records written between two fsync calls. The
+    records are flushed to the OS on every write, the fsync only guards
+    against power losses.
+'''
+JOURNAL_FSYNC_INTERVAL = int(
+    os.environ.get('CATALYST_JOURNAL_FSYNC_INTERVAL', 10)
+)
+
+''' The number of threads computing the independent terms of a pipeline,
+    the terms are computed one at a time by default.
+'''
+PIPELINE_THREADS = int(os.environ.get('CATALYST_PIPELINE_THREADS', 1))
+
+''' The seconds after which the open orders of an exchange are reconciled
+    again, even when the trades streamed by its feed did not reach them.
+'''
+ORDER_RECONCILE_INTERVAL = float(
+    os.environ.get('CATALYST_ORDER_RECONCILE_INTERVAL', 300)
+)
@@ -1235,45 +1235,71 @@ class BcolzMinuteBarReader(MinuteBarReader):
         start_idx = self._find_position_of_minute(start_dt)
         end_idx = self._find_position_of_minute(end_dt)
 
-        num_minutes = (end_idx - start_idx + 1)
+        keep = self._window_mask(start_idx, end_idx)
+        inverse_ratios = self._ohlc_ratio_inverses_for_sids(sids)
 
         results = []
+        for field in fields:
+            values = self._load_raw_field(field, sids, start_idx, end_idx)
+            if keep is not None:
+                values = values[keep]
+
+            fill = 0.0 if field == 'volume' else np.nan
+            # Minutes which were not written for a sid are zero-filled by
+            # _load_raw_field and end up masked like any other empty bar.
+            results.append(
+                np.where(values != 0, values * inverse_ratios, fill)
+            )
+
+        return results
+
+    def _ohlc_ratio_inverses_for_sids(self, sids):
+        """
+        Returns
+        -------
+        np.ndarray
+            The OHLC ratio inverse of each sid, in the order of `sids`.
+        """
+        return np.array(
+            [self._ohlc_ratio_inverse_for_sid(sid) for sid in sids],
+            dtype=np.float64,
+        )
 
+    def _window_mask(self, start_idx, end_idx):
+        """
+        Returns
+        -------
+        np.ndarray[bool] or None
+            A mask of the positions between start_idx and end_idx which are
+            not excluded because of early closes, None if there are no
+            exclusions in the range.
+        """
         indices_to_exclude = self._exclusion_indices_for_range(
             start_idx, end_idx)
-        if indices_to_exclude is not None:
-            for excl_start, excl_stop in indices_to_exclude:
-                length = excl_stop - excl_start + 1
-                num_minutes -= length
+        if indices_to_exclude is None:
+            return None
 
-        shape = num_minutes, len(sids)
+        keep = np.ones(end_idx - start_idx + 1, dtype=bool)
+        for excl_start, excl_stop in indices_to_exclude:
+            keep[max(excl_start - start_idx, 0):
+                 max(excl_stop - start_idx + 1, 0)] = False
+        return keep
 
-        for field in fields:
-            if field != 'volume':
-                out = np.full(shape, np.nan)
-            else:
-                out = np.zeros(shape, dtype=np.float64)
-
-            for i, sid in enumerate(sids):
-                carray = self._open_minute_file(field, sid)
-                values = carray[start_idx:end_idx + 1]
-                if indices_to_exclude is not None:
-                    for excl_start, excl_stop in indices_to_exclude[::-1]:
-                        excl_slice = np.s_[excl_start - start_idx:excl_stop
-                                           - start_idx + 1]
-                        values = np.delete(values, excl_slice)
-
-                where = values != 0
-                # first slice down to len(where) because we might not have
-                # written data for all the minutes requested
-                # if field != 'volume':
-                out[:len(where), i][where] = (
-                    values[where] * self._ohlc_ratio_inverse_for_sid(sid))
-                # else:
-                #    out[:len(where), i][where] = values[where]
-
-            results.append(out)
-        return results
+    def _load_raw_field(self, field, sids, start_idx, end_idx):
+        """
+        Read the raw values of a field between two positions for many sids.
+
+        Returns
+        -------
+        np.ndarray
+            An array of shape (end_idx - start_idx + 1, len(sids)). The
+            positions after the last value written for a sid are zeros.
+        """
+        out = np.zeros((end_idx - start_idx + 1, len(sids)), dtype=np.uint64)
+        for i, sid in enumerate(sids):
+            values = self._open_minute_file(field, sid)[start_idx:end_idx + 1]
+            out[:len(values), i] = values
+        return out
 
 
 class MinuteBarUpdateReader(with_metaclass(ABCMeta, object)):
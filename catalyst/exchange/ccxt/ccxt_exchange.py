@@ -3,12 +3,14 @@ import json
 import os
 import re
 from collections import defaultdict
+from multiprocessing.pool import ThreadPool
 
 import ccxt
+import numpy as np
 import pandas as pd
 import six
 from ccxt import InvalidOrder, NetworkError, \
-    ExchangeError, RequestTimeout
+    ExchangeError, RequestTimeout, DDoSProtection
 from logbook import Logger
 from six import string_types
 
@@ -16,15 +18,20 @@ from catalyst.algorithm import MarketOrder
 from catalyst.assets._assets import TradingPair
 from catalyst.constants import LOG_LEVEL
 from catalyst.exchange.exchange import Exchange
+from catalyst.exchange.exchange_asset_index import ExchangeAssetIndex, \
+    ASSET_CATALOG_FILENAME, get_catalog_key, read_asset_catalog, \
+    write_asset_catalog
 from catalyst.exchange.exchange_bundle import ExchangeBundle
 from catalyst.exchange.exchange_errors import InvalidHistoryFrequencyError, \
     ExchangeSymbolsNotFound, ExchangeRequestError, InvalidOrderStyle, \
     ExchangeNotFoundError, CreateOrderError, InvalidHistoryTimeframeError, \
     UnsupportedHistoryFrequencyError
 from catalyst.exchange.exchange_execution import ExchangeLimitOrder
+from catalyst.exchange.exchange_scheduler import RequestScheduler, \
+    get_token_bucket
 from catalyst.exchange.utils.exchange_utils import mixin_market_params, \
     get_exchange_folder, get_catalyst_symbol, \
-    get_exchange_auth
+    get_exchange_auth, get_exchange_symbols_filename
 from catalyst.exchange.utils.datetime_utils import from_ms_timestamp, \
     get_epoch, \
     get_periods_range
@@ -69,12 +76,21 @@ class CCXT(Exchange):
                 'secret': secret,
                 'password': password,
             })
-            self.api.enableRateLimit = True
+            # The requests are throttled by the scheduler instead
+            self.api.enableRateLimit = False
 
         except Exception:
             raise ExchangeNotFoundError(exchange_name=exchange_name)
 
+        self.scheduler = RequestScheduler(
+            api=self.api,
+            bucket=get_token_bucket(exchange_name, self.api.rateLimit),
+            rate_limit_errors=(DDoSProtection,),
+        )
+
         self._symbol_maps = [None, None]
+        # The symbol maps with lower case keys, with the map they come from
+        self._lower_symbol_maps = [(None, dict()), (None, dict())]
 
         self.name = exchange_name
 
@@ -83,9 +99,12 @@ class CCXT(Exchange):
 
         self.num_candles_limit = 2000
         self.max_requests_per_minute = 60
+        self.max_concurrent_requests = 10
         self.low_balance_threshold = 0.1
         self.request_cpt = dict()
         self._common_symbols = dict()
+        # The fetch methods which can't be called without a symbol
+        self._symbol_required = dict()
 
         # Operations with retry features
         self.attempts = dict(
@@ -116,14 +135,14 @@ class CCXT(Exchange):
 
         if self.markets is None:
             try:
-                markets_symbols = self.api.load_markets()
+                markets_symbols = self.scheduler.call('load_markets')
                 log.debug(
                     'fetching {} markets:\n{}'.format(
                         self.name, markets_symbols
                     )
                 )
 
-                self.markets = self.api.fetch_markets()
+                self.markets = self.scheduler.call('fetch_markets')
                 with open(filename, 'w+') as f:
                     json.dump(self.markets, f, indent=4)
 
@@ -192,6 +211,10 @@ class CCXT(Exchange):
     def time_skew(self):
         return None
 
+    @property
+    def has_bulk_tickers(self):
+        return bool(self.api.has['fetchTickers'])
+
     def get_candle_frequencies(self, data_frequency=None):
         frequencies = []
         try:
@@ -420,8 +443,40 @@ class CCXT(Exchange):
             timeframe, source='ccxt', raise_error=raise_error
         )
 
-    def get_candles(self, freq, assets, bar_count=1, start_dt=None,
-                    end_dt=None):
+    def _fetch_ohlcv(self, asset, symbol, timeframe, since, limit):
+        try:
+            ohlcvs = self.scheduler.call(
+                'fetch_ohlcv',
+                symbol=symbol,
+                timeframe=timeframe,
+                since=since,
+                limit=limit,
+                params={}
+            )
+        except (ExchangeError, NetworkError) as e:
+            log.warn(
+                'unable to fetch {} ohlcv: {}'.format(
+                    asset, e
+                )
+            )
+            raise ExchangeRequestError(error=e)
+
+        values = np.array(ohlcvs, dtype=np.float64).reshape(-1, 6)
+        values = values[np.argsort(values[:, 0], kind='mergesort')]
+
+        return dict(
+            last_traded=pd.to_datetime(
+                values[:, 0].astype(np.int64), unit='ms', utc=True
+            ),
+            open=values[:, 1],
+            high=values[:, 2],
+            low=values[:, 3],
+            close=values[:, 4],
+            volume=values[:, 5],
+        )
+
+    def get_candle_arrays(self, freq, assets, bar_count=1, start_dt=None,
+                          end_dt=None):
         is_single = (isinstance(assets, TradingPair))
         if is_single:
             assets = [assets]
@@ -456,39 +511,59 @@ class CCXT(Exchange):
         delta = start_dt - get_epoch()
         since = int(delta.total_seconds()) * 1000
 
-        candles = dict()
-        for index, asset in enumerate(assets):
+        if len(assets) == 1:
+            arrays = [self._fetch_ohlcv(
+                assets[0], symbols[0], timeframe, since, bar_count
+            )]
+
+        else:
+            # The requests are sent concurrently, the scheduler
+            # spaces them within the rate limit of the exchange.
+            pool = ThreadPool(
+                min(len(assets), self.max_concurrent_requests)
+            )
             try:
-                ohlcvs = self.api.fetch_ohlcv(
-                    symbol=symbols[index],
-                    timeframe=timeframe,
-                    since=since,
-                    limit=bar_count,
-                    params={}
-                )
-            except (ExchangeError, NetworkError) as e:
-                log.warn(
-                    'unable to fetch {} ohlcv: {}'.format(
-                        asset, e
-                    )
+                arrays = pool.map(
+                    lambda args: self._fetch_ohlcv(
+                        *args, timeframe=timeframe, since=since,
+                        limit=bar_count
+                    ),
+                    list(zip(assets, symbols)),
                 )
-                raise ExchangeRequestError(error=e)
+            finally:
+                pool.close()
+                pool.join()
 
-            candles[asset] = []
-            for ohlcv in ohlcvs:
-                candles[asset].append(dict(
-                    last_traded=pd.to_datetime(
-                        ohlcv[0], unit='ms', utc=True
-                    ),
-                    open=ohlcv[1],
-                    high=ohlcv[2],
-                    low=ohlcv[3],
-                    close=ohlcv[4],
-                    volume=ohlcv[5]
-                ))
-            candles[asset] = sorted(
-                candles[asset], key=lambda c: c['last_traded']
-            )
+        candles = dict(zip(assets, arrays))
+        if is_single:
+            return six.next(six.itervalues(candles))
+
+        else:
+            return candles
+
+    def get_candles(self, freq, assets, bar_count=1, start_dt=None,
+                    end_dt=None):
+        is_single = (isinstance(assets, TradingPair))
+        candle_arrays = self.get_candle_arrays(
+            freq=freq,
+            assets=assets,
+            bar_count=bar_count,
+            start_dt=start_dt,
+            end_dt=end_dt,
+        )
+        if is_single:
+            candle_arrays = {assets: candle_arrays}
+
+        candles = dict()
+        for asset, arrays in six.iteritems(candle_arrays):
+            fields = ['open', 'high', 'low', 'close', 'volume']
+            candles[asset] = [
+                dict(zip(fields, values), last_traded=last_traded)
+                for last_traded, values in zip(
+                    arrays['last_traded'],
+                    zip(*[arrays[field].tolist() for field in fields])
+                )
+            ]
 
         if is_single:
             return six.next(six.itervalues(candles))
@@ -503,6 +578,32 @@ class CCXT(Exchange):
         except ExchangeSymbolsNotFound:
             return None
 
+    def _get_lower_symbol_map(self, is_local):
+        """
+        The symbol map keyed by lower case exchange symbols, computed once
+        for each symbol map fetched.
+
+        Parameters
+        ----------
+        is_local: bool
+
+        Returns
+        -------
+        dict[str, Object]
+
+        """
+        index = 1 if is_local else 0
+
+        symbol_map = self._fetch_symbol_map(is_local)
+        source, lower_symbol_map = self._lower_symbol_maps[index]
+        if symbol_map is not source:
+            lower_symbol_map = {
+                k.lower(): v for k, v in symbol_map.items()
+            } if symbol_map is not None else dict()
+            self._lower_symbol_maps[index] = (symbol_map, lower_symbol_map)
+
+        return lower_symbol_map
+
     def get_asset_defs(self, market):
         """
         The local and Catalyst definitions of the specified market.
@@ -544,22 +645,8 @@ class CCXT(Exchange):
             The asset definition.
 
         """
-        exchange_symbol = market['id']
-
-        symbol_map = self._fetch_symbol_map(is_local)
-        if symbol_map is not None:
-            assets_lower = {k.lower(): v for k, v in symbol_map.items()}
-            key = exchange_symbol.lower()
-
-            asset = assets_lower[key] if key in assets_lower else None
-            if asset is not None:
-                return asset
-
-            else:
-                return None
-
-        else:
-            return None
+        symbol_map = self._get_lower_symbol_map(is_local)
+        return symbol_map.get(market['id'].lower())
 
     def create_trading_pair(self, market, asset_def=None, is_local=False):
         """
@@ -614,38 +701,88 @@ class CCXT(Exchange):
         return TradingPair(**params)
 
     def load_assets(self):
+        """
+        Build the assets of the markets, merged with their Catalyst and
+        local definitions.
+
+        The assets are saved in a catalog file next to the markets file,
+        loaded instead of being built again until the markets or the
+        symbols files change.
+
+        """
         log.debug('loading assets for {}'.format(self.name))
-        self.assets = []
 
+        exchange_folder = get_exchange_folder(self.name)
+        catalog_filename = os.path.join(
+            exchange_folder, ASSET_CATALOG_FILENAME
+        )
+
+        def catalog_key():
+            return get_catalog_key(
+                [
+                    os.path.join(exchange_folder, 'cctx_markets.json'),
+                    get_exchange_symbols_filename(self.name, False),
+                    get_exchange_symbols_filename(self.name, True),
+                ],
+                len(self.markets),
+            )
+
+        assets = read_asset_catalog(catalog_filename, catalog_key())
+        if assets is None:
+            assets = self._build_assets()
+
+            try:
+                # The symbols files may have been downloaded meanwhile
+                write_asset_catalog(catalog_filename, catalog_key(), assets)
+
+            except (IOError, OSError) as e:
+                log.warn('unable to save the asset catalog {}: {}'.format(
+                    catalog_filename, e
+                ))
+
+        self.assets = assets
+        self._asset_index = ExchangeAssetIndex(self.assets, self.get_symbol)
+
+    def _build_assets(self):
+        symbol_maps = [
+            self._get_lower_symbol_map(is_local) for is_local in (False, True)
+        ]
+
+        assets = []
         for market in self.markets:
             if 'id' not in market:
                 log.warn('invalid market: {}'.format(market))
                 continue
 
-            asset_defs = self.get_asset_defs(market)
+            key = market['id'].lower()
 
             asset = None
-            for asset_def in asset_defs:
-                if asset_def[0] is not None or not asset_defs[1]:
-                    try:
-                        asset = self.create_trading_pair(
-                            market=market,
-                            asset_def=asset_def[0],
-                            is_local=asset_def[1]
-                        )
-                        self.assets.append(asset)
+            for is_local, symbol_map in zip((False, True), symbol_maps):
+                asset_def = symbol_map.get(key)
+                if asset_def is None:
+                    continue
+
+                try:
+                    asset = self.create_trading_pair(
+                        market=market,
+                        asset_def=asset_def,
+                        is_local=is_local
+                    )
+                    assets.append(asset)
 
-                    except TypeError as e:
-                        log.warn('unable to add asset: {}'.format(e))
+                except TypeError as e:
+                    log.warn('unable to add asset: {}'.format(e))
 
             if asset is None:
                 asset = self.create_trading_pair(market=market)
-                self.assets.append(asset)
+                assets.append(asset)
+
+        return assets
 
     def get_balances(self):
         try:
             log.debug('retrieving wallets balances')
-            balances = self.api.fetch_balance()
+            balances = self.scheduler.call('fetch_balance')
 
             balances_lower = dict()
             for key in balances:
@@ -807,25 +944,28 @@ class CCXT(Exchange):
             # contains all orders, therefore,
             # if method available for this exchange,
             # it's enough to check it.
-            self.api.fetch_orders()
+            self.scheduler.call('fetch_orders')
             missing_order = self._check_order_found(previous_orders)
 
         else:
             if 'fetchOpenOrders' in self.api.has and \
                     self.api.has['fetchOpenOrders'] is True:
-                self.api.fetch_open_orders()
+                self.scheduler.call('fetch_open_orders')
                 missing_order = self._check_order_found(previous_orders)
 
             if missing_order is None and \
                     'fetchClosedOrders' in self.api.has and \
                     self.api.has['fetchClosedOrders'] is True:
-                self.api.fetch_closed_orders()
+                self.scheduler.call('fetch_closed_orders')
                 missing_order = self._check_order_found(previous_orders)
 
         if missing_order is None and self.api.has['fetchMyTrades']:
-            recent_trades = [x for x in self.api.fetch_my_trades(symbol=symbol)
-                             if pd.Timestamp(x['datetime']) > dt_before
-                             ]
+            recent_trades = [
+                x for x in self.scheduler.call(
+                    'fetch_my_trades', symbol=symbol
+                )
+                if pd.Timestamp(x['datetime']) > dt_before
+            ]
             missing_order_id_by_trade = list(set(
                 trade['order'] for trade in recent_trades
                 if trade['order'] not in list(self.api.orders)
@@ -898,7 +1038,7 @@ class CCXT(Exchange):
         if hasattr(self.api, 'amount_to_lots'):
             # TODO: is this right?
             if self.api.markets is None:
-                self.api.load_markets()
+                self.scheduler.call('load_markets')
 
             # https://github.com/ccxt/ccxt/issues/1483
             market = self.api.markets[symbol]
@@ -913,7 +1053,8 @@ class CCXT(Exchange):
         prec_amount = self.api.amount_to_precision(symbol, adj_amount)
         before_order_dt = pd.Timestamp.utcnow()
         try:
-            result = self.api.create_order(
+            result = self.scheduler.call(
+                'create_order',
                 symbol=symbol,
                 type=order_type,
                 side=side,
@@ -995,7 +1136,8 @@ class CCXT(Exchange):
     def get_open_orders(self, asset):
         try:
             symbol = self.get_symbol(asset)
-            result = self.api.fetch_open_orders(
+            result = self.scheduler.call(
+                'fetch_open_orders',
                 symbol=symbol,
                 since=None,
                 limit=None,
@@ -1028,7 +1170,8 @@ class CCXT(Exchange):
         return super(CCXT, self)._check_low_balance(updated_currency, balances,
                                                     amount)
 
-    def _process_order_fallback(self, order):
+    def _process_order_fallback(self, order, exc_order=None, price=None,
+                                processed_amount=0):
         """
         Fallback method for exchanges which do not play nice with
         fetch-my-trades. Apparently, about 60% of exchanges will return
@@ -1038,18 +1181,26 @@ class CCXT(Exchange):
         Parameters
         ----------
         order: Order
+        exc_order: Order, optional
+            The order on the exchange, fetched when not specified.
+        price: float, optional
+            The execution price of the order on the exchange.
+        processed_amount: float, optional
+            The amount of the order already accounted for by transactions.
 
         Returns
         -------
-        float
+        list[Transaction]
 
         """
-        exc_order, price = self.get_order(
-            order.id, order.asset, return_price=True
-        )
+        if exc_order is None:
+            exc_order, price = self.get_order(
+                order.id, order.asset, return_price=True
+            )
         order.status = exc_order.status
         order.commission = exc_order.commission
-        order.filled = exc_order.filled
+        if exc_order.status == ORDER_STATUS.FILLED or not processed_amount:
+            order.filled = exc_order.filled
 
         transactions = []
         if exc_order.status == ORDER_STATUS.FILLED:
@@ -1067,7 +1218,7 @@ class CCXT(Exchange):
             )
             transaction = Transaction(
                 asset=order.asset,
-                amount=order.amount,
+                amount=order.amount - processed_amount,
                 dt=pd.Timestamp.utcnow(),
                 price=price,
                 order_id=order.id,
@@ -1077,6 +1228,59 @@ class CCXT(Exchange):
 
         return transactions
 
+    def _create_trade_transaction(self, order, trade):
+        """
+        Fill an order with one of its trades.
+
+        Parameters
+        ----------
+        order: Order
+        trade: dict[str, Object]
+            The trade dict from the CCXT api.
+
+        Returns
+        -------
+        Transaction
+
+        """
+        # status property will update automatically
+        filled = trade['amount'] * order.direction
+        order.filled += filled
+
+        order.check_triggers(
+            price=trade['price'],
+            dt=pd.to_datetime(trade['timestamp'], unit='ms', utc=True),
+        )
+
+        commission = 0
+        if 'fee' in trade and 'cost' in trade['fee']:
+            # If the exchange gives info of the fees- from ccxt
+            commission = trade['fee']['cost']
+            order.commission += commission
+
+        if 'fee' in trade and 'currency' in trade['fee']:
+            return Transaction(
+                asset=order.asset,
+                amount=filled,
+                dt=pd.Timestamp.utcnow(),
+                price=trade['price'],
+                order_id=order.id,
+                commission=commission,
+                fee_currency=trade['fee']['currency'].lower(),
+                is_quote_live=(self.quote_currency ==
+                               trade['fee']['currency'].lower())
+            )
+
+        else:
+            return Transaction(
+                asset=order.asset,
+                amount=filled,
+                dt=pd.Timestamp.utcnow(),
+                price=trade['price'],
+                order_id=order.id,
+                commission=commission,
+            )
+
     def process_order(self, order):
         # TODO: move to parent class after tracking features in the parent
         if not self.api.has['fetchMyTrades']:
@@ -1109,46 +1313,278 @@ class CCXT(Exchange):
         order.filled = 0
         order.commission = 0
         for trade in trades:
-            # status property will update automatically
-            filled = trade['amount'] * order.direction
-            order.filled += filled
+            transactions.append(self._create_trade_transaction(order, trade))
 
-            order.check_triggers(
-                price=trade['price'],
-                dt=pd.to_datetime(trade['timestamp'], unit='ms', utc=True),
+        order.filled = round(order.filled, order.asset.decimals)
+        order.broker_order_id = ', '.join([t['id'] for t in trades])
+        return transactions
+
+    def _fetch_for_orders(self, method, orders, get_since):
+        """
+        Call a fetch method of the api for the symbols of the orders.
+
+        A single request is made for all the symbols, or one request per
+        symbol on the exchanges requiring one.
+
+        Parameters
+        ----------
+        method: str
+        orders: list[Order]
+        get_since: callable
+            The timestamp in milliseconds from which to fetch, given the
+            symbol (None for all symbols) and its orders.
+
+        Returns
+        -------
+        list[tuple[str, list[dict[str, Object]]]]
+            The results of each request with its symbol.
+
+        """
+        symbols = defaultdict(list)
+        for order in orders:
+            symbols[self.get_symbol(order.asset)].append(order)
+
+        try:
+            if len(symbols) > 1 and not self._symbol_required.get(method):
+                try:
+                    return [(None, self.scheduler.call(
+                        method, symbol=None, since=get_since(None, orders),
+                    ))]
+
+                except ExchangeError as e:
+                    log.debug(
+                        'unable to call {} without symbol on {}, calling '
+                        'it for each symbol: {}'.format(method, self.name, e)
+                    )
+                    self._symbol_required[method] = True
+
+            return [
+                (symbol, self.scheduler.call(
+                    method,
+                    symbol=symbol,
+                    since=get_since(symbol, symbol_orders),
+                ))
+                for symbol, symbol_orders in sorted(symbols.items())
+            ]
+
+        except RequestTimeout as e:
+            log.warn('unable to call {} on {}: {}'.format(
+                method, self.name, e
+            ))
+            raise e
+
+        except (ExchangeError, NetworkError) as e:
+            log.warn('unable to call {} on {}: {}'.format(
+                method, self.name, e
+            ))
+            raise ExchangeRequestError(error=e)
+
+    @staticmethod
+    def _get_orders_since(symbol, orders):
+        start_dt = min(pd.Timestamp(order.dt) for order in orders)
+        return int(start_dt.floor('1 min').value // 1000000)
+
+    def _fetch_orders_status(self, orders):
+        """
+        The orders on the exchange, with one request for the open orders
+        and one for the closed orders.
+
+        Parameters
+        ----------
+        orders: list[Order]
+
+        Returns
+        -------
+        dict[str, dict[str, Object]]
+            The order dicts from the CCXT api by order id, without the
+            orders not found.
+
+        """
+        statuses = dict()
+        for method, feature in [('fetch_open_orders', 'fetchOpenOrders'),
+                                ('fetch_closed_orders', 'fetchClosedOrders')]:
+            missing = [order for order in orders if order.id not in statuses]
+            if not missing or not self.api.has.get(feature):
+                continue
+
+            order_ids = set(order.id for order in missing)
+            results = self._fetch_for_orders(
+                method, missing, self._get_orders_since
             )
+            for _, order_statuses in results:
+                for order_status in order_statuses:
+                    if order_status['id'] in order_ids:
+                        statuses[order_status['id']] = order_status
+
+        return statuses
+
+    def _fetch_new_trades(self, orders, cursor):
+        """
+        The trades of the orders made since the cursor, with a single
+        request when possible.
+
+        Parameters
+        ----------
+        orders: list[Order]
+        cursor: dict[str, Object]
+
+        Returns
+        -------
+        dict[str, list[dict[str, Object]]]
+            The trade dicts from the CCXT api by order id.
+
+        """
+        since = cursor['since']
+
+        def get_since(symbol, symbol_orders):
+            if symbol in since:
+                return since[symbol]
+
+            return self._get_orders_since(symbol, symbol_orders)
+
+        results = self._fetch_for_orders(
+            'fetch_my_trades', orders, get_since
+        )
+
+        order_ids = set(order.id for order in orders)
+        trades = defaultdict(list)
+        for symbol, symbol_trades in results:
+            for trade in symbol_trades:
+                if trade['order'] in order_ids:
+                    trades[trade['order']].append(trade)
+
+            # The trades of the next requests start with the last one
+            timestamps = [
+                trade['timestamp'] for trade in symbol_trades
+                if trade['timestamp'] is not None
+            ]
+            if timestamps:
+                since[symbol] = max(timestamps + [since.get(symbol, 0)])
+
+        return trades
+
+    def process_orders(self, orders, cursor=None):
+        """
+        Reconcile open orders with their executions on the exchange.
+
+        At most one request of the account trades, of the open orders and
+        of the closed orders is made for all the orders, or one per symbol
+        on the exchanges requiring one. The transactions of each trade are
+        returned as soon as it is found, the trades already processed
+        being tracked by the cursor.
+
+        Parameters
+        ----------
+        orders: list[Order]
+        cursor: dict[str, Object]
+            The timestamp of the last trade fetched by symbol and the
+            trades processed by order id.
+
+        Returns
+        -------
+        dict[str, list[Transaction]]
+            The new transactions of each order, by order id.
 
-            commission = 0
-            if 'fee' in trade and 'cost' in trade['fee']:
-                # If the exchange gives info of the fees- from ccxt
-                commission = trade['fee']['cost']
-                order.commission += commission
-
-            if 'fee' in trade and 'currency' in trade['fee']:
-                transaction = Transaction(
-                    asset=order.asset,
-                    amount=filled,
-                    dt=pd.Timestamp.utcnow(),
-                    price=trade['price'],
-                    order_id=order.id,
-                    commission=commission,
-                    fee_currency=trade['fee']['currency'].lower(),
-                    is_quote_live=(self.quote_currency ==
-                                   trade['fee']['currency'].lower())
+        """
+        if cursor is None:
+            cursor = dict()
+        cursor.setdefault('since', dict())
+        processed = cursor.setdefault('trades', dict())
+
+        # The orders are updated once all the requests succeeded
+        trades = None
+        if self.api.has['fetchMyTrades']:
+            try:
+                trades = self._fetch_new_trades(orders, cursor)
+            except RequestTimeout:
+                raise ExchangeRequestError(
+                    error="Received timeout from exchange"
                 )
-            else:
-                transaction = Transaction(
-                    asset=order.asset,
-                    amount=filled,
-                    dt=pd.Timestamp.utcnow(),
-                    price=trade['price'],
-                    order_id=order.id,
-                    commission=commission,
+            except ExchangeRequestError as e:
+                log.warn(
+                    'unable to fetch account trades, trying an alternate '
+                    'method to find executed orders on {}: {}'.format(
+                        self.name, e
+                    )
                 )
-            transactions.append(transaction)
 
-        order.filled = round(order.filled, order.asset.decimals)
-        order.broker_order_id = ', '.join([t['id'] for t in trades])
+        try:
+            statuses = self._fetch_orders_status(orders)
+        except RequestTimeout as e:
+            raise ExchangeRequestError(error=e)
+
+        transactions = dict()
+        if trades is None:
+            exc_orders = dict()
+            for order in orders:
+                if order.id in statuses:
+                    exc_orders[order.id] = \
+                        self._create_order(statuses[order.id])
+                else:
+                    exc_orders[order.id] = self.get_order(
+                        order.id, order.asset, return_price=True
+                    )
+
+            for order in orders:
+                exc_order, price = exc_orders[order.id]
+                order_transactions = self._process_order_fallback(
+                    order=order,
+                    exc_order=exc_order,
+                    price=price,
+                    processed_amount=order.filled
+                    if order.id in processed else 0,
+                )
+                if order_transactions:
+                    transactions[order.id] = order_transactions
+
+        else:
+            for order in orders:
+                order_trades = trades.get(order.id)
+                if not order_trades:
+                    continue
+
+                if order.id not in processed:
+                    # The fills found before tracking the trades of the
+                    # order are processed again
+                    order.filled = 0
+                    order.commission = 0
+
+                trade_ids = processed.setdefault(order.id, [])
+                order_trades.sort(key=lambda t: t['timestamp'])
+
+                order_transactions = []
+                for trade in order_trades:
+                    if trade['id'] in trade_ids:
+                        continue
+
+                    trade_ids.append(trade['id'])
+                    order_transactions.append(
+                        self._create_trade_transaction(order, trade)
+                    )
+
+                if order_transactions:
+                    order.filled = round(order.filled, order.asset.decimals)
+                    order.broker_order_id = ', '.join(trade_ids)
+                    transactions[order.id] = order_transactions
+
+            # Like in _create_order, the closed orders without fill are
+            # cancelled
+            for order in orders:
+                order_status = statuses.get(order.id)
+                if not order.open or order_status is None:
+                    continue
+
+                if order_status['status'] == 'canceled' or \
+                        (order_status['status'] == 'closed' and
+                         order_status['filled'] == 0):
+                    order.status = ORDER_STATUS.CANCELLED
+
+        # Only the trades of the open orders are needed
+        open_ids = set(order.id for order in orders if order.open)
+        for order_id in list(processed):
+            if order_id not in open_ids:
+                del processed[order_id]
+
         return transactions
 
     def get_order(self, order_id, asset_or_symbol=None,
@@ -1182,9 +1618,10 @@ class CCXT(Exchange):
         try:
             symbol = self.get_symbol(asset_or_symbol) \
                 if asset_or_symbol is not None else None
-            order_status = self.api.fetch_order(id=order_id,
-                                                symbol=symbol,
-                                                params=params)
+            order_status = self.scheduler.call('fetch_order',
+                                               id=order_id,
+                                               symbol=symbol,
+                                               params=params)
             order, executed_price = self._create_order(order_status)
 
             if return_price:
@@ -1214,8 +1651,8 @@ class CCXT(Exchange):
         try:
             symbol = self.get_symbol(asset_or_symbol) \
                 if asset_or_symbol is not None else None
-            self.api.cancel_order(id=order_id,
-                                  symbol=symbol, params=params)
+            self.scheduler.call('cancel_order', id=order_id,
+                                symbol=symbol, params=params)
 
         except (ExchangeError, NetworkError) as e:
             log.warn(
@@ -1244,7 +1681,9 @@ class CCXT(Exchange):
                 for asset in assets:
                     symbol = self.get_symbol(asset)
                     log.debug('fetching single ticker: {}'.format(symbol))
-                    results[symbol] = self.api.fetch_ticker(symbol=symbol)
+                    results[symbol] = self.scheduler.call(
+                        'fetch_ticker', symbol=symbol
+                    )
 
             except (ExchangeError, NetworkError,) as e:
                 log.warn(
@@ -1258,7 +1697,9 @@ class CCXT(Exchange):
             symbols = self.get_symbols(assets)
             try:
                 log.debug('fetching multiple tickers: {}'.format(symbols))
-                results = self.api.fetch_tickers(symbols=symbols)
+                results = self.scheduler.call(
+                    'fetch_tickers', symbols=symbols
+                )
 
             except (ExchangeError, NetworkError) as e:
                 log.warn(
@@ -1312,7 +1753,12 @@ class CCXT(Exchange):
     def get_orderbook(self, asset, order_type='all', limit=None):
         ccxt_symbol = self.get_symbol(asset)
 
-        order_book = self.api.fetch_order_book(ccxt_symbol, limit=limit)
+        order_book = self.feed.get_order_book(ccxt_symbol, limit) \
+            if self.feed is not None else None
+        if order_book is None:
+            order_book = self.scheduler.call(
+                'fetch_order_book', ccxt_symbol, limit=limit
+            )
 
         order_types = ['bids', 'asks'] if order_type == 'all' else [order_type]
         result = dict(last_traded=from_ms_timestamp(order_book['timestamp']))
@@ -1339,7 +1785,8 @@ class CCXT(Exchange):
         # TODO: is it possible to sort this? Limit is useless otherwise.
         ccxt_symbol = self.get_symbol(asset)
         try:
-            trades = self.api.fetch_my_trades(
+            trades = self.scheduler.call(
+                'fetch_my_trades',
                 symbol=ccxt_symbol,
                 since=start_dt,
                 limit=limit,
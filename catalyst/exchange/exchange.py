@@ -1,4 +1,5 @@
 import abc
+import time
 from abc import ABCMeta, abstractmethod, abstractproperty
 from datetime import timedelta
 from time import sleep
@@ -7,19 +8,22 @@ import numpy as np
 import pandas as pd
 from catalyst.constants import LOG_LEVEL
 from catalyst.data.data_portal import BASE_FIELDS
+from catalyst.exchange.exchange_asset_index import ExchangeAssetIndex
 from catalyst.exchange.exchange_bundle import ExchangeBundle
 from catalyst.exchange.exchange_errors import MismatchingQuoteCurrencies, \
     SymbolNotFoundOnExchange, \
     PricingDataNotLoadedError, \
     NoDataAvailableOnExchange, NoValueForField, \
     NoCandlesReceivedFromExchange, \
-    TickerNotFoundError, NotEnoughCashError
+    TickerNotFoundError, NotEnoughCashError, ExchangeRequestError
+from catalyst.exchange.exchange_tickers import TickerSnapshot
 from catalyst.exchange.utils.datetime_utils import get_delta, \
     get_periods_range, \
     get_periods, get_start_dt, get_frequency, \
     get_candles_number_from_minutes
 from catalyst.exchange.utils.exchange_utils import get_exchange_symbols, \
-    resample_history_df, has_bundle, get_candles_df
+    resample_history_df, has_bundle, get_candles_df, get_candle_arrays
+from catalyst.finance.order import ORDER_STATUS
 from logbook import Logger
 
 log = Logger('Exchange', level=LOG_LEVEL)
@@ -30,6 +34,13 @@ class Exchange:
 
     MIN_MINUTES_REQUESTED = 150
 
+    _asset_index = None
+    _ticker_snapshot = None
+
+    # The push market data feed of the exchange, a MarketFeed instance.
+    # Its data is used instead of the REST api whenever it is live.
+    feed = None
+
     def __init__(self):
         self.name = None
         self.assets = []
@@ -56,6 +67,123 @@ class Exchange:
     def has_bundle(self, data_frequency):
         return has_bundle(self.name, data_frequency)
 
+    @property
+    def asset_index(self):
+        """
+        The lookup tables of the exchange assets, rebuilt whenever the
+        assets are reloaded.
+
+        Returns
+        -------
+        ExchangeAssetIndex
+
+        """
+        if self._asset_index is None \
+                or not self._asset_index.is_current(self.assets):
+            self._asset_index = ExchangeAssetIndex(
+                self.assets, self.get_symbol
+            )
+
+        return self._asset_index
+
+    @property
+    def ticker_snapshot(self):
+        """
+        The tickers fetched in the current bar.
+
+        Returns
+        -------
+        TickerSnapshot
+
+        """
+        if self._ticker_snapshot is None:
+            self._ticker_snapshot = TickerSnapshot()
+
+        return self._ticker_snapshot
+
+    @property
+    def has_bulk_tickers(self):
+        """
+        Whether the tickers of several assets can be fetched in a
+        single request.
+
+        Returns
+        -------
+        bool
+
+        """
+        return False
+
+    def get_tickers(self, assets, on_ticker_error='raise'):
+        """
+        The current tickers of the given assets, read from the ticker
+        snapshot of the bar when available.
+
+        Parameters
+        ----------
+        assets: list[TradingPair]
+        on_ticker_error: str
+
+        Returns
+        -------
+        dict[TradingPair, dict[str, Object]]
+
+        """
+        snapshot = self.ticker_snapshot
+        now = time.time()
+
+        tickers = dict()
+        missing = []
+        for asset in assets:
+            ticker = snapshot.get(asset, now)
+            if ticker is not None:
+                tickers[asset] = ticker
+
+            elif asset not in missing:
+                missing.append(asset)
+
+        snapshot.watch(assets)
+        if missing and self.feed is not None:
+            self.feed.subscribe([self.get_symbol(asset) for asset in missing])
+
+            streamed = dict()
+            for asset in missing:
+                ticker = self.feed.get_ticker(self.get_symbol(asset))
+                if ticker is not None:
+                    streamed[asset] = ticker
+
+            tickers.update(streamed)
+            missing = [asset for asset in missing if asset not in streamed]
+
+        if not missing:
+            return tickers
+
+        # The other assets requested in the previous bars are refreshed by
+        # the same request, so that the next consumers of the bar find
+        # them in the snapshot.
+        requested = list(missing)
+        if self.has_bulk_tickers:
+            requested += [
+                asset for asset in snapshot.watched
+                if asset not in missing and snapshot.get(asset, now) is None
+            ]
+
+        fetched = self.tickers(requested, on_ticker_error='warn')
+        snapshot.update(fetched)
+
+        for asset in missing:
+            if asset in fetched:
+                tickers[asset] = fetched[asset]
+
+            elif on_ticker_error != 'warn':
+                raise ExchangeRequestError(
+                    error='ticker not found {} / {}'.format(
+                        self.name, asset.symbol
+                    )
+                )
+
+        return tickers
+
     def is_open(self, dt):
         """
         Is the exchange open
@@ -181,15 +309,13 @@ class Exchange:
         """
         if symbols is None:
             # Make a distinct list of all symbols
-            symbols = list(set([asset.symbol for asset in self.assets]))
-            symbols.sort()
+            symbols = self.asset_index.symbols
 
             if quote_currency is not None:
-                for symbol in symbols[:]:
-                    suffix = '_{}'.format(quote_currency.lower())
-
-                    if not symbol.endswith(suffix):
-                        symbols.remove(symbol)
+                suffix = '_{}'.format(quote_currency.lower())
+                symbols = [
+                    symbol for symbol in symbols if symbol.endswith(suffix)
+                ]
 
             is_exchange_symbol = False
 
@@ -243,10 +369,11 @@ class Exchange:
                 self.name, symbol
             )
         )
-        # TODO: simplify and loose the loop
-        for a in self.assets:
-            if asset is not None:
-                break
+        # Only the first market listed under the symbol is considered,
+        # the others are duplicates from another data source.
+        matches = self.asset_index.lookup_symbol(symbol, is_exchange_symbol)
+        if matches:
+            a = matches[0]
 
             if is_local is not None:
                 data_source = 'local' if is_local else 'catalyst'
@@ -260,23 +387,19 @@ class Exchange:
             else:
                 applies = True
 
-            # The symbol provided may use the Catalyst or the exchange
-            # convention
-            key = a.exchange_symbol if \
-                is_exchange_symbol else self.get_symbol(a)
-            if not asset and key.lower() == symbol.lower():
-                if applies:
-                    asset = a
+            if applies:
+                asset = a
 
-                else:
-                    raise NoDataAvailableOnExchange(
-                        symbol=key,
-                        exchange=self.name,
-                        data_frequency=data_frequency,
-                    )
+            else:
+                raise NoDataAvailableOnExchange(
+                    symbol=a.exchange_symbol if
+                    is_exchange_symbol else self.get_symbol(a),
+                    exchange=self.name,
+                    data_frequency=data_frequency,
+                )
 
         if asset is None:
-            supported_symbols = sorted([a.symbol for a in self.assets])
+            supported_symbols = self.asset_index.symbols
 
             raise SymbolNotFoundOnExchange(
                 symbol=og_symbol,
@@ -362,12 +485,12 @@ class Exchange:
         if field not in BASE_FIELDS:
             raise KeyError('Invalid column: {}'.format(field))
 
-        tickers = self.tickers(assets)
+        tickers = self.get_tickers(assets)
         if field == 'close' or field == 'price':
-            return [tickers[asset]['last'] for asset in tickers]
+            return [tickers[asset]['last'] for asset in assets]
 
         elif field == 'volume':
-            return [tickers[asset]['volume'] for asset in tickers]
+            return [tickers[asset]['volume'] for asset in assets]
 
         else:
             raise NoValueForField(field=field)
@@ -517,7 +640,7 @@ class Exchange:
             requested_bar_count = min_candles_number
 
         # The get_history method supports multiple asset
-        candles = self.get_candles(
+        candles = self.get_candle_arrays(
             freq=freq,
             assets=assets,
             bar_count=requested_bar_count,
@@ -526,7 +649,7 @@ class Exchange:
 
         # candles sanity check - verify no empty candles were received:
         for asset in candles:
-            if not candles[asset]:
+            if len(candles[asset]['close']) == 0:
                 raise NoCandlesReceivedFromExchange(
                     bar_count=requested_bar_count,
                     end_dt=end_dt,
@@ -648,7 +771,7 @@ class Exchange:
                     bar_count=trailing_bars if trailing_bars < 500 else 500,
                 )
 
-                last_value = series[asset].iloc(0) if asset in series \
+                last_value = series[asset].iloc[-1] if asset in series \
                     else np.nan
 
                 # Create a series with the common data_frequency, ffill
@@ -663,7 +786,7 @@ class Exchange:
                 )
 
                 if asset in series:
-                    series[asset].append(candle_series)
+                    series[asset] = series[asset].append(candle_series)
 
                 else:
                     series[asset] = candle_series
@@ -736,7 +859,7 @@ class Exchange:
         positions_value = 0.0
         if positions:
             assets = list(set([position.asset for position in positions]))
-            tickers = self.tickers(assets)
+            tickers = self.get_tickers(assets)
 
             for position in positions:
                 asset = position.asset
@@ -956,6 +1079,34 @@ class Exchange:
 
         """
 
+    def process_orders(self, orders, cursor=None):
+        """
+        Reconcile open orders with their executions on the exchange.
+
+        The orders are processed one at a time by default and their
+        transactions returned once they are filled.
+
+        Parameters
+        ----------
+        orders: list[Order]
+        cursor: dict[str, Object]
+            The state of the trades already processed, updated with the
+            new ones by the exchanges supporting it.
+
+        Returns
+        -------
+        dict[str, list[Transaction]]
+            The new transactions of each order, by order id.
+
+        """
+        transactions = dict()
+        for order in orders:
+            order_transactions = self.process_order(order)
+            if order_transactions and order.status == ORDER_STATUS.FILLED:
+                transactions[order.id] = order_transactions
+
+        return transactions
+
     @abstractmethod
     def cancel_order(self, order_param,
                      symbol_or_asset=None, params={}):
@@ -1011,6 +1162,39 @@ class Exchange:
         """
         pass
 
+    def get_candle_arrays(self, freq, assets, bar_count, start_dt=None,
+                          end_dt=None):
+        """
+        Retrieve OHLCV candles for the given assets in columnar arrays.
+
+        Parameters
+        ----------
+        freq: str
+        assets: list[TradingPair]
+        bar_count: int
+        start_dt: datetime, optional
+        end_dt: datetime, optional
+
+        Returns
+        -------
+        dict[TradingPair, dict[str, Object]]
+            Each TradingPair instance is mapped to a dictionary with the
+            float64 arrays of the open, high, low, close and volume fields
+            and a DatetimeIndex of the candles under last_traded, in
+            chronological order.
+
+        """
+        candles = self.get_candles(
+            freq=freq,
+            assets=assets,
+            bar_count=bar_count,
+            start_dt=start_dt,
+            end_dt=end_dt,
+        )
+        return {
+            asset: get_candle_arrays(candles[asset]) for asset in candles
+        }
+
     @abc.abstractmethod
     def tickers(self, assets, on_ticker_error='raise'):
         """
@@ -14,7 +14,10 @@ import copy
 import pickle
 import signal
 import sys
+import time
 from datetime import timedelta
+from multiprocessing import TimeoutError as PoolTimeoutError
+from multiprocessing.pool import ThreadPool
 from os import listdir
 from os.path import isfile, join, exists
 
@@ -23,13 +26,19 @@ import logbook
 import pandas as pd
 from catalyst.algorithm import TradingAlgorithm
 from catalyst.constants import LOG_LEVEL
+from catalyst.exchange.exchange_benchmark import ExchangeBenchmarkSource
 from catalyst.exchange.exchange_blotter import ExchangeBlotter
 from catalyst.exchange.exchange_errors import (
     ExchangeRequestError,
     OrderTypeNotSupported)
 from catalyst.exchange.exchange_execution import ExchangeLimitOrder
+from catalyst.exchange.exchange_journal import (
+    StateJournal,
+    JournaledPerformanceTracker,
+)
 from catalyst.exchange.live_graph_clock import LiveGraphClock
 from catalyst.exchange.simple_clock import SimpleClock
+from catalyst.exchange.streaming_clock import StreamingClock
 from catalyst.exchange.utils.exchange_utils import (
     save_algo_object,
     get_algo_object,
@@ -40,9 +49,8 @@ from catalyst.exchange.utils.exchange_utils import (
     remove_old_files,
     group_assets_by_exchange, )
 from catalyst.exchange.utils.stats_utils import \
-    get_pretty_stats, stats_to_s3, stats_to_algo_folder
+    get_pretty_stats, stats_to_s3, append_stats_to_algo_folder, StatsBuffer
 from catalyst.finance.execution import MarketOrder
-from catalyst.finance.performance import PerformanceTracker
 from catalyst.finance.performance.period import calc_period_stats
 from catalyst.finance.order import Order
 from catalyst.gens.tradesimulation import AlgorithmSimulator
@@ -79,6 +87,7 @@ class ExchangeTradingAlgorithmBase(TradingAlgorithm):
             get_transactions_attempts=5,
             order_attempts=5,
             synchronize_portfolio_attempts=5,
+            synchronize_portfolio_timeout=30,
             get_order_attempts=5,
             get_open_orders_attempts=5,
             cancel_order_attempts=5,
@@ -388,6 +397,21 @@ class ExchangeTradingAlgorithmBacktest(ExchangeTradingAlgorithmBase):
 
         self.current_day = data.current_dt.floor('1D')
 
+    def _create_benchmark_source(self):
+        if self.benchmark_sid is None:
+            return super(ExchangeTradingAlgorithmBacktest, self) \
+                ._create_benchmark_source()
+
+        return ExchangeBenchmarkSource(
+            benchmark_asset=self.asset_finder.retrieve_asset(
+                self.benchmark_sid
+            ),
+            trading_calendar=self.trading_calendar,
+            sessions=self.sim_params.sessions,
+            data_portal=self.data_portal,
+            emission_rate=self.sim_params.emission_rate,
+        )
+
     def _create_stats_df(self):
         stats = pd.DataFrame(self.frame_stats)
         stats.set_index('period_close', inplace=True, drop=False)
@@ -422,6 +446,16 @@ class ExchangeTradingAlgorithmLive(ExchangeTradingAlgorithmBase):
 
         self._clock = None
         self.frame_stats = list()
+        self.stats_buffer = StatsBuffer()
+
+        self.journal = None
+        self._journal_day = None
+        self._state_bytes = None
+        self._cursors_bytes = None
+
+        # The portfolio synchronizations still running after a timeout,
+        # by exchange name.
+        self._pending_syncs = dict()
 
         # erase the frame_stats folder to avoid overloading the disk
         error = clear_frame_stats_directory(self.algo_namespace)
@@ -462,6 +496,13 @@ class ExchangeTradingAlgorithmLive(ExchangeTradingAlgorithmBase):
             log.warn("Can't initialize signal handler inside another thread."
                      "Exit should be handled by the user.")
 
+    def on_dt_changed(self, dt):
+        super(ExchangeTradingAlgorithmLive, self).on_dt_changed(dt)
+
+        # The tickers of the previous bar are not served anymore
+        for exchange_name in self.exchanges:
+            self.exchanges[exchange_name].ticker_snapshot.advance(dt)
+
     def get_frame_stats(self):
         """
         preparing the stats before analyze
@@ -509,6 +550,9 @@ class ExchangeTradingAlgorithmLive(ExchangeTradingAlgorithmBase):
         """
         self.is_running = False
 
+        if self.journal is not None:
+            self.journal.close()
+
         if self._analyze is None:
             log.info('Exiting the algorithm.')
 
@@ -563,7 +607,19 @@ class ExchangeTradingAlgorithmLive(ExchangeTradingAlgorithmBase):
         # TODO: should we apply time skew? not sure to understand the utility.
 
         log.debug('creating clock')
-        if self.live_graph or self._analyze_live is not None:
+        feeds = [
+            self.exchanges[exchange_name].feed
+            for exchange_name in self.exchanges
+            if self.exchanges[exchange_name].feed is not None
+        ]
+        if feeds:
+            self._clock = StreamingClock(
+                self.sim_params.sessions,
+                feeds=feeds,
+                start=self.start if self.is_start else None,
+                end=self.end if self.is_end else None
+            )
+        elif self.live_graph or self._analyze_live is not None:
             self._clock = LiveGraphClock(
                 self.sim_params.sessions,
                 context=self,
@@ -586,11 +642,42 @@ class ExchangeTradingAlgorithmLive(ExchangeTradingAlgorithmBase):
         is that we are restoring performance tracker objects if available.
         This allows us to stop/start algos without loosing their state.
 
+        The state is recovered from the last snapshot of the journal and
+        the records journaled after it. The pickle files of the previous
+        versions are used when the journal is empty.
+
         """
-        self.state = get_algo_object(
-            algo_name=self.algo_namespace,
-            key='context.state_{}'.format(self.mode_name),
-        )
+        self.journal = StateJournal(join(
+            get_algo_folder(self.algo_namespace),
+            'journal_{}'.format(self.mode_name),
+        ))
+        snapshot, records = self.journal.recover()
+
+        if snapshot is not None:
+            self._journal_day = snapshot['day']
+            self.state = snapshot['state']
+            self._recorded_vars.update(snapshot['recorded_vars'])
+
+            # Not journaled by the previous versions
+            if snapshot.get('trade_cursors') is not None:
+                self.blotter.trade_cursors = snapshot['trade_cursors']
+
+        else:
+            self.state = get_algo_object(
+                algo_name=self.algo_namespace,
+                key='context.state_{}'.format(self.mode_name),
+            )
+
+        for record in records:
+            if record['state'] is not None:
+                self.state = pickle.loads(record['state'])
+
+            if record.get('trade_cursors') is not None:
+                self.blotter.trade_cursors = \
+                    pickle.loads(record['trade_cursors'])
+
+            self._recorded_vars.update(record['recorded_vars'])
+
         if self.state is None:
             self.state = {}
 
@@ -598,7 +685,7 @@ class ExchangeTradingAlgorithmLive(ExchangeTradingAlgorithmBase):
             # Note from the Zipline dev:
             # HACK: When running with the `run` method, we set perf_tracker to
             # None so that it will be overwritten here.
-            tracker = self.perf_tracker = PerformanceTracker(
+            tracker = self.perf_tracker = JournaledPerformanceTracker(
                 sim_params=self.sim_params,
                 trading_calendar=self.trading_calendar,
                 env=self.trading_environment,
@@ -609,22 +696,30 @@ class ExchangeTradingAlgorithmLive(ExchangeTradingAlgorithmBase):
             new_position_tracker = tracker.position_tracker
             tracker.position_tracker = None
 
+            new_todays_perf = tracker.todays_performance
+
             # Unpacking the perf_tracker and positions if available
-            cum_perf = get_algo_object(
-                algo_name=self.algo_namespace,
-                key='cumulative_performance_{}'.format(self.mode_name),
-            )
+            today = pd.Timestamp.utcnow().floor('1D')
+            if snapshot is not None:
+                cum_perf = snapshot['cumulative_performance']
+                todays_perf = snapshot['todays_performance']
+
+            else:
+                cum_perf = get_algo_object(
+                    algo_name=self.algo_namespace,
+                    key='cumulative_performance_{}'.format(self.mode_name),
+                )
+                todays_perf = get_algo_object(
+                    algo_name=self.algo_namespace,
+                    key=today.strftime('%Y-%m-%d'),
+                    rel_path='daily_performance_{}'.format(self.mode_name),
+                )
+
             if cum_perf is not None:
                 tracker.cumulative_performance = cum_perf
                 # Ensure single common position tracker
                 tracker.position_tracker = cum_perf.position_tracker
 
-            today = pd.Timestamp.utcnow().floor('1D')
-            todays_perf = get_algo_object(
-                algo_name=self.algo_namespace,
-                key=today.strftime('%Y-%m-%d'),
-                rel_path='daily_performance_{}'.format(self.mode_name),
-            )
             if todays_perf is not None:
                 # Ensure single common position tracker
                 if tracker.position_tracker is not None:
@@ -638,6 +733,15 @@ class ExchangeTradingAlgorithmLive(ExchangeTradingAlgorithmBase):
                 # Use a new position_tracker if not is found in the state
                 tracker.position_tracker = new_position_tracker
 
+            for record in records:
+                tracker.replay(record['events'])
+
+            if snapshot is not None and self._journal_day != today:
+                # The journal covers a single day, the performance of
+                # today starts from scratch
+                new_todays_perf.position_tracker = tracker.position_tracker
+                tracker.todays_performance = new_todays_perf
+
         if not self.initialized:
             # Calls the initialize function of the algorithm
             self.initialize(*self.initialize_args, **self.initialize_kwargs)
@@ -665,7 +769,7 @@ class ExchangeTradingAlgorithmLive(ExchangeTradingAlgorithmBase):
     def updated_account(self):
         return self.perf_tracker.get_account(False)
 
-    def synchronize_portfolio(self):
+    def synchronize_portfolio(self, synced=None):
         """
         Synchronizes the portfolio tracked by the algorithm to refresh
         its current value.
@@ -674,6 +778,18 @@ class ExchangeTradingAlgorithmLive(ExchangeTradingAlgorithmBase):
         positions, returning the available cash, and raising error
         if the data goes out of sync.
 
+        The exchanges are synchronized concurrently, each one within the
+        synchronize_portfolio_timeout. The exchanges which failed are
+        synchronized again by the next attempt, which waits for the
+        synchronizations still running instead of starting new ones.
+
+        Parameters
+        ----------
+        synced: dict[str, tuple[float, float]], optional
+            The cash and positions value of the exchanges already
+            synchronized by the previous attempts, updated with the
+            exchanges synchronized by this one.
+
         Returns
         -------
         float
@@ -683,52 +799,126 @@ class ExchangeTradingAlgorithmLive(ExchangeTradingAlgorithmBase):
             The total value of all tracked positions.
 
         """
+        if synced is None:
+            synced = dict()
+
         check_balances = (not self.simulate_orders)
-        quote_currency = None
-        tracker = self.perf_tracker.position_tracker
-        total_cash = 0.0
-        total_positions_value = 0.0
+
+        orders = []
+        for asset in self.blotter.open_orders:
+            asset_orders = self.blotter.open_orders[asset]
+            if asset_orders:
+                orders += asset_orders
+
+        required_cash = self.portfolio.cash if not orders else None
 
         # Position keys correspond to assets
         positions = self.portfolio.positions
         assets = list(positions)
         exchange_assets = group_assets_by_exchange(assets)
-        for exchange_name in self.exchanges:
-            assets = exchange_assets[exchange_name] \
-                if exchange_name in exchange_assets else []
 
-            exchange_positions = copy.deepcopy(
-                [positions[asset] for asset in assets if asset in positions]
-            )
+        exchange_names = [
+            exchange_name for exchange_name in self.exchanges
+            if exchange_name not in synced
+        ]
 
-            exchange = self.exchanges[exchange_name]  # Type: Exchange
+        # The exchanges are waited for the same time, the slowest
+        # exchange setting the duration of the synchronization
+        deadline = time.time() + \
+            self.attempts['synchronize_portfolio_timeout']
+
+        pool = ThreadPool(max(len(exchange_names), 1))
+        try:
+            results = dict()
+            failed = dict()
+            for exchange_name in exchange_names:
+                pending = self._pending_syncs.pop(exchange_name, None)
+                if pending is not None:
+                    owner, exchange_positions, result = pending
+                    if owner is synced:
+                        # Started by a previous attempt of this call
+                        results[exchange_name] = exchange_positions, result
+                        continue
+
+                    if not result.ready():
+                        # Started for the positions of a previous bar,
+                        # the exchange is not requested concurrently
+                        self._pending_syncs[exchange_name] = pending
+                        failed[exchange_name] = ExchangeRequestError(
+                            error='the previous sync of the {} portfolio '
+                                  'is still running'.format(exchange_name)
+                        )
+                        continue
+
+                assets = exchange_assets[exchange_name] \
+                    if exchange_name in exchange_assets else []
+
+                exchange_positions = copy.deepcopy(
+                    [positions[asset] for asset in assets
+                     if asset in positions]
+                )
 
-            if quote_currency is None:
-                quote_currency = exchange.quote_currency
+                exchange = self.exchanges[exchange_name]  # Type: Exchange
+                results[exchange_name] = exchange_positions, pool.apply_async(
+                    exchange.sync_positions,
+                    kwds=dict(
+                        positions=exchange_positions,
+                        check_balances=check_balances,
+                        cash=required_cash,
+                    ),
+                )
 
-            orders = []
-            for asset in self.blotter.open_orders:
-                asset_orders = self.blotter.open_orders[asset]
-                if asset_orders:
-                    orders += asset_orders
+            for exchange_name in results:
+                exchange_positions, result = results[exchange_name]
+                try:
+                    cash, positions_value = result.get(
+                        timeout=max(deadline - time.time(), 0)
+                    )
+                except PoolTimeoutError:
+                    # Waited for by the next attempt
+                    self._pending_syncs[exchange_name] = \
+                        synced, exchange_positions, result
+                    failed[exchange_name] = ExchangeRequestError(
+                        error='timeout syncing the {} portfolio'.format(
+                            exchange_name
+                        )
+                    )
+                    continue
 
-            required_cash = self.portfolio.cash if not orders else None
-            cash, positions_value = exchange.sync_positions(
-                positions=exchange_positions,
-                check_balances=check_balances,
-                cash=required_cash,
-            )
-            total_cash += cash
-            total_positions_value += positions_value
+                except ExchangeRequestError as e:
+                    failed[exchange_name] = e
+                    continue
 
-            # Applying modifications to the original positions
-            for position in exchange_positions:
-                tracker.update_position(
-                    asset=position.asset,
-                    amount=position.amount,
-                    last_sale_date=position.last_sale_date,
-                    last_sale_price=position.last_sale_price,
+                synced[exchange_name] = cash, positions_value
+
+                # Applying modifications to the original positions
+                for position in exchange_positions:
+                    self.perf_tracker.update_position(
+                        asset=position.asset,
+                        amount=position.amount,
+                        last_sale_date=position.last_sale_date,
+                        last_sale_price=position.last_sale_price,
+                    )
+
+        finally:
+            # The workers exit once the pending synchronizations are done
+            pool.close()
+
+        if failed:
+            for exchange_name, e in failed.items():
+                log.warn(
+                    'unable to sync the {} portfolio: {}'.format(
+                        exchange_name, e
+                    )
                 )
+            raise list(failed.values())[0]
+
+        total_cash = 0.0
+        total_positions_value = 0.0
+        for exchange_name in self.exchanges:
+            cash, positions_value = synced[exchange_name]
+            total_cash += cash
+            total_positions_value += positions_value
 
         if not check_balances:
             total_cash = self.portfolio.cash
@@ -852,6 +1042,7 @@ class ExchangeTradingAlgorithmLive(ExchangeTradingAlgorithmBase):
             log.warning(error)
 
         self.frame_stats = list()
+        self.stats_buffer = StatsBuffer()
 
     def handle_data(self, data):
         """
@@ -893,7 +1084,8 @@ class ExchangeTradingAlgorithmLive(ExchangeTradingAlgorithmBase):
                 attempts=self.attempts['synchronize_portfolio_attempts'],
                 sleeptime=self.attempts['retry_sleeptime'],
                 retry_exceptions=(ExchangeRequestError,),
-                cleanup=lambda: log.warn('Syncing portfolio again.')
+                cleanup=lambda: log.warn('Syncing portfolio again.'),
+                args=(dict(),)
             )
             self.portfolio_needs_update = False
 
@@ -920,28 +1112,44 @@ class ExchangeTradingAlgorithmLive(ExchangeTradingAlgorithmBase):
         except Exception as e:
             log.warn('unable to calculate performance: {}'.format(e))
 
-        log.debug('saving cumulative performance object')
-        save_algo_object(
-            algo_name=self.algo_namespace,
-            key='cumulative_performance_{}'.format(self.mode_name),
-            obj=self.perf_tracker.cumulative_performance,
+        events = self.perf_tracker.pop_journal_events()
+        state_bytes = pickle.dumps(
+            self.state, protocol=pickle.HIGHEST_PROTOCOL
         )
-        log.debug('saving todays performance object')
-        save_algo_object(
-            algo_name=self.algo_namespace,
-            key=today.strftime('%Y-%m-%d'),
-            obj=self.perf_tracker.todays_performance,
-            rel_path='daily_performance_{}'.format(self.mode_name)
+        cursors_bytes = pickle.dumps(
+            self.blotter.trade_cursors, protocol=pickle.HIGHEST_PROTOCOL
         )
-        log.debug('saving context.state object')
-        save_algo_object(
-            algo_name=self.algo_namespace,
-            key='context.state_{}'.format(self.mode_name),
-            obj=self.state)
 
-    def _process_stats(self, data):
-        today = data.current_dt.floor('1D')
+        # The journal covers a single day, a new day starts with a snapshot
+        if today != self._journal_day or self.journal.needs_snapshot:
+            log.debug('saving the algo state snapshot')
+            self.journal.save_snapshot(dict(
+                day=today,
+                cumulative_performance=self.perf_tracker
+                .cumulative_performance,
+                todays_performance=self.perf_tracker.todays_performance,
+                state=self.state,
+                recorded_vars=self.recorded_vars,
+                trade_cursors=self.blotter.trade_cursors,
+            ))
+            self._journal_day = today
+
+        else:
+            log.debug('journaling {} events'.format(len(events)))
+            self.journal.append(dict(
+                dt=data.current_dt,
+                events=events,
+                state=state_bytes
+                if state_bytes != self._state_bytes else None,
+                recorded_vars=self.recorded_vars,
+                trade_cursors=cursors_bytes
+                if cursors_bytes != self._cursors_bytes else None,
+            ))
+
+        self._state_bytes = state_bytes
+        self._cursors_bytes = cursors_bytes
 
+    def _process_stats(self, data):
         # Since the clock runs 24/7, I trying to disable the daily
         # Performance tracker and keep only minute and cumulative
         self.perf_tracker.update_performance()
@@ -965,36 +1173,35 @@ class ExchangeTradingAlgorithmLive(ExchangeTradingAlgorithmBase):
 
         self.add_exposure_stats(frame_stats)
 
+        # Only the new period is formatted, the output of the previous
+        # ones is kept in the buffer.
+        self.stats_buffer.append(frame_stats, recorded_cols)
+
         log.info(
             'statistics for the last {stats_minutes} minutes:\n'
             '{stats}'.format(
                 stats_minutes=self.stats_minutes,
                 stats=get_pretty_stats(
-                    stats=self.frame_stats,
-                    recorded_cols=recorded_cols,
+                    stats=self.stats_buffer,
                     num_rows=self.stats_minutes,
                 )
             ))
 
-        # Since live mode does not use daily frequency,
-        # there is no need to save the output of this method.
-        self.prepare_period_stats(
-            start_dt=today,
-            end_dt=data.current_dt
-        )
-
         return recorded_cols
 
     def _save_stats_csv(self, recorded_cols):
         # Writing the stats output
         csv_bytes = None
         try:
-            csv_bytes = stats_to_algo_folder(
-                stats=self.frame_stats,
+            filename = append_stats_to_algo_folder(
+                stats=self.stats_buffer,
                 algo_namespace=self.algo_namespace,
                 folder_name='stats_{}'.format(self.mode_name),
-                recorded_cols=recorded_cols,
             )
+            if self.stats_output is not None:
+                with open(filename, 'rb') as handle:
+                    csv_bytes = handle.read()
+
         except Exception as e:
             log.warn('unable save stats locally: {}'.format(e))
 
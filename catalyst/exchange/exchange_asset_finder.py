@@ -17,17 +17,35 @@ class ExchangeAssetFinder(object):
         I don't think that we need this for live-trading.
         Leaving the list empty.
         """
-        all_sids = []
+        all_sids = set()
         for exchange_name in self.exchanges:
             # This is what initializes each exchanges at the beginning
             # of an algo
             exchange = self.exchanges[exchange_name]
             exchange.init()
 
-            all_sids += [asset.sid for asset in exchange.assets]
+            all_sids |= exchange.asset_index.sids
 
-        sids = list(set(all_sids))
-        return sids
+        return list(all_sids)
+
+    @property
+    def lookup_stats(self):
+        """
+        The number of sid and symbol lookups which found an asset, or not,
+        in the asset index of each exchange.
+
+        Returns
+        -------
+        dict[str, int]
+
+        """
+        stats = dict(hits=0, misses=0)
+        for exchange_name in self.exchanges:
+            index = self.exchanges[exchange_name].asset_index
+            stats['hits'] += index.hits
+            stats['misses'] += index.misses
+
+        return stats
 
     def retrieve_asset(self, sid, default_none=False):
         """
@@ -35,14 +53,11 @@ class ExchangeAssetFinder(object):
         """
         asset = None
         for exchange_name in self.exchanges:
+            exchange = self.exchanges[exchange_name]
+            asset = exchange.asset_index.lookup_sid(sid)
             if asset is not None:
                 break
 
-            exchange = self.exchanges[exchange_name]
-            assets = [a for a in exchange.assets if a.sid == sid]
-            if assets:
-                asset = assets[0]
-
         return asset
 
     def retrieve_all(self, sids, default_none=False):
@@ -68,11 +83,12 @@ class ExchangeAssetFinder(object):
         SidsNotFound
             When a requested sid is not found and default_none=False.
         """
+        sids = list(sids)
+
         assets = []
         for exchange_name in self.exchanges:
             exchange = self.exchanges[exchange_name]
-            xas = [asset for asset in exchange.assets if asset.sid in sids]
-            assets += xas
+            assets += exchange.asset_index.lookup_sids(sids)
 
         return assets
 
@@ -0,0 +1,227 @@
+import os
+import pickle
+from collections import defaultdict
+
+import numpy as np
+
+from catalyst.constants import LOG_LEVEL
+from logbook import Logger
+
+log = Logger('exchange_asset_index', level=LOG_LEVEL)
+
+# The assets built from the markets and symbols files of an exchange
+ASSET_CATALOG_FILENAME = 'cctx_assets.p'
+
+_replace = getattr(os, 'replace', os.rename)
+
+
+def get_catalog_key(filenames, *args):
+    """
+    Identifies the content of the files an asset catalog is built from.
+
+    Parameters
+    ----------
+    filenames: list[str]
+    args:
+        Other values the catalog depends on.
+
+    Returns
+    -------
+    tuple
+
+    """
+    key = []
+    for filename in filenames:
+        try:
+            stat = os.stat(filename)
+            key.append((filename, stat.st_mtime, stat.st_size))
+
+        except OSError:
+            key.append((filename, None, None))
+
+    return tuple(key) + args
+
+
+def read_asset_catalog(filename, key):
+    """
+    The assets of a catalog file.
+
+    Parameters
+    ----------
+    filename: str
+    key: tuple
+        The key of the files the catalog should be built from.
+
+    Returns
+    -------
+    list[TradingPair]
+        None if the file is missing or was built from other files.
+
+    """
+    if not os.path.isfile(filename):
+        return None
+
+    try:
+        with open(filename, 'rb') as handle:
+            catalog = pickle.load(handle)
+
+    except Exception as e:
+        log.warn('unable to read the asset catalog {}: {}'.format(
+            filename, e
+        ))
+        return None
+
+    if catalog.get('key') != key:
+        return None
+
+    return catalog['assets']
+
+
+def write_asset_catalog(filename, key, assets):
+    """
+    Save the assets built from the files of a key.
+
+    Parameters
+    ----------
+    filename: str
+    key: tuple
+    assets: list[TradingPair]
+
+    """
+    tmp_filename = filename + '.tmp'
+    with open(tmp_filename, 'wb') as handle:
+        pickle.dump(
+            dict(key=key, assets=assets),
+            handle,
+            protocol=pickle.HIGHEST_PROTOCOL
+        )
+    _replace(tmp_filename, filename)
+
+
+class ExchangeAssetIndex(object):
+    """
+    Lookup tables for the assets of an exchange.
+
+    Parameters
+    ----------
+    assets: list[TradingPair]
+        The assets of the exchange, in the order in which they were loaded.
+    get_symbol: callable
+        Maps an asset to the symbol used to look it up by Catalyst symbol.
+
+    Notes
+    -----
+    The same market may be listed more than once, for instance as a
+    Catalyst asset and as a local asset following a CSV ingestion. Lookups
+    return the matching assets in their loading order.
+
+    """
+
+    def __init__(self, assets, get_symbol):
+        self.assets = assets
+        self._size = len(assets)
+
+        self._sids = np.array([asset.sid for asset in assets], dtype=np.int64)
+        self._assets = np.empty(len(assets), dtype=object)
+        self._assets[:] = assets
+
+        self._by_sid = dict()
+        self._by_symbol = defaultdict(list)
+        self._by_exchange_symbol = defaultdict(list)
+        for asset in assets:
+            self._by_sid.setdefault(asset.sid, asset)
+            self._by_symbol[get_symbol(asset).lower()].append(asset)
+            self._by_exchange_symbol[asset.exchange_symbol.lower()].append(
+                asset
+            )
+
+        self.sids = set(self._by_sid)
+        self.symbols = sorted(set(asset.symbol for asset in assets))
+
+        self.hits = 0
+        self.misses = 0
+
+    def is_current(self, assets):
+        """
+        Whether the index was built from the specified asset list.
+
+        Parameters
+        ----------
+        assets: list[TradingPair]
+
+        Returns
+        -------
+        bool
+
+        """
+        return assets is self.assets and len(assets) == self._size
+
+    def _count(self, found):
+        if found:
+            self.hits += 1
+        else:
+            self.misses += 1
+
+    def lookup_sid(self, sid):
+        """
+        The first asset with the specified sid.
+
+        Parameters
+        ----------
+        sid: int
+
+        Returns
+        -------
+        TradingPair
+            The asset or None if not found.
+
+        """
+        asset = self._by_sid.get(sid)
+        self._count(asset is not None)
+        return asset
+
+    def lookup_sids(self, sids):
+        """
+        All the assets matching any of the specified sids.
+
+        Parameters
+        ----------
+        sids: iterable[int]
+
+        Returns
+        -------
+        list[TradingPair]
+
+        """
+        sids = np.array(
+            [getattr(sid, 'sid', sid) for sid in sids], dtype=np.int64
+        )
+        mask = np.in1d(self._sids, sids)
+
+        found = np.count_nonzero(np.in1d(sids, self._sids))
+        self.hits += found
+        self.misses += len(sids) - found
+
+        return list(self._assets[mask])
+
+    def lookup_symbol(self, symbol, is_exchange_symbol=False):
+        """
+        The assets matching the specified symbol, case insensitive.
+
+        Parameters
+        ----------
+        symbol: str
+        is_exchange_symbol: bool
+            Whether the symbol uses the Catalyst or exchange convention.
+
+        Returns
+        -------
+        list[TradingPair]
+
+        """
+        index = self._by_exchange_symbol \
+            if is_exchange_symbol else self._by_symbol
+
+        assets = index.get(symbol.lower(), [])
+        self._count(len(assets) > 0)
+        return assets
@@ -1,11 +1,117 @@
+import json
+import mmap
+import os
+import shutil
+from glob import glob
+
+import bcolz
 import numpy as np
+import pandas as pd
 
 from catalyst import get_calendar
 from catalyst.data.minute_bars import BcolzMinuteBarReader, \
-    BcolzMinuteBarWriter
+    BcolzMinuteBarWriter, _sid_subdir_path
+from catalyst.exchange.exchange_rollups import write_rollups, \
+    truncate_rollups
+from catalyst.utils.paths import ensure_directory
+
+# The uncompressed copy of a range of the bundle, next to the bcolz tables
+HOT_TIER_FOLDER = 'hot'
+HOT_TIER_METADATA = 'metadata.json'
+
+
+def get_hot_tier_path(rootdir, sid, field):
+    """
+    The file of the uncompressed values of a field for a sid.
+
+    Parameters
+    ----------
+    rootdir: str
+    sid: int
+    field: str
+
+    Returns
+    -------
+    str
+
+    """
+    sid_subdir = os.path.splitext(_sid_subdir_path(int(sid)))[0]
+    return os.path.join(
+        rootdir, HOT_TIER_FOLDER, sid_subdir, '{}.dat'.format(field)
+    )
+
+
+def read_hot_tier_range(rootdir):
+    """
+    The positions of the bundle copied in the hot tier.
+
+    Parameters
+    ----------
+    rootdir: str
+
+    Returns
+    -------
+    tuple[int, int]
+        The first position and the position after the last one, None if
+        the bundle has no hot tier.
+
+    """
+    filename = os.path.join(rootdir, HOT_TIER_FOLDER, HOT_TIER_METADATA)
+    if not os.path.isfile(filename):
+        return None
+
+    with open(filename) as handle:
+        metadata = json.load(handle)
+
+    return metadata['start_idx'], metadata['end_idx']
+
+
+class HotTierArray(object):
+    """
+    A bcolz carray whose values in the range of the hot tier are sliced
+    from a memory map of the uncompressed values instead of being
+    decompressed.
+
+    Parameters
+    ----------
+    carray: bcolz.carray
+    hot: np.memmap
+        The values of the carray from position `start`.
+    start: int
+
+    """
+
+    def __init__(self, carray, hot, start):
+        self.carray = carray
+        self.hot = hot
+        self.start = start
+        self.end = start + len(hot)
+
+    def __len__(self):
+        return len(self.carray)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self.carray))
+            if step == 1 and self.start <= start and stop <= self.end:
+                return self.hot[start - self.start:stop - self.start]
+
+        elif self.start <= key < self.end:
+            return self.hot[key - self.start]
+
+        return self.carray[key]
 
 
 class BcolzExchangeBarWriter(BcolzMinuteBarWriter):
+    """
+    Writer of the exchange bundles.
+
+    The writer keeps the hot tier of the bundle, an uncompressed copy of
+    the values of a range of sessions read through memory maps, and the
+    hourly and daily rollups of the minute bundles in sync with the bcolz
+    tables.
+    """
+
     def __init__(self, *args, **kwargs):
         self._data_frequency = kwargs.pop('data_frequency', None)
         kwargs.pop('minutes_per_day', None)
@@ -27,6 +133,141 @@ class BcolzExchangeBarWriter(BcolzMinuteBarWriter):
                                     end_session=end_session
                                     ))
 
+    def last_dt_in_output_for_sid(self, sid):
+        """
+        The last bar written for a sid. Unlike the midnight returned by
+        `last_date_in_output_for_sid`, the bar may be in a session which is
+        not completely written.
+
+        Parameters
+        ----------
+        sid: int
+
+        Returns
+        -------
+        pd.Timestamp
+
+        """
+        sizes_path = '{0}/close/meta/sizes'.format(self.sidpath(sid))
+        if not os.path.exists(sizes_path):
+            return pd.NaT
+
+        with open(sizes_path) as handle:
+            size = json.load(handle)['shape'][0]
+
+        if size == 0:
+            return pd.NaT
+
+        return self._minute_index[size - 1]
+
+    def build_hot_tier(self, start_session, end_session):
+        """
+        Copy the values of a range of sessions of all the sids to the hot
+        tier, replacing the range previously copied.
+
+        Parameters
+        ----------
+        start_session: pd.Timestamp
+        end_session: pd.Timestamp
+
+        """
+        start_idx = self.data_len_for_day(start_session.floor('1d')) - \
+            self._minutes_per_day
+        end_idx = self.data_len_for_day(end_session.floor('1d'))
+
+        folder = os.path.join(self._rootdir, HOT_TIER_FOLDER)
+        if os.path.exists(folder):
+            shutil.rmtree(folder)
+        ensure_directory(folder)
+
+        with open(os.path.join(folder, HOT_TIER_METADATA), 'w') as handle:
+            json.dump(dict(start_idx=start_idx, end_idx=end_idx), handle)
+
+        self._copy_to_hot_tier(self._bundle_sids(), start_idx)
+
+    def _bundle_sids(self):
+        sid_paths = glob(os.path.join(self._rootdir, '*', '*', '*.bcolz'))
+        return [
+            int(os.path.splitext(os.path.basename(path))[0])
+            for path in sid_paths
+        ]
+
+    def _copy_to_hot_tier(self, sids, from_idx):
+        """
+        Copy the values written from a position to the hot tier.
+
+        Parameters
+        ----------
+        sids: list[int]
+        from_idx: int
+
+        """
+        hot_tier_range = read_hot_tier_range(self._rootdir)
+        if hot_tier_range is None:
+            return
+
+        start_idx, end_idx = hot_tier_range
+        from_idx = max(from_idx, start_idx)
+
+        for sid in sids:
+            table = bcolz.ctable(rootdir=self.sidpath(sid), mode='r')
+            to_idx = min(len(table), end_idx)
+            if to_idx <= from_idx:
+                continue
+
+            for field in self.COL_NAMES:
+                filename = get_hot_tier_path(self._rootdir, sid, field)
+                ensure_directory(os.path.dirname(filename))
+
+                values = table[field][from_idx:to_idx].astype(np.uint64)
+                mode = 'r+b' if os.path.isfile(filename) else 'wb'
+                with open(filename, mode) as handle:
+                    # The files are extended by the writes, the readers
+                    # see the values through their shared mappings.
+                    handle.seek((from_idx - start_idx) * values.itemsize)
+                    handle.write(values.tobytes())
+
+    def _write_cols(self, sid, dts, cols, invalid_data_behavior):
+        sidpath = self.sidpath(sid)
+        from_idx = len(bcolz.ctable(rootdir=sidpath, mode='r')) \
+            if os.path.exists(sidpath) else 0
+
+        super(BcolzExchangeBarWriter, self)._write_cols(
+            sid, dts, cols, invalid_data_behavior
+        )
+        self._copy_to_hot_tier([sid], from_idx)
+
+        if self._data_frequency == 'minute':
+            write_rollups(
+                self._rootdir,
+                sid,
+                bcolz.ctable(rootdir=sidpath, mode='r'),
+                from_idx
+            )
+
+    def truncate(self, date):
+        super(BcolzExchangeBarWriter, self).truncate(date)
+
+        if self._data_frequency == 'minute':
+            truncate_rollups(self._rootdir, self.data_len_for_day(date))
+
+        hot_tier_range = read_hot_tier_range(self._rootdir)
+        if hot_tier_range is None:
+            return
+
+        # The values after the date are zeroed rather than truncated, the
+        # files may be mapped by readers.
+        itemsize = np.dtype(np.uint64).itemsize
+        size = max(self.data_len_for_day(date) - hot_tier_range[0], 0) * \
+            itemsize
+        for path in glob(os.path.join(
+                self._rootdir, HOT_TIER_FOLDER, '*', '*', '*', '*.dat')):
+            extra = os.path.getsize(path) - size
+            if extra > 0:
+                with open(path, 'r+b') as handle:
+                    handle.seek(size)
+                    handle.write(b'\0' * extra)
+
 
 class BcolzExchangeBarReader(BcolzMinuteBarReader):
     def __init__(self, *args, **kwargs):
@@ -34,10 +275,106 @@ class BcolzExchangeBarReader(BcolzMinuteBarReader):
 
         super(BcolzExchangeBarReader, self).__init__(*args, **kwargs)
 
+        self._hot_tier_range = read_hot_tier_range(self._rootdir)
+
+        # The values loaded in shared memory by (field, sid), unlike the
+        # carrays they are never evicted.
+        self._shared_arrays = dict()
+        self._shared_buffers = []
+
     @property
     def data_frequency(self):
         return self._data_frequency
 
+    def _open_minute_file(self, field, sid):
+        sid = int(sid)
+
+        shared = self._shared_arrays.get((field, sid))
+        if shared is not None:
+            return shared
+
+        try:
+            return self._carrays[field][sid]
+        except KeyError:
+            pass
+
+        carray = super(BcolzExchangeBarReader, self)._open_minute_file(
+            field, sid
+        )
+        if self._hot_tier_range is None:
+            return carray
+
+        filename = get_hot_tier_path(self._rootdir, sid, field)
+        if not os.path.isfile(filename) or os.path.getsize(filename) == 0:
+            return carray
+
+        hot = np.memmap(filename, dtype=np.uint64, mode='r')
+        carray = self._carrays[field][sid] = HotTierArray(
+            carray, hot, self._hot_tier_range[0]
+        )
+        return carray
+
+    def load_shared_block(self, sids, start_dt, end_dt):
+        """
+        Copy the values of the sids between two dates to an anonymous
+        shared memory map.
+
+        The values are then sliced from the memory map instead of being
+        decompressed, including by the processes forked afterwards which
+        read the same memory pages.
+
+        Parameters
+        ----------
+        sids: list[int]
+        start_dt: pd.Timestamp
+        end_dt: pd.Timestamp
+
+        Returns
+        -------
+        int
+            The number of bytes loaded.
+
+        """
+        sids = [int(sid) for sid in sids]
+        start_idx = max(self._find_position_of_minute(start_dt), 0)
+        end_idx = self._find_position_of_minute(end_dt) + 1
+
+        carrays = [
+            [self._open_minute_file(field, sid) for sid in sids]
+            for field in self.FIELDS
+        ]
+        lengths = [
+            max(min(len(carray), end_idx) - start_idx, 0)
+            for carray in carrays[0]
+        ]
+
+        itemsize = np.dtype(np.uint64).itemsize
+        size = len(self.FIELDS) * sum(lengths) * itemsize
+        if size == 0:
+            return 0
+
+        buffer = mmap.mmap(-1, size)
+        block = np.frombuffer(buffer, dtype=np.uint64)
+
+        offset = 0
+        arrays = []
+        for field, field_carrays in zip(self.FIELDS, carrays):
+            for sid, carray, length in zip(sids, field_carrays, lengths):
+                values = block[offset:offset + length]
+                values[:] = carray[start_idx:start_idx + length]
+                arrays.append((field, sid, carray, values))
+                offset += length
+
+        block.setflags(write=False)
+        for field, sid, carray, values in arrays:
+            values.setflags(write=False)
+            self._shared_arrays[(field, sid)] = HotTierArray(
+                carray, values, start_idx
+            )
+
+        self._shared_buffers.append(buffer)
+        return size
+
     def load_raw_arrays(self, fields, start_dt, end_dt, sids):
         """
         Parameters
@@ -66,33 +403,30 @@ class BcolzExchangeBarReader(BcolzMinuteBarReader):
             else self.calendar.sessions_in_range(start_dt, end_dt)
 
         num_days = len(periods)
-        shape = num_days, len(sids)
+        inverse_ratios = self._ohlc_ratio_inverses_for_sids(sids)
 
         all_fields = fields[:]
         if len(all_fields) == 1 and all_fields[0] == 'volume':
             all_fields.insert(0, 'close')
 
+        # The bars of each sid are masked by the first price field read
+        # for that sid.
         mask = None
         data = []
         for field in all_fields:
-            if field != 'volume':
-                out = np.full(shape, np.nan)
-            else:
-                out = np.zeros(shape, dtype=np.float64)
-
-            for i, sid in enumerate(sids):
-                carray = self._open_minute_file(field, sid)
-                a = carray[start_idx:end_idx + 1]
+            values = self._load_raw_field(
+                field, sids, start_idx, end_idx
+            )[:num_days]
 
-                if mask is None:
-                    mask = a != 0
-
-                inverse_ratio = self._ohlc_ratio_inverse_for_sid(sid)
-                out[:len(mask), i][mask] = (
-                    a[mask] * inverse_ratio
-                )
+            if mask is None:
+                mask = values != 0
 
             if field in fields:
+                fill = 0.0 if field == 'volume' else np.nan
+                out = np.full((num_days, len(sids)), fill)
+                out[:len(mask)] = np.where(
+                    mask, values * inverse_ratios, fill
+                )
                 data.append(out)
 
         return data
@@ -0,0 +1,154 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from catalyst.constants import LOG_LEVEL
+from catalyst.exchange.exchange_bundle import ExchangeBundle
+from catalyst.exchange.utils.exchange_utils import get_exchange_folder
+from catalyst.sources.benchmark_source import BenchmarkSource
+from catalyst.utils.paths import ensure_directory
+from logbook import Logger
+
+log = Logger('exchange_benchmark', level=LOG_LEVEL)
+
+
+def get_benchmark_filename(asset, data_frequency, start_dt, end_dt):
+    """
+    The file caching the returns of a benchmark asset, removed by the
+    bundle of the exchange whenever data is written to it.
+
+    Parameters
+    ----------
+    asset: TradingPair
+    data_frequency: str
+    start_dt: pd.Timestamp
+    end_dt: pd.Timestamp
+
+    Returns
+    -------
+    str
+
+    """
+    folder = os.path.join(get_exchange_folder(asset.exchange), 'benchmarks')
+    ensure_directory(folder)
+
+    name = '{}-{}-{}-{}.npy'.format(
+        asset.symbol,
+        data_frequency,
+        start_dt.strftime('%Y%m%d%H%M'),
+        end_dt.strftime('%Y%m%d%H%M'),
+    )
+    return os.path.join(folder, name)
+
+
+class ExchangeBenchmarkSource(BenchmarkSource):
+    """
+    The returns of a benchmark asset computed from the close prices of the
+    exchange bundle.
+
+    The closes of the simulation periods are read at once from the bundle
+    reader and the returns saved in a file of the exchange folder, to be
+    loaded by the next backtests over the same periods. The history window
+    of the data portal is only used when the bundle does not include the
+    periods.
+    """
+
+    def _initialize_precalculated_series(self, asset, trading_calendar,
+                                         trading_days, data_portal):
+        if self.emission_rate == 'minute':
+            periods = trading_calendar.minutes_for_sessions_in_range(
+                trading_days[0], trading_days[-1]
+            )
+        else:
+            periods = trading_days
+
+        returns = None
+        if asset.start_date < trading_days[0]:
+            returns = self._load_returns(asset, periods)
+
+        if returns is None:
+            return super(ExchangeBenchmarkSource, self) \
+                ._initialize_precalculated_series(
+                    asset, trading_calendar, trading_days, data_portal
+                )
+
+        return pd.Series(returns, index=periods)
+
+    def _get_bundle(self, asset):
+        bundles = getattr(self.data_portal, 'exchange_bundles', dict())
+
+        bundle = bundles.get(asset.exchange)
+        if bundle is None:
+            bundle = ExchangeBundle(asset.exchange)
+
+        return bundle
+
+    def _load_returns(self, asset, periods):
+        """
+        The returns of the asset in each period, from the close of the
+        previous period.
+
+        Parameters
+        ----------
+        asset: TradingPair
+        periods: pd.DatetimeIndex
+
+        Returns
+        -------
+        np.ndarray
+            None if the periods are not in the bundle.
+
+        """
+        bundle = self._get_bundle(asset)
+
+        filename = get_benchmark_filename(
+            asset, self.emission_rate, periods[0], periods[-1]
+        )
+        if os.path.isfile(filename):
+            try:
+                returns = np.load(filename)
+                if len(returns) == len(periods):
+                    return returns
+
+            except (IOError, ValueError) as e:
+                log.warn('unable to read the benchmark returns {}: '
+                         '{}'.format(filename, e))
+
+        reader = bundle.get_reader(self.emission_rate)
+
+        # The close of the period preceding the simulation
+        delta = pd.Timedelta(minutes=1) \
+            if self.emission_rate == 'minute' else pd.Timedelta(days=1)
+        start_dt = periods[0] - delta
+        end_dt = periods[-1]
+
+        if reader is None or not bundle.range_in_bundle(
+                asset, start_dt, end_dt, self.emission_rate, reader):
+            return None
+
+        close = reader.load_raw_arrays(
+            ['close'], start_dt, end_dt, [asset]
+        )[0][:, 0]
+        if len(close) != len(periods) + 1:
+            return None
+
+        # Forward fill the periods without trades
+        last_valid = np.where(~np.isnan(close), np.arange(len(close)), 0)
+        np.maximum.accumulate(last_valid, out=last_valid)
+        close = close[last_valid]
+
+        returns = close[1:] / close[:-1] - 1.0
+
+        # The folder is removed when another process ingests data
+        tmp_filename = filename + '.tmp'
+        try:
+            with open(tmp_filename, 'wb') as handle:
+                np.save(handle, returns)
+            getattr(os, 'replace', os.rename)(tmp_filename, filename)
+
+        except (IOError, OSError) as e:
+            log.warn('unable to save the benchmark returns {}: '
+                     '{}'.format(filename, e))
+
+        return returns
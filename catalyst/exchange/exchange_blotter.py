@@ -1,10 +1,12 @@
+from collections import defaultdict
+
 import numpy as np
 import pandas as pd
 from logbook import Logger
 from redo import retry
 
 from catalyst.assets._assets import TradingPair
-from catalyst.constants import LOG_LEVEL
+from catalyst.constants import LOG_LEVEL, ORDER_RECONCILE_INTERVAL
 from catalyst.exchange.exchange_errors import ExchangeRequestError
 from catalyst.finance.blotter import Blotter
 from catalyst.finance.commission import CommissionModel
@@ -146,6 +148,11 @@ class ExchangeBlotter(Blotter):
                 'ExchangeBlotter must have an `exchanges` attribute.'
             )
 
+        # The trades already processed on each exchange
+        self.trade_cursors = dict()
+        # The last time the orders of each exchange were reconciled
+        self.reconciled_at = dict()
+
         super(ExchangeBlotter, self).__init__(*args, **kwargs)
 
         # Using the equity models for now
@@ -192,45 +199,110 @@ class ExchangeBlotter(Blotter):
 
             return order.id
 
+    def _may_have_filled(self, exchange, order):
+        """
+        Whether the order needs to be checked on the exchange, according to
+        the trades streamed by the feed of the exchange if any.
+
+        Parameters
+        ----------
+        exchange: Exchange
+        order: Order
+
+        Returns
+        -------
+        bool
+
+        """
+        if exchange.feed is None or order.limit is None \
+                or order.stop is not None:
+            return True
+
+        since = pd.Timestamp(order.dt).floor('1 min')
+        return exchange.feed.may_have_filled(
+            symbol=exchange.get_symbol(order.asset),
+            limit=order.limit,
+            is_buy=order.amount > 0,
+            since=int(since.value // 1000000),
+        )
+
     def check_open_orders(self):
         """
         Loop through the list of open orders in the Portfolio object.
         For each executed order found, create a transaction and apply to the
         Portfolio.
 
+        The open orders of each exchange are reconciled together, the
+        trades already processed being tracked by a cursor per exchange.
+        An exchange whose feed did not stream any trade reaching its orders
+        is still reconciled every ORDER_RECONCILE_INTERVAL seconds.
+
         Returns
         -------
         list[Transaction]
 
         """
+        exchange_orders = defaultdict(list)
         for asset in self.open_orders:
-            exchange = self.exchanges[asset.exchange]
-
             for order in self.open_orders[asset]:
                 log.debug('found open order: {}'.format(order.id))
+                exchange_orders[asset.exchange].append(order)
+
+        now = pd.Timestamp.utcnow()
+        reconciled = []
+        for exchange_name in sorted(exchange_orders):
+            exchange = self.exchanges[exchange_name]
+            orders = exchange_orders[exchange_name]
+
+            # The orders of an exchange are reconciled by the same requests
+            last = self.reconciled_at.get(exchange.name)
+            if last is not None \
+                    and (now - last).total_seconds() \
+                    < ORDER_RECONCILE_INTERVAL \
+                    and not any(self._may_have_filled(exchange, order)
+                                for order in orders):
+                log.debug(
+                    'no streamed trade reached the limit of the {} orders, '
+                    'skipping'.format(exchange.name)
+                )
+                continue
+
+            cursor = self.trade_cursors.setdefault(exchange.name, dict())
+            try:
+                transactions = exchange.process_orders(orders, cursor)
+            except ExchangeRequestError as e:
+                if not reconciled:
+                    raise
+
+                # Retrying would lose the orders already reconciled
+                log.warn(
+                    'unable to reconcile the {} orders, trying again on the '
+                    'next bar: {}'.format(exchange.name, e)
+                )
+                continue
+
+            self.reconciled_at[exchange.name] = now
+            reconciled.append((exchange, orders, transactions))
 
-                transactions = exchange.process_order(order)
-                # This is a temporary measure, we should really update all
-                # trades, not just when the order gets filled. I just think
-                # that this is safer until we have a robust way to track
-                # the trades already processed by the algo. We can't loose
-                # them if the algo shuts down.
-                if transactions and order.status == ORDER_STATUS.FILLED:
+        for exchange, orders, transactions in reconciled:
+            for order in orders:
+                order_transactions = transactions.get(order.id)
+                if order_transactions:
                     avg_price = np.average(
-                        a=[t.price for t in transactions],
-                        weights=[t.amount for t in transactions],
+                        a=[t.price for t in order_transactions],
+                        weights=[t.amount for t in order_transactions],
                     )
                     ostatus = 'filled' if order.open_amount == 0 else 'partial'
                     log.info(
                         '{} order {} / {}: {}, avg price: {}'.format(
                             ostatus,
                             order.id,
-                            asset.symbol,
+                            order.asset.symbol,
                             order.filled,
                             avg_price,
                         )
                     )
-                    for transaction in transactions:
+                    for transaction in order_transactions:
                         yield order, transaction
 
                 elif order.status == ORDER_STATUS.CANCELLED:
@@ -254,8 +326,9 @@ class ExchangeBlotter(Blotter):
         commissions = []
 
         for order, txn in self.check_open_orders():
-            order.dt = txn.dt
-            transactions.append(txn)
+            if txn is not None:
+                order.dt = txn.dt
+                transactions.append(txn)
 
             if not order.open:
                 closed_orders.append(order)
@@ -1,9 +1,12 @@
 import os
 import shutil
+from collections import defaultdict
 from datetime import timedelta
 from functools import partial
 from itertools import chain
+from multiprocessing.pool import ThreadPool
 from operator import is_not
+from threading import Event, Lock
 
 import numpy as np
 import pandas as pd
@@ -19,11 +22,13 @@ from catalyst.exchange.exchange_bcolz import BcolzExchangeBarReader, \
 from catalyst.exchange.exchange_errors import EmptyValuesInBundleError, \
     TempBundleNotFoundError, \
     NoDataAvailableOnExchange, \
-    PricingDataNotLoadedError, DataCorruptionError, PricingDataValueError
-from catalyst.exchange.utils.bundle_utils import range_in_bundle, \
-    get_bcolz_chunk, get_df_from_arrays, get_assets
+    PricingDataNotLoadedError, DataCorruptionError, PricingDataValueError, \
+    ExchangeRequestError
+from catalyst.exchange.exchange_coverage import CoverageIndex
+from catalyst.exchange.utils.bundle_utils import get_bcolz_chunk, \
+    get_df_from_arrays, get_assets
 from catalyst.exchange.utils.datetime_utils import get_start_dt, \
-    get_period_label, get_month_start_end, get_year_start_end
+    get_period_label, get_month_start_end, get_year_start_end, get_delta
 from catalyst.exchange.utils.exchange_utils import get_exchange_folder, \
     save_exchange_symbols, mixin_market_params, get_catalyst_symbol
 from catalyst.utils.cli import maybe_show_progress
@@ -31,11 +36,19 @@ from catalyst.utils.paths import ensure_directory
 from logbook import Logger
 from pytz import UTC
 from six import itervalues
+from six.moves.queue import Queue, Full
 
 log = Logger('exchange_bundle', level=LOG_LEVEL)
 
 BUNDLE_NAME_TEMPLATE = os.path.join('{root}', '{frequency}_bundle')
 
+# The number of bars requested at once by the incremental ingestion
+INCREMENTAL_BAR_COUNT = 500
+
+# The version of the bundle of each exchange, shared by all the
+# ExchangeBundle instances of the process.
+_versions = defaultdict(int)
+
 
 def _cachpath(symbol, type_):
     return '-'.join([symbol, type_])
@@ -48,8 +61,30 @@ class ExchangeBundle:
         self.default_ohlc_ratio = 1000000
         self._writers = dict()
         self._readers = dict()
+        self._coverages = dict()
         self.calendar = get_calendar('OPEN')
         self.exchange = None
+        # Whether the missing bars are ingested when requested
+        self.auto_ingest = AUTO_INGEST
+
+    @property
+    def version(self):
+        # Incremented whenever data is written to the bundle, this lets
+        # the cached history windows and pipeline blocks know that they
+        # are stale, whichever instance wrote the data.
+        return _versions[self.exchange_name]
+
+    def _increment_version(self):
+        _versions[self.exchange_name] += 1
+        self._remove_benchmarks()
+
+    def _remove_benchmarks(self):
+        # The benchmark returns cached on disk are computed again from the
+        # bars written, by this process or any other
+        root = get_exchange_folder(self.exchange_name)
+        benchmarks = os.path.join(root, 'benchmarks')
+        if os.path.isdir(benchmarks):
+            shutil.rmtree(benchmarks, ignore_errors=True)
 
     def get_reader(self, data_frequency, path=None):
         """
@@ -80,6 +115,84 @@ class ExchangeBundle:
 
         return self._readers[path]
 
+    def get_coverage(self, data_frequency):
+        """
+        Get the coverage index of the bundle, either a new object or from
+        cache
+
+        Returns
+        -------
+        CoverageIndex
+
+        """
+        root = get_exchange_folder(self.exchange_name)
+        path = BUNDLE_NAME_TEMPLATE.format(
+            root=root,
+            frequency=data_frequency
+        )
+
+        if path not in self._coverages:
+            self._coverages[path] = CoverageIndex(
+                rootdir=path,
+                data_frequency=data_frequency
+            )
+
+        return self._coverages[path]
+
+    def _index_sid(self, coverage, asset, reader):
+        # The bundles ingested before the coverage index are assumed to
+        # include each asset from its start date to the last bar written,
+        # the bundle writer only appending data after the last bar.
+        coverage.mark_sid(asset.sid)
+
+        if reader is not None and os.path.exists(
+                reader._get_carray_path(asset.sid, 'close')):
+            try:
+                size = reader.table_len(asset.sid)
+            except Exception as e:
+                log.debug('unable to index {}: {}'.format(asset.symbol, e))
+                size = 0
+
+            start_dt = max(asset.start_date, reader.first_trading_day)
+            if size > 0:
+                end_dt = reader._pos_to_minute(size - 1)
+                if start_dt <= end_dt:
+                    coverage.add(asset.sid, start_dt, end_dt, save=False)
+
+        coverage.save()
+
+    def range_in_bundle(self, asset, start_dt, end_dt, data_frequency,
+                        reader=None):
+        """
+        Evaluate whether the price data of an asset has been ingested in
+        the bundle for the given date range, without holes.
+
+        The ranges are looked up in the coverage index of the bundle
+        instead of reading the bars.
+
+        Parameters
+        ----------
+        asset: TradingPair
+        start_dt: pd.Timestamp
+        end_dt: pd.Timestamp
+        data_frequency: str
+        reader: BcolzExchangeBarReader
+            Used to index the bundles ingested before the coverage index.
+
+        Returns
+        -------
+        bool
+
+        """
+        coverage = self.get_coverage(data_frequency)
+        if not coverage.has_sid(asset.sid):
+            if reader is None:
+                reader = self.get_reader(data_frequency)
+
+            self._index_sid(coverage, asset, reader)
+
+        return coverage.covers(asset.sid, start_dt, end_dt)
+
     def update_metadata(self, writer, start_dt, end_dt):
         pass
 
@@ -164,7 +277,9 @@ class ExchangeBundle:
         reader = self.get_reader(data_frequency)
         missing_assets = []
         for asset in assets:
-            has_data = range_in_bundle(asset, start_dt, end_dt, reader)
+            has_data = self.range_in_bundle(
+                asset, start_dt, end_dt, data_frequency, reader
+            )
 
             if not has_data:
                 missing_assets.append(asset)
@@ -172,6 +287,16 @@ class ExchangeBundle:
         return missing_assets
 
     def _write(self, data, writer, data_frequency):
+        """
+        Write bars with the writer, replacing it once if it fails.
+
+        Returns
+        -------
+        bool
+            False if the bars were dropped for overlapping the bundle.
+
+        """
+        self._increment_version()
         try:
             writer.write(
                 data=data,
@@ -180,6 +305,7 @@ class ExchangeBundle:
             )
         except BcolzMinuteOverlappingData as e:
             log.debug('chunk already exists: {}'.format(e))
+            return False
         except Exception as e:
             log.warn('error when writing data: {}, trying again'.format(e))
 
@@ -195,6 +321,8 @@ class ExchangeBundle:
                 invalid_data_behavior='raise'
             )
 
+        return True
+
     def get_calendar_periods_range(self, start_dt, end_dt, data_frequency):
         """
         Get a list of dates for the specified range.
@@ -327,37 +455,40 @@ class ExchangeBundle:
             ohlcv_df.sort_index(inplace=True)
             data.append((asset.sid, ohlcv_df))
 
-        self._write(data, writer, data_frequency)
+        written = self._write(data, writer, data_frequency)
+
+        # A chunk overlapping the bundle is dropped by the writer, the
+        # bars already in the bundle are found by indexing the sid.
+        if data:
+            coverage = self.get_coverage(data_frequency)
+            if not coverage.has_sid(asset.sid):
+                self._index_sid(
+                    coverage, asset, self.get_reader(data_frequency)
+                )
+
+            if written:
+                coverage.add(
+                    asset.sid, ohlcv_df.index[0], ohlcv_df.index[-1]
+                )
 
         return problems
 
-    def ingest_ctable(self, asset, data_frequency, period,
-                      writer, empty_rows_behavior='strip',
-                      duplicates_threshold=100, cleanup=False):
+    def fetch_ctable(self, asset, data_frequency, period):
         """
-        Merge a ctable bundle chunk into the main bundle for the exchange.
+        Download and extract a ctable bundle chunk.
 
         Parameters
         ----------
         asset: TradingPair
         data_frequency: str
         period: str
-        writer:
-        empty_rows_behavior: str
-            Ensure that the bundle does not have any missing data.
-
-        cleanup: bool
-            Remove the temp bundle directory after ingestion.
 
         Returns
         -------
-        list[str]
-            A list of problems which occurred during ingestion.
+        BcolzExchangeBarReader
+            A reader for the temp bundle of the chunk.
 
         """
-        problems = []
-
-        # Download and extract the bundle
         path = get_bcolz_chunk(
             exchange_name=self.exchange_name,
             symbol=asset.symbol,
@@ -377,6 +508,24 @@ class ExchangeBundle:
 
             raise TempBundleNotFoundError(path=path)
 
+        return reader
+
+    def decode_ctable(self, asset, data_frequency, reader):
+        """
+        Read the OHLCV data of a ctable bundle chunk.
+
+        Parameters
+        ----------
+        asset: TradingPair
+        data_frequency: str
+        reader: BcolzExchangeBarReader
+
+        Returns
+        -------
+        DataFrame
+            The chunk data or None if the chunk could not be read.
+
+        """
         start_dt = reader.first_trading_day
         end_dt = reader.last_available_dt
 
@@ -397,12 +546,62 @@ class ExchangeBundle:
             ))
 
         if not arrays:
-            return reader._rootdir
+            return None
 
         periods = self.get_calendar_periods_range(
             start_dt, end_dt, data_frequency
         )
-        df = get_df_from_arrays(arrays, periods)
+        return get_df_from_arrays(arrays, periods)
+
+    def remove_ctable(self, reader):
+        """
+        Remove the temp bundle folder of a ctable chunk.
+
+        Parameters
+        ----------
+        reader: BcolzExchangeBarReader
+
+        """
+        log.debug(
+            'removing bundle folder following ingestion: {}'.format(
+                reader._rootdir)
+        )
+        self._readers.pop(reader._rootdir, None)
+        shutil.rmtree(reader._rootdir)
+
+    def ingest_ctable(self, asset, data_frequency, period,
+                      writer, empty_rows_behavior='strip',
+                      duplicates_threshold=100, cleanup=False):
+        """
+        Merge a ctable bundle chunk into the main bundle for the exchange.
+
+        Parameters
+        ----------
+        asset: TradingPair
+        data_frequency: str
+        period: str
+        writer:
+        empty_rows_behavior: str
+            Ensure that the bundle does not have any missing data.
+
+        cleanup: bool
+            Remove the temp bundle directory after ingestion.
+
+        Returns
+        -------
+        list[str]
+            A list of problems which occurred during ingestion.
+
+        """
+        problems = []
+
+        # Download and extract the bundle
+        reader = self.fetch_ctable(asset, data_frequency, period)
+
+        df = self.decode_ctable(asset, data_frequency, reader)
+        if df is None:
+            return reader._rootdir
+
         problems += self.ingest_df(
             ohlcv_df=df,
             data_frequency=data_frequency,
@@ -413,14 +612,219 @@ class ExchangeBundle:
         )
 
         if cleanup:
-            log.debug(
-                'removing bundle folder following ingestion: {}'.format(
-                    reader._rootdir)
-            )
-            shutil.rmtree(reader._rootdir)
+            self.remove_ctable(reader)
 
         return filter(partial(is_not, None), problems)
 
+    def _iter_ctable_pipeline(self, chunks, data_frequency, writer, jobs,
+                              status):
+        """
+        Ingest ctable chunks through a staged pipeline.
+
+        The chunks are downloaded and extracted by a pool of `jobs`
+        threads, decoded by a second pool and written by the calling
+        thread, which is the only one accessing the writer.
+
+        Parameters
+        ----------
+        chunks: list[dict(str, Object)]
+        data_frequency: str
+        writer: BcolzExchangeBarWriter
+        jobs: int
+        status: dict[str, int]
+            Updated with the number of chunks processed by each stage.
+
+        Returns
+        -------
+        generator[list[str]]
+            The problems of each chunk, as soon as it is written.
+
+        """
+        # Bounding the queue keeps the decoded frames waiting for the
+        # writer from piling up in memory.
+        decoded = Queue(maxsize=jobs * 2)
+        aborted = Event()
+        lock = Lock()
+
+        # The chunks of an asset are decoded in any order but must reach
+        # the append-only writer in the order of their periods. Each chunk
+        # waits for the previous chunk of its asset to be written.
+        following = dict()
+        ready = set()
+        last = dict()
+        ordered = sorted(
+            range(len(chunks)),
+            key=lambda index: pd.to_datetime(chunks[index]['period'])
+        )
+        for index in ordered:
+            previous = last.get(chunks[index]['asset'])
+            if previous is None:
+                ready.add(index)
+            else:
+                following[previous] = index
+
+            last[chunks[index]['asset']] = index
+
+        # The readers fetched but not yet written, removed on abort
+        readers = dict()
+        pending = dict()
+
+        def increment(stage):
+            with lock:
+                status[stage] += 1
+
+        def put(item):
+            while not aborted.is_set():
+                try:
+                    decoded.put(item, timeout=1)
+                    return
+                except Full:
+                    pass
+
+        def decode(index, reader):
+            try:
+                df = self.decode_ctable(
+                    chunks[index]['asset'], data_frequency, reader
+                )
+                increment('decoded')
+                put((index, df, None))
+
+            except Exception as e:
+                put((index, None, e))
+
+        def fetch(index):
+            if aborted.is_set():
+                return
+
+            try:
+                chunk = chunks[index]
+                reader = self.fetch_ctable(
+                    chunk['asset'], data_frequency, chunk['period']
+                )
+                with lock:
+                    readers[index] = reader
+
+                increment('fetched')
+                decode_pool.apply_async(decode, (index, reader))
+
+            except Exception as e:
+                put((index, None, e))
+
+        fetch_pool = ThreadPool(jobs)
+        decode_pool = ThreadPool(jobs)
+        try:
+            submitted = 0
+            received = 0
+            while received < len(chunks):
+                # The chunks are fetched as the previous ones are written,
+                # at most `jobs` decoded chunks waiting for the previous
+                # chunk of their asset. The earliest chunk not written is
+                # always in flight or ready, which keeps this from blocking.
+                while submitted < len(ordered) and len(pending) < jobs \
+                        and submitted - received < jobs * 2:
+                    fetch_pool.apply_async(fetch, (ordered[submitted],))
+                    submitted += 1
+
+                index, df, error = decoded.get()
+                received += 1
+                if error is not None:
+                    raise error
+
+                pending[index] = df
+                while index in pending and index in ready:
+                    df = pending.pop(index)
+
+                    problems = []
+                    if df is not None:
+                        problems += self.ingest_df(
+                            ohlcv_df=df,
+                            data_frequency=data_frequency,
+                            asset=chunks[index]['asset'],
+                            writer=writer,
+                            empty_rows_behavior='strip',
+                        )
+
+                    with lock:
+                        reader = readers.pop(index)
+
+                    self.remove_ctable(reader)
+                    increment('written')
+
+                    yield [
+                        problem for problem in problems if problem is not None
+                    ]
+
+                    index = following.get(index)
+                    if index is not None:
+                        ready.add(index)
+
+        finally:
+            aborted.set()
+            fetch_pool.terminate()
+            decode_pool.terminate()
+            fetch_pool.join()
+            decode_pool.join()
+
+            # Remove the temp ctables of the chunks never written
+            for reader in itervalues(readers):
+                self.remove_ctable(reader)
+
+    def ingest_chunks(self, chunks, data_frequency, writer, jobs=1,
+                      show_progress=False, label=None):
+        """
+        Ingest the specified ctable chunks into the exchange bundle.
+
+        Parameters
+        ----------
+        chunks: list[dict(str, Object)]
+        data_frequency: str
+        writer: BcolzExchangeBarWriter
+        jobs: int
+            The number of chunks to download and decode concurrently.
+        show_progress: bool
+        label: str
+
+        Returns
+        -------
+        list[str]
+            A list of problems which occurred during ingestion.
+
+        """
+        problems = []
+        if jobs <= 1:
+            with maybe_show_progress(
+                    chunks, show_progress, label=label) as it:
+                for chunk in it:
+                    problems += self.ingest_ctable(
+                        asset=chunk['asset'],
+                        data_frequency=data_frequency,
+                        period=chunk['period'],
+                        writer=writer,
+                        empty_rows_behavior='strip',
+                        cleanup=True
+                    )
+
+            return problems
+
+        status = dict(fetched=0, decoded=0, written=0)
+
+        def show_status(item):
+            return 'fetched {fetched}, decoded {decoded}, written ' \
+                   '{written} of {total}'.format(total=len(chunks), **status)
+
+        with maybe_show_progress(
+                self._iter_ctable_pipeline(
+                    chunks, data_frequency, writer, jobs, status
+                ),
+                show_progress,
+                length=len(chunks),
+                label=label,
+                item_show_func=show_status) as it:
+            for chunk_problems in it:
+                problems += chunk_problems
+
+        return problems
+
     def get_adj_dates(self, start, end, assets, data_frequency):
         """
         Contains a date range to the trading availability of the specified
@@ -539,8 +943,8 @@ class ExchangeBundle:
                 # Checking if the data already exists in the bundle
                 # for the date range of the chunk. If not, we create
                 # a chunk for ingestion.
-                has_data = range_in_bundle(
-                    asset, range_start, period_end, reader
+                has_data = self.range_in_bundle(
+                    asset, range_start, period_end, data_frequency, reader
                 )
                 if not has_data:
                     period = get_period_label(dt, data_frequency)
@@ -559,7 +963,7 @@ class ExchangeBundle:
 
     def ingest_assets(self, assets, data_frequency, start_dt=None, end_dt=None,
                       show_progress=False, show_breakdown=False,
-                      show_report=False):
+                      show_report=False, jobs=1):
         """
         Determine if data is missing from the bundle and attempt to ingest it.
 
@@ -571,6 +975,9 @@ class ExchangeBundle:
         end_dt: pd.Timestamp
         show_progress: bool
         show_breakdown: bool
+        show_report: bool
+        jobs: int
+            The number of chunks to download and decode concurrently.
 
         """
         if start_dt is None:
@@ -600,24 +1007,20 @@ class ExchangeBundle:
         if show_breakdown:
             if chunks:
                 for asset in chunks:
-                    with maybe_show_progress(
-                        chunks[asset],
-                        show_progress,
-                        label='Ingesting {frequency} price data for '
-                              '{symbol} on {exchange}'.format(
-                            exchange=self.exchange_name,
-                            frequency=data_frequency,
-                            symbol=asset.symbol
-                            )) as it:
-                        for chunk in it:
-                            problems += self.ingest_ctable(
-                                asset=chunk['asset'],
-                                data_frequency=data_frequency,
-                                period=chunk['period'],
-                                writer=writer,
-                                empty_rows_behavior='strip',
-                                cleanup=True
+                    label = 'Ingesting {frequency} price data for ' \
+                            '{symbol} on {exchange}'.format(
+                                exchange=self.exchange_name,
+                                frequency=data_frequency,
+                                symbol=asset.symbol
                             )
+                    problems += self.ingest_chunks(
+                        chunks=chunks[asset],
+                        data_frequency=data_frequency,
+                        writer=writer,
+                        jobs=jobs,
+                        show_progress=show_progress,
+                        label=label
+                    )
         else:
             all_chunks = list(chain.from_iterable(itervalues(chunks)))
             # We sort the chunks by end date to ingest most recent data first
@@ -625,29 +1028,191 @@ class ExchangeBundle:
                 all_chunks.sort(
                     key=lambda chunk: pd.to_datetime(chunk['period'])
                 )
-                with maybe_show_progress(
-                    all_chunks,
-                    show_progress,
-                    label='Ingesting {frequency} price data on '
-                          '{exchange}'.format(
-                        exchange=self.exchange_name,
-                        frequency=data_frequency,
-                        )) as it:
-                    for chunk in it:
-                        problems += self.ingest_ctable(
-                            asset=chunk['asset'],
-                            data_frequency=data_frequency,
-                            period=chunk['period'],
-                            writer=writer,
-                            empty_rows_behavior='strip',
-                            cleanup=True
+                label = 'Ingesting {frequency} price data on ' \
+                        '{exchange}'.format(
+                            exchange=self.exchange_name,
+                            frequency=data_frequency,
                         )
+                problems += self.ingest_chunks(
+                    chunks=all_chunks,
+                    data_frequency=data_frequency,
+                    writer=writer,
+                    jobs=jobs,
+                    show_progress=show_progress,
+                    label=label
+                )
 
         if show_report and len(problems) > 0:
             log.info('problems during ingestion:{}\n'.format(
                 '\n'.join(problems)
             ))
 
+    def fetch_incremental(self, asset, data_frequency, start_dt, end_dt):
+        """
+        Fetch the bars of an asset from the exchange, paging the candles
+        from the start date.
+
+        Parameters
+        ----------
+        asset: TradingPair
+        data_frequency: str
+        start_dt: pd.Timestamp
+        end_dt: pd.Timestamp
+
+        Returns
+        -------
+        DataFrame
+            The OHLCV bars from start_dt to end_dt.
+
+        """
+        freq = '1T' if data_frequency == 'minute' else '1D'
+        delta = get_delta(1, data_frequency)
+
+        frames = []
+        since = start_dt
+        while since <= end_dt:
+            arrays = self.exchange.get_candle_arrays(
+                freq=freq,
+                assets=asset,
+                bar_count=INCREMENTAL_BAR_COUNT,
+                start_dt=since,
+            )
+
+            dts = arrays['last_traded']
+            mask = (dts >= since) & (dts <= end_dt)
+            if not mask.any():
+                break
+
+            frames.append(pd.DataFrame(
+                {
+                    field: arrays[field][mask]
+                    for field in ['open', 'high', 'low', 'close', 'volume']
+                },
+                index=dts[mask],
+            ))
+            since = dts[mask][-1] + delta
+
+        if not frames:
+            return pd.DataFrame(
+                columns=['open', 'high', 'low', 'close', 'volume']
+            )
+
+        df = pd.concat(frames)
+        return df[~df.index.duplicated(keep='first')]
+
+    def ingest_incremental(self, assets, data_frequency, start_dt=None,
+                           end_dt=None, show_progress=False, jobs=1):
+        """
+        Ingest the bars more recent than the last bar of each asset in the
+        bundle, fetched from the exchange instead of the bundle chunks.
+
+        The candles of the assets are paged concurrently, the bars written
+        one asset at a time.
+
+        Parameters
+        ----------
+        assets: list[TradingPair]
+        data_frequency: str
+        start_dt: pd.Timestamp
+            The start date of the assets missing from the bundle.
+        end_dt: pd.Timestamp
+        show_progress: bool
+        jobs: int
+            The number of assets to fetch concurrently.
+
+        """
+        if self.exchange is None:
+            # Avoid circular dependencies
+            from catalyst.exchange.utils.factory import get_exchange
+            self.exchange = get_exchange(self.exchange_name)
+
+        if end_dt is None:
+            end_dt = pd.Timestamp.utcnow()
+
+        # The bar of the current period is not closed yet
+        delta = get_delta(1, data_frequency)
+        end_dt = end_dt.floor('1T' if data_frequency == 'minute' else '1D')
+        end_dt -= delta
+
+        if start_dt is None:
+            start_dt = min([asset.start_date for asset in assets])
+
+        get_start_end = get_month_start_end \
+            if data_frequency == 'minute' else get_year_start_end
+
+        writer = self.get_writer(
+            get_start_end(start_dt)[0],
+            get_start_end(end_dt)[1],
+            data_frequency
+        )
+
+        ranges = []
+        for asset in assets:
+            last_dt = writer.last_dt_in_output_for_sid(asset.sid)
+            asset_start_dt = max(start_dt, asset.start_date) \
+                if pd.isnull(last_dt) else last_dt + delta
+
+            if asset_start_dt <= end_dt:
+                ranges.append((asset, asset_start_dt))
+
+        def fetch(item):
+            asset, asset_start_dt = item
+            try:
+                df = self.fetch_incremental(
+                    asset, data_frequency, asset_start_dt, end_dt
+                )
+            except ExchangeRequestError as e:
+                log.warn('unable to fetch the bars of {}: {}'.format(
+                    asset.symbol, e
+                ))
+                df = None
+
+            return asset, asset_start_dt, df
+
+        pool = ThreadPool(max(1, min(jobs, len(ranges))))
+        try:
+            with maybe_show_progress(
+                    pool.imap_unordered(fetch, ranges),
+                    show_progress,
+                    length=len(ranges),
+                    label='Ingesting recent {frequency} price data on '
+                          '{exchange}'.format(
+                        exchange=self.exchange_name,
+                        frequency=data_frequency,
+                    )) as it:
+                for asset, asset_start_dt, df in it:
+                    if df is None:
+                        continue
+
+                    self._write_incremental(
+                        asset, asset_start_dt, df, writer, data_frequency
+                    )
+        finally:
+            pool.close()
+            pool.join()
+
+    def _write_incremental(self, asset, start_dt, df, writer,
+                           data_frequency):
+        if df.empty:
+            return
+
+        self._increment_version()
+        try:
+            writer.write_sid(asset.sid, df, invalid_data_behavior='raise')
+
+        except BcolzMinuteOverlappingData as e:
+            log.debug('bars already exist: {}'.format(e))
+            return
+
+        coverage = self.get_coverage(data_frequency)
+        if not coverage.has_sid(asset.sid):
+            self._index_sid(coverage, asset, self.get_reader(data_frequency))
+
+        # The bars were fetched from start_dt, the exchange had no trades
+        # before the first one. The periods after the last bar may still be
+        # published by the exchange.
+        coverage.add(asset.sid, start_dt, df.index[-1])
+
     def ingest_csv(self, path, data_frequency, empty_rows_behavior='strip',
                    duplicates_threshold=100):
         """
@@ -786,7 +1351,8 @@ class ExchangeBundle:
 
     def ingest(self, data_frequency, include_symbols=None,
                exclude_symbols=None, start=None, end=None, csv=None,
-               show_progress=True, show_breakdown=True, show_report=True):
+               show_progress=True, show_breakdown=True, show_report=True,
+               jobs=1, incremental=False):
         """
         Inject data based on specified parameters.
 
@@ -798,7 +1364,11 @@ class ExchangeBundle:
         start: pd.Timestamp
         end: pd.Timestamp
         show_progress: bool
-        environ:
+        jobs: int
+            The number of chunks to download and decode concurrently.
+        incremental: bool
+            Ingest the bars more recent than the bundle from the exchange
+            instead of the bundle chunks.
 
         """
         if csv is not None:
@@ -814,6 +1384,17 @@ class ExchangeBundle:
                 self.exchange, include_symbols, exclude_symbols
             )
             for frequency in data_frequency.split(','):
+                if incremental:
+                    self.ingest_incremental(
+                        assets=assets,
+                        data_frequency=frequency,
+                        start_dt=start,
+                        end_dt=end,
+                        show_progress=show_progress,
+                        jobs=jobs
+                    )
+                    continue
+
                 self.ingest_assets(
                     assets=assets,
                     data_frequency=frequency,
@@ -821,7 +1402,8 @@ class ExchangeBundle:
                     end_dt=end,
                     show_progress=show_progress,
                     show_breakdown=show_breakdown,
-                    show_report=show_report
+                    show_report=show_report,
+                    jobs=jobs
                 )
 
     def get_history_window_series_and_load(self,
@@ -851,7 +1433,7 @@ class ExchangeBundle:
         Series
 
         """
-        if AUTO_INGEST or force_auto_ingest:
+        if self.auto_ingest or force_auto_ingest:
             try:
                 series = self.get_history_window_series(
                     assets=assets,
@@ -987,13 +1569,9 @@ class ExchangeBundle:
                 end_dt=end_dt
             )
 
-        series = dict()
         for asset in assets:
-            asset_start_dt, _ = self.get_adj_dates(
-                start_dt, end_dt, assets, data_frequency
-            )
-            in_bundle = range_in_bundle(
-                asset, asset_start_dt, end_dt, reader
+            in_bundle = self.range_in_bundle(
+                asset, start_dt, end_dt, data_frequency, reader
             )
             if not in_bundle:
                 raise PricingDataNotLoadedError(
@@ -1003,33 +1581,33 @@ class ExchangeBundle:
                     symbols=asset.symbol,
                     symbol_list=asset.symbol,
                     data_frequency=data_frequency,
-                    start_dt=asset_start_dt,
+                    start_dt=start_dt,
                     end_dt=end_dt
                 )
 
-            periods = self.get_calendar_periods_range(
-                asset_start_dt, end_dt, data_frequency
-            )
-            # This does not behave well when requesting multiple assets
-            # when the start or end date of one asset is outside of the range
-            # looking at the logic in load_raw_arrays(), we are not achieving
-            # any performance gain by requesting multiple sids at once. It's
-            # looping through the sids and making separate requests anyway.
-            arrays = reader.load_raw_arrays(
-                sids=[asset.sid],
-                fields=[field],
+        periods = self.get_calendar_periods_range(
+            start_dt, end_dt, data_frequency
+        )
+        # All the assets share the same adjusted date range so their
+        # values are read at once.
+        arrays = reader.load_raw_arrays(
+            sids=[asset.sid for asset in assets],
+            fields=[field],
+            start_dt=start_dt,
+            end_dt=end_dt
+        )
+        if len(arrays) == 0:
+            symbols = [asset.symbol for asset in assets]
+            raise DataCorruptionError(
+                exchange=self.exchange_name,
+                symbols=','.join(symbols),
                 start_dt=start_dt,
                 end_dt=end_dt
             )
-            if len(arrays) == 0:
-                raise DataCorruptionError(
-                    exchange=self.exchange_name,
-                    symbols=asset.symbol,
-                    start_dt=asset_start_dt,
-                    end_dt=end_dt
-                )
 
-            field_values = arrays[0][:, 0]
+        series = dict()
+        for index, asset in enumerate(assets):
+            field_values = arrays[0][:, index]
 
             try:
                 value_series = pd.Series(field_values, index=periods)
@@ -1038,13 +1616,32 @@ class ExchangeBundle:
                 raise PricingDataValueError(
                     exchange=asset.exchange,
                     symbol=asset.symbol,
-                    start_dt=asset_start_dt,
+                    start_dt=start_dt,
                     end_dt=end_dt,
                     error=e
                 )
 
         return series
 
+    def build_hot_tier(self, data_frequency, start_dt, end_dt):
+        """
+        Copy a range of sessions of the bundle to its hot tier, read
+        without decompression. The range replaces the one previously
+        copied.
+
+        Parameters
+        ----------
+        data_frequency: str
+        start_dt: pd.Timestamp
+        end_dt: pd.Timestamp
+
+        """
+        writer = self.get_writer(start_dt, end_dt, data_frequency)
+        writer.build_hot_tier(start_dt, end_dt)
+
+        # The readers opened before the hot tier do not use it
+        self._readers = dict()
+
     def clean(self, data_frequency):
         """
         Removing the bundle data from the catalyst folder.
@@ -1074,6 +1671,8 @@ class ExchangeBundle:
             shutil.rmtree(temp_bundles)
             log.debug('{} removed'.format(temp_bundles))
 
+        self._remove_benchmarks()
+
         frequencies = ['daily', 'minute'] if data_frequency is None \
             else [data_frequency]
 
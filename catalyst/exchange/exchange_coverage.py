@@ -0,0 +1,183 @@
+import json
+import os
+from bisect import bisect_right
+
+import pandas as pd
+
+from catalyst.constants import LOG_LEVEL
+from catalyst.utils.paths import ensure_directory
+from logbook import Logger
+
+log = Logger('exchange_coverage', level=LOG_LEVEL)
+
+COVERAGE_FILENAME = 'coverage.json'
+
+_replace = getattr(os, 'replace', os.rename)
+
+
+class CoverageIndex(object):
+    """
+    The ranges of dates ingested in a bundle for each sid.
+
+    The ranges of a sid are kept as a sorted list of disjoint intervals,
+    merged when they overlap or follow each other within a period of the
+    bundle. The index is saved in a JSON file of the bundle folder and
+    reloaded when the file is modified, by another bundle object for
+    example.
+
+    Parameters
+    ----------
+    rootdir: str
+        The folder of the bundle.
+    data_frequency: str
+
+    """
+
+    def __init__(self, rootdir, data_frequency):
+        self.rootdir = rootdir
+        self.data_frequency = data_frequency
+        self.period = (
+            pd.Timedelta(minutes=1) if data_frequency == 'minute'
+            else pd.Timedelta(days=1)
+        ).value
+
+        self._intervals = dict()
+        self._stat = None
+
+    @property
+    def filename(self):
+        return os.path.join(self.rootdir, COVERAGE_FILENAME)
+
+    def _file_stat(self):
+        try:
+            stat = os.stat(self.filename)
+        except OSError:
+            return None
+
+        return stat.st_mtime, stat.st_size
+
+    def _load(self):
+        stat = self._file_stat()
+        if stat == self._stat:
+            return
+
+        intervals = dict()
+        if stat is not None:
+            try:
+                with open(self.filename) as handle:
+                    content = json.load(handle)
+
+                intervals = {
+                    int(sid): [tuple(interval) for interval in sid_intervals]
+                    for sid, sid_intervals in content['intervals'].items()
+                }
+
+            except (IOError, ValueError, KeyError) as e:
+                log.warn('unable to read the coverage index {}: {}'.format(
+                    self.filename, e
+                ))
+
+        self._intervals = intervals
+        self._stat = stat
+
+    def save(self):
+        ensure_directory(self.rootdir)
+
+        content = dict(
+            intervals={
+                str(sid): [list(interval) for interval in sid_intervals]
+                for sid, sid_intervals in self._intervals.items()
+            }
+        )
+
+        tmp_filename = self.filename + '.tmp'
+        with open(tmp_filename, 'w') as handle:
+            json.dump(content, handle)
+        _replace(tmp_filename, self.filename)
+
+        self._stat = self._file_stat()
+
+    def has_sid(self, sid):
+        self._load()
+        return int(sid) in self._intervals
+
+    def intervals(self, sid):
+        """
+        The ingested intervals of a sid.
+
+        Parameters
+        ----------
+        sid: int
+
+        Returns
+        -------
+        list[tuple[pd.Timestamp, pd.Timestamp]]
+
+        """
+        self._load()
+        return [
+            (pd.Timestamp(start, tz='UTC'), pd.Timestamp(end, tz='UTC'))
+            for start, end in self._intervals.get(int(sid), [])
+        ]
+
+    def add(self, sid, start_dt, end_dt, save=True):
+        """
+        Record an ingested range.
+
+        Parameters
+        ----------
+        sid: int
+        start_dt: pd.Timestamp
+        end_dt: pd.Timestamp
+        save: bool
+            Write the index to its file.
+
+        """
+        self._load()
+
+        start, end = pd.Timestamp(start_dt).value, pd.Timestamp(end_dt).value
+        intervals = []
+        for interval_start, interval_end in self._intervals.get(int(sid), []):
+            if interval_end + self.period < start or \
+                    end + self.period < interval_start:
+                intervals.append((interval_start, interval_end))
+            else:
+                start = min(start, interval_start)
+                end = max(end, interval_end)
+
+        intervals.append((start, end))
+        intervals.sort()
+        self._intervals[int(sid)] = intervals
+
+        if save:
+            self.save()
+
+    def mark_sid(self, sid):
+        # A sid known to the index without any range ingested
+        self._load()
+        self._intervals.setdefault(int(sid), [])
+
+    def covers(self, sid, start_dt, end_dt):
+        """
+        Whether a range was ingested for a sid, without holes.
+
+        Parameters
+        ----------
+        sid: int
+        start_dt: pd.Timestamp
+        end_dt: pd.Timestamp
+
+        Returns
+        -------
+        bool
+
+        """
+        self._load()
+
+        intervals = self._intervals.get(int(sid))
+        if not intervals:
+            return False
+
+        start, end = pd.Timestamp(start_dt).value, pd.Timestamp(end_dt).value
+        index = bisect_right(intervals, (start, float('inf'))) - 1
+        return index >= 0 and intervals[index][1] >= end
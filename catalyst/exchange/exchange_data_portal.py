@@ -4,16 +4,21 @@ import datetime
 import numpy as np
 import pandas as pd
 from catalyst.assets._assets import TradingPair
-from catalyst.constants import LOG_LEVEL, AUTO_INGEST
+from catalyst.constants import LOG_LEVEL
 from catalyst.data.data_portal import DataPortal
 from catalyst.exchange.exchange_bundle import ExchangeBundle
 from catalyst.exchange.exchange_errors import (
     ExchangeRequestError,
     PricingDataNotLoadedError)
+from catalyst.exchange.exchange_history import ExchangeHistoryCache
+from catalyst.exchange.exchange_rollups import RollupHistoryAggregator, \
+    ROLLUP_SIZES
 from catalyst.exchange.utils.exchange_utils import resample_history_df, \
     group_assets_by_exchange
 from catalyst.exchange.utils.datetime_utils import get_frequency, get_start_dt
+from catalyst.utils.calendars.trading_calendar import NANOS_IN_MINUTE
 from logbook import Logger
+from pandas.tseries.frequencies import to_offset
 from redo import retry
 
 log = Logger('DataPortalExchange', level=LOG_LEVEL)
@@ -132,22 +137,22 @@ class DataPortalExchangeBase(DataPortal):
                     exchange_name, assets, field, dt, data_frequency)
 
             else:
-                spot_values = []
+                # The values are returned in the order of the assets
+                asset_values = dict()
                 for exchange_name in exchange_assets:
-                    assets = exchange_assets[exchange_name]
                     exchange_spot_values = self.get_exchange_spot_value(
                         exchange_name,
-                        assets,
+                        exchange_assets[exchange_name],
                         field,
                         dt,
                         data_frequency
                     )
-                    if len(assets) == 1:
-                        spot_values.append(exchange_spot_values)
-                    else:
-                        spot_values += exchange_spot_values
+                    asset_values.update(
+                        zip(exchange_assets[exchange_name],
+                            exchange_spot_values)
+                    )
 
-                return spot_values
+                return [asset_values[asset] for asset in assets]
 
     def get_spot_value(self, assets, field, dt, data_frequency):
         if field == 'price':
@@ -252,11 +257,17 @@ class DataPortalExchangeBacktest(DataPortalExchangeBase):
         super(DataPortalExchangeBacktest, self).__init__(*args, **kwargs)
 
         self.exchange_bundles = dict()
-        self.history_loaders = dict()
-        self.minute_history_loaders = dict()
+        self.history_caches = dict()
+        self.rollup_aggregators = dict()
 
         for name in self.exchange_names:
             self.exchange_bundles[name] = ExchangeBundle(name)
+            self.history_caches[name] = ExchangeHistoryCache(
+                self.exchange_bundles[name]
+            )
+            self.rollup_aggregators[name] = RollupHistoryAggregator(
+                self.exchange_bundles[name]
+            )
 
     def _get_first_trading_day(self, assets):
         first_date = None
@@ -308,29 +319,115 @@ class DataPortalExchangeBacktest(DataPortalExchangeBase):
 
             # read the minute bundles for daily frequency to
             # support last partial candle
-            # TODO: optimize this by applying this logic only for the last day
             if adj_data_frequency == 'daily':
                 adj_data_frequency = 'minute'
                 adj_bar_count = adj_bar_count * 1440
 
+            df = self._get_rollup_history_window(
+                exchange_name, assets, last_dt_for_series, adj_bar_count,
+                freq, field
+            )
+            if df is not None:
+                return df
+
         else:  # data_frequency == "daily":
             last_dt_for_series = end_dt
 
-        series = bundle.get_history_window_series_and_load(
+        algo_end_dt = self._last_available_session
+        if algo_end_dt is not None and adj_data_frequency == 'minute':
+            algo_end_dt = algo_end_dt.replace(hour=23, minute=59)
+
+        df = self.history_caches[exchange_name].get_history_window(
             assets=assets,
             end_dt=last_dt_for_series,
             bar_count=adj_bar_count,
             field=field,
             data_frequency=adj_data_frequency,
-            algo_end_dt=self._last_available_session,
+            algo_end_dt=algo_end_dt,
         )
+        if df is None:
+            series = bundle.get_history_window_series_and_load(
+                assets=assets,
+                end_dt=last_dt_for_series,
+                bar_count=adj_bar_count,
+                field=field,
+                data_frequency=adj_data_frequency,
+                algo_end_dt=self._last_available_session,
+            )
+            df = pd.DataFrame(series)
+
+        # The bundle bars don't need resampling when the requested
+        # frequency is the frequency of the bundle.
+        if candle_size == 1 and (unit, adj_data_frequency) in \
+                [('T', 'minute'), ('D', 'daily')]:
+            return df
 
         start_dt = get_start_dt(last_dt_for_series, adj_bar_count,
                                 adj_data_frequency, False)
-        df = resample_history_df(pd.DataFrame(series), freq, field, start_dt)
+        df = resample_history_df(df, freq, field, start_dt)
 
         return df
 
+    def _get_rollup_history_window(self, exchange_name, assets, end_dt,
+                                   minute_count, freq, field):
+        """
+        The history window of hourly or daily candles in minute mode, from
+        the rollups of the minute bundle.
+
+        Parameters
+        ----------
+        exchange_name: str
+        assets: list[TradingPair]
+        end_dt: datetime
+        minute_count: int
+            The number of minutes of the window.
+        freq: str
+        field: str
+
+        Returns
+        -------
+        DataFrame
+            None if the candles are not made of rollup bars or the minute
+            bundle does not cover the window, to load it like the other
+            windows.
+
+        """
+        freq_minutes = int(to_offset(freq).nanos // NANOS_IN_MINUTE)
+        for frequency in ['daily', 'hourly']:
+            size = ROLLUP_SIZES[frequency]
+            if freq_minutes % size == 0:
+                break
+        else:
+            return None
+
+        # The rollup bars include the first minute of the window, the
+        # candles are anchored on the same day as the minutes.
+        start_dt = get_start_dt(end_dt, minute_count, 'minute', False)
+        delta = pd.Timedelta(minutes=size)
+
+        # The rollups hold the bars ingested, the missing ones are ingested
+        # by the history cache or the bundle
+        bundle = self.exchange_bundles[exchange_name]
+        for asset in assets:
+            if not bundle.range_in_bundle(asset, start_dt, end_dt, 'minute'):
+                return None
+
+        df = self.rollup_aggregators[exchange_name].get_history_window(
+            assets=assets,
+            end_dt=end_dt,
+            bar_count=(end_dt.floor(delta) - start_dt.floor(delta)) //
+            delta + 1,
+            field=field,
+            frequency=frequency,
+        )
+        if df is None:
+            return None
+
+        if freq_minutes == size:
+            return df[df.index >= start_dt]
+
+        return resample_history_df(df, freq, field, start_dt)
+
     def get_exchange_spot_value(self,
                                 exchange_name,
                                 assets,
@@ -365,7 +462,7 @@ class DataPortalExchangeBacktest(DataPortalExchangeBase):
             # (do not include the current minute)
             dt = dt - datetime.timedelta(minutes=1)
 
-        if AUTO_INGEST:
+        if bundle.auto_ingest:
             try:
                 return bundle.get_spot_values(
                     assets, field, dt, data_frequency
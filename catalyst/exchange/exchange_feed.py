@@ -0,0 +1,548 @@
+import json
+import socket
+import time
+from abc import ABCMeta, abstractmethod
+from collections import defaultdict, deque
+from threading import Lock, Thread
+
+from six.moves import socketserver
+
+from catalyst.constants import LOG_LEVEL
+from catalyst.exchange.utils.datetime_utils import from_ms_timestamp
+from logbook import Logger
+
+log = Logger('exchange_feed', level=LOG_LEVEL)
+
+MINUTE_MS = 60000
+
+# The number of trades kept in memory for each symbol.
+TAPE_SIZE = 10000
+
+# The seconds without messages after which the data of a symbol is not
+# served from the feed anymore.
+STALE_AFTER = 30
+
+
+class OrderBook(object):
+    """
+    The order book of a symbol, maintained from snapshots and updates.
+    """
+
+    def __init__(self):
+        self.bids = dict()
+        self.asks = dict()
+        self.timestamp = None
+
+    def apply_snapshot(self, bids, asks, timestamp):
+        self.bids = {float(price): float(amount) for price, amount in bids}
+        self.asks = {float(price): float(amount) for price, amount in asks}
+        self.timestamp = timestamp
+
+    def apply_update(self, bids, asks, timestamp):
+        for side, entries in ((self.bids, bids), (self.asks, asks)):
+            for price, amount in entries:
+                price, amount = float(price), float(amount)
+                if amount == 0:
+                    side.pop(price, None)
+
+                else:
+                    side[price] = amount
+
+        self.timestamp = timestamp
+
+    def to_dict(self, limit=None):
+        """
+        The order book in the CCXT format.
+
+        Parameters
+        ----------
+        limit: int
+
+        Returns
+        -------
+        dict[str, Object]
+
+        """
+        bids = sorted(self.bids.items(), reverse=True)
+        asks = sorted(self.asks.items())
+        if limit is not None:
+            bids, asks = bids[:limit], asks[:limit]
+
+        return dict(
+            bids=[list(entry) for entry in bids],
+            asks=[list(entry) for entry in asks],
+            timestamp=self.timestamp,
+        )
+
+
+class CandleBuilder(object):
+    """
+    Aggregates the trades of a symbol into minute candles.
+    """
+
+    def __init__(self, size=1440):
+        self.current = None
+        self.closed = deque(maxlen=size)
+
+    def add_trade(self, timestamp, price, amount):
+        minute = timestamp - timestamp % MINUTE_MS
+        self.close(minute)
+
+        if self.current is None:
+            self.current = dict(
+                timestamp=minute,
+                open=price,
+                high=price,
+                low=price,
+                close=price,
+                volume=amount,
+            )
+
+        else:
+            self.current['high'] = max(self.current['high'], price)
+            self.current['low'] = min(self.current['low'], price)
+            self.current['close'] = price
+            self.current['volume'] += amount
+
+    def close(self, minute):
+        """
+        Close the current candle if it started before the specified minute.
+
+        Parameters
+        ----------
+        minute: int
+            The start of a minute in milliseconds.
+
+        """
+        if self.current is not None and self.current['timestamp'] < minute:
+            self.closed.append(self.current)
+            self.current = None
+
+
+class MarketFeed(object):
+    """
+    The base class of the push market data feeds.
+
+    A feed receives normalized messages and maintains the order book, the
+    trade tape and the minute candles of each symbol in memory. The
+    listeners added by the clocks are notified as soon as a minute closes.
+
+    The messages are dictionaries with a `type`, a `symbol` and a
+    `timestamp` in milliseconds:
+        snapshot, book: `bids` and `asks` lists of [price, amount], a zero
+            amount removes a price level from the book on update.
+        trade: `price`, `amount` and `side`.
+        ticker: `volume`, the volume of the last 24 hours in the base
+            currency.
+        heartbeat: only advances the time of the feed.
+
+    Subclasses connect to a source of messages and pass them to
+    `on_message`.
+
+    Parameters
+    ----------
+    tape_size: int
+        The number of trades kept for each symbol.
+
+    """
+    __metaclass__ = ABCMeta
+
+    def __init__(self, tape_size=TAPE_SIZE):
+        self.symbols = set()
+        self.books = defaultdict(OrderBook)
+        self.tapes = defaultdict(lambda: deque(maxlen=tape_size))
+        self.candles = defaultdict(CandleBuilder)
+        self.volumes = dict()
+
+        self.closed_minute = None
+        self._minute = None
+        self._updated = dict()
+        self._first = dict()
+        self._listeners = []
+        self._lock = Lock()
+
+    @abstractmethod
+    def start(self):
+        pass
+
+    @abstractmethod
+    def stop(self):
+        pass
+
+    def subscribe(self, symbols):
+        self.symbols.update(symbols)
+
+    def add_bar_listener(self, event):
+        """
+        Set the specified event whenever a minute closes.
+
+        Parameters
+        ----------
+        event: threading.Event
+
+        """
+        self._listeners.append(event)
+
+    def on_message(self, message):
+        """
+        Apply a normalized message.
+
+        Parameters
+        ----------
+        message: dict[str, Object]
+
+        """
+        msg_type = message['type']
+        timestamp = message['timestamp']
+        symbol = message.get('symbol')
+
+        with self._lock:
+            if msg_type == 'snapshot':
+                self.books[symbol].apply_snapshot(
+                    message['bids'], message['asks'], timestamp
+                )
+
+            elif msg_type == 'book':
+                self.books[symbol].apply_update(
+                    message['bids'], message['asks'], timestamp
+                )
+
+            elif msg_type == 'trade':
+                price = float(message['price'])
+                amount = float(message['amount'])
+                self.tapes[symbol].append(dict(
+                    timestamp=timestamp,
+                    price=price,
+                    amount=amount,
+                    side=message.get('side'),
+                ))
+                self.candles[symbol].add_trade(timestamp, price, amount)
+
+            elif msg_type == 'ticker':
+                self.volumes[symbol] = float(message['volume'])
+
+            elif msg_type != 'heartbeat':
+                log.warn('unknown feed message type: {}'.format(msg_type))
+                return
+
+            if symbol is not None:
+                self._updated[symbol] = time.time()
+                self._first.setdefault(symbol, timestamp)
+
+            closed = self._advance(timestamp)
+
+        if closed:
+            for event in self._listeners:
+                event.set()
+
+    def _advance(self, timestamp):
+        # The messages of a stream are in chronological order, the first
+        # message of a minute closes the candles of the previous ones.
+        minute = timestamp - timestamp % MINUTE_MS
+        if self._minute is not None and minute > self._minute:
+            for builder in self.candles.values():
+                builder.close(minute)
+
+            self.closed_minute = from_ms_timestamp(minute - MINUTE_MS)
+            self._minute = minute
+            return True
+
+        if self._minute is None:
+            self._minute = minute
+
+        return False
+
+    def is_live(self, symbol):
+        """
+        Whether the feed received data for the symbol recently.
+
+        Parameters
+        ----------
+        symbol: str
+
+        Returns
+        -------
+        bool
+
+        """
+        updated = self._updated.get(symbol)
+        return updated is not None and time.time() - updated < STALE_AFTER
+
+    def get_ticker(self, symbol):
+        """
+        The ticker of the symbol in the CCXT format, with the fields added
+        by CCXT.tickers.
+
+        Parameters
+        ----------
+        symbol: str
+
+        Returns
+        -------
+        dict[str, Object]
+            The ticker, None if the feed did not receive both trades and
+            volume for the symbol or is not live.
+
+        """
+        with self._lock:
+            tape = self.tapes.get(symbol)
+            if not tape or symbol not in self.volumes \
+                    or not self.is_live(symbol):
+                return None
+
+            trade = tape[-1]
+            book = self.books.get(symbol)
+            bids = book.bids if book is not None else dict()
+            asks = book.asks if book is not None else dict()
+
+            return dict(
+                symbol=symbol,
+                timestamp=trade['timestamp'],
+                last=trade['price'],
+                last_price=trade['price'],
+                last_traded=from_ms_timestamp(trade['timestamp']),
+                bid=max(bids) if bids else None,
+                ask=min(asks) if asks else None,
+                baseVolume=self.volumes[symbol],
+                volume=self.volumes[symbol],
+            )
+
+    def get_order_book(self, symbol, limit=None):
+        """
+        The order book of the symbol in the CCXT format.
+
+        Parameters
+        ----------
+        symbol: str
+        limit: int
+
+        Returns
+        -------
+        dict[str, Object]
+            The order book, None if the feed did not receive a snapshot
+            for the symbol or is not live.
+
+        """
+        with self._lock:
+            book = self.books.get(symbol)
+            if book is None or book.timestamp is None \
+                    or not self.is_live(symbol):
+                return None
+
+            return book.to_dict(limit)
+
+    def get_trades(self, symbol, since=None):
+        """
+        The trades of the symbol in the tape.
+
+        Parameters
+        ----------
+        symbol: str
+        since: int
+            Only the trades from this timestamp in milliseconds.
+
+        Returns
+        -------
+        list[dict[str, Object]]
+
+        """
+        with self._lock:
+            tape = self.tapes.get(symbol, [])
+            return [
+                trade for trade in tape
+                if since is None or trade['timestamp'] >= since
+            ]
+
+    def may_have_filled(self, symbol, limit, is_buy, since):
+        """
+        Whether a limit order may have been filled according to the trades
+        of the tape.
+
+        Parameters
+        ----------
+        symbol: str
+        limit: float
+        is_buy: bool
+        since: int
+            The time of the order in milliseconds.
+
+        Returns
+        -------
+        bool
+            False only if the tape covers the life of the order and none
+            of its trades reached the limit price.
+
+        """
+        with self._lock:
+            first = self._first.get(symbol)
+            if first is None or first > since or not self.is_live(symbol):
+                return True
+
+            tape = self.tapes.get(symbol, deque())
+            if tape and len(tape) == tape.maxlen \
+                    and tape[0]['timestamp'] > since:
+                return True
+
+            for trade in reversed(tape):
+                if trade['timestamp'] < since:
+                    break
+
+                if (is_buy and trade['price'] <= limit) or \
+                        (not is_buy and trade['price'] >= limit):
+                    return True
+
+            return False
+
+    def get_candles(self, symbol):
+        """
+        The closed minute candles of the symbol.
+
+        Parameters
+        ----------
+        symbol: str
+
+        Returns
+        -------
+        list[dict[str, Object]]
+
+        """
+        with self._lock:
+            return list(self.candles[symbol].closed) \
+                if symbol in self.candles else []
+
+
+class StreamFeed(MarketFeed):
+    """
+    A feed reading JSON messages, one per line, from a TCP socket.
+
+    Parameters
+    ----------
+    host: str
+    port: int
+
+    """
+
+    def __init__(self, host, port, *args, **kwargs):
+        super(StreamFeed, self).__init__(*args, **kwargs)
+        self.host = host
+        self.port = port
+        self.connected = False
+
+        self._socket = None
+        self._thread = None
+
+    def start(self):
+        self._socket = socket.create_connection((self.host, self.port))
+        self.connected = True
+
+        self._thread = Thread(target=self._read)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        if self._socket is not None:
+            try:
+                self._socket.shutdown(socket.SHUT_RDWR)
+
+            except socket.error:
+                pass
+
+            self._socket.close()
+
+        if self._thread is not None:
+            self._thread.join()
+
+    def join(self, timeout=None):
+        """
+        Wait until the source closes the stream.
+
+        Parameters
+        ----------
+        timeout: float
+
+        """
+        self._thread.join(timeout)
+
+    def _read(self):
+        stream = self._socket.makefile('r')
+        try:
+            for line in stream:
+                line = line.strip()
+                if line:
+                    self.on_message(json.loads(line))
+
+        except (socket.error, ValueError) as e:
+            log.warn('feed {}:{} interrupted: {}'.format(
+                self.host, self.port, e
+            ))
+
+        finally:
+            stream.close()
+            self.connected = False
+
+
+class ReplayServer(object):
+    """
+    A local server replaying recorded feed messages to the StreamFeed
+    clients, for testing.
+
+    Parameters
+    ----------
+    messages: list[dict[str, Object]]
+        The recorded messages in chronological order.
+    speed: float
+        The replay speed relative to the message timestamps, sent as fast
+        as possible if None.
+    host: str
+    port: int
+        The port to listen on, any free port if 0.
+
+    """
+
+    def __init__(self, messages, speed=None, host='127.0.0.1', port=0):
+        self.messages = messages
+        self.speed = speed
+
+        server = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                server.replay(self.wfile)
+
+        self._server = socketserver.ThreadingTCPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @classmethod
+    def from_file(cls, filename, **kwargs):
+        with open(filename) as f:
+            messages = [json.loads(line) for line in f if line.strip()]
+
+        return cls(messages, **kwargs)
+
+    @property
+    def address(self):
+        return self._server.server_address
+
+    def replay(self, stream):
+        previous = None
+        for message in self.messages:
+            if self.speed is not None and previous is not None:
+                delay = (message['timestamp'] - previous) / 1000.0
+                if delay > 0:
+                    time.sleep(delay / self.speed)
+
+            previous = message['timestamp']
+            stream.write((json.dumps(message) + '\n').encode('utf-8'))
+            stream.flush()
+
+    def start(self):
+        self._thread = Thread(target=self._server.serve_forever)
+        self._thread.daemon = True
+        self._thread.start()
+
+        return self.address
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
@@ -0,0 +1,239 @@
+import numpy as np
+import pandas as pd
+from catalyst.constants import LOG_LEVEL
+from catalyst.exchange.exchange_errors import PricingDataNotLoadedError, \
+    NoDataAvailableOnExchange, DataCorruptionError, PricingDataValueError
+from catalyst.exchange.utils.datetime_utils import get_delta
+from logbook import Logger
+
+log = Logger('exchange_history', level=LOG_LEVEL)
+
+# The number of bars read beyond the end of a window when loading a block.
+PREFETCH_BARS = dict(minute=10080, daily=365)
+
+BLOCK_LOAD_ERRORS = (
+    PricingDataNotLoadedError,
+    NoDataAvailableOnExchange,
+    DataCorruptionError,
+    PricingDataValueError,
+)
+
+
+class HistoryBlock(object):
+    """
+    The values of one field for a set of assets over a contiguous range of
+    periods, as read from an exchange bundle.
+
+    Parameters
+    ----------
+    assets: list[TradingPair]
+    index: DatetimeIndex
+    values: np.ndarray
+        An array of shape (len(index), len(assets)). It is made read-only
+        since it is shared by all the windows sliced from the block.
+    version: int
+        The ingestion version of the bundle when the block was read.
+
+    """
+
+    def __init__(self, assets, index, values, version):
+        self.assets = assets
+        self.index = index
+        self.values = values
+        self.values.setflags(write=False)
+        self.version = version
+        self._positions = {asset: i for i, asset in enumerate(assets)}
+
+    def window(self, assets, start_dt, end_dt):
+        """
+        The values of the specified assets between two dates.
+
+        Parameters
+        ----------
+        assets: list[TradingPair]
+        start_dt: pd.Timestamp
+        end_dt: pd.Timestamp
+
+        Returns
+        -------
+        DataFrame
+            A copy of the values of the block, which the caller is free to
+            modify, None if the block does not cover the request.
+
+        """
+        if len(self.index) == 0 or start_dt < self.index[0] \
+                or end_dt > self.index[-1]:
+            return None
+
+        try:
+            columns = [self._positions[asset] for asset in assets]
+        except KeyError:
+            return None
+
+        start = self.index.searchsorted(start_dt)
+        end = self.index.searchsorted(end_dt, side='right')
+
+        # Fancy indexing already copies the values, a slice must be copied
+        # to leave the block untouched.
+        first = columns[0]
+        if columns == list(range(first, first + len(columns))):
+            values = self.values[start:end, first:first + len(columns)].copy()
+        else:
+            values = self.values[start:end, columns]
+
+        return pd.DataFrame(
+            values, index=self.index[start:end], columns=assets, copy=False
+        )
+
+
+class ExchangeHistoryCache(object):
+    """
+    Rolling history windows for the assets of an exchange bundle.
+
+    Each (field, data_frequency) pair holds a single block of values for
+    all the assets requested so far. The blocks are read ahead of the
+    requested windows, so that consecutive bars of a backtest are sliced
+    from memory instead of being read from the bundle again.
+
+    Parameters
+    ----------
+    bundle: ExchangeBundle
+    prefetch: dict[str, int]
+        The number of bars to read ahead by data frequency.
+
+    """
+
+    def __init__(self, bundle, prefetch=None):
+        self.bundle = bundle
+        self.prefetch = prefetch if prefetch is not None else PREFETCH_BARS
+        self._blocks = dict()
+
+    def clear(self):
+        self._blocks.clear()
+
+    def get_history_window(self, assets, end_dt, bar_count, field,
+                           data_frequency, algo_end_dt=None):
+        """
+        A history window served from the cache, loading a new block
+        if needed.
+
+        Parameters
+        ----------
+        assets: list[TradingPair]
+        end_dt: pd.Timestamp
+        bar_count: int
+        field: str
+        data_frequency: str
+        algo_end_dt: pd.Timestamp
+            The data is never read ahead of this date.
+
+        Returns
+        -------
+        DataFrame
+            The window, None if it can't be served from the bundle as is.
+
+        """
+        try:
+            start_dt, _ = self.bundle.get_adj_dates(
+                end_dt - get_delta(bar_count - 1, data_frequency),
+                end_dt,
+                assets,
+                data_frequency
+            )
+        except NoDataAvailableOnExchange:
+            return None
+
+        key = (field, data_frequency)
+        block = self._blocks.get(key)
+        if block is not None and block.version != self.bundle.version:
+            del self._blocks[key]
+            block = None
+
+        df = block.window(assets, start_dt, end_dt) \
+            if block is not None else None
+
+        if df is None:
+            block = self._load_block(
+                block, assets, start_dt, end_dt, field, data_frequency,
+                algo_end_dt
+            )
+            if block is None:
+                return None
+
+            self._blocks[key] = block
+            df = block.window(assets, start_dt, end_dt)
+
+        # Same coverage check as range_in_bundle, missing bars are left to
+        # the bundle to ingest.
+        if df is None or df.empty or (field != 'volume' and (
+                np.isnan(df.values[0]).any() or
+                np.isnan(df.values[-1]).any())):
+            return None
+
+        return df
+
+    def _load_block(self, block, assets, start_dt, end_dt, field,
+                    data_frequency, algo_end_dt):
+        assets = list(assets)
+        block_assets = list(assets)
+        if block is not None:
+            block_assets += [
+                asset for asset in block.assets if asset not in assets
+            ]
+
+        block_end_dt = end_dt + get_delta(
+            self.prefetch.get(data_frequency, 0), data_frequency
+        )
+        if algo_end_dt is not None:
+            block_end_dt = min(block_end_dt, algo_end_dt)
+
+        for asset in block_assets:
+            if data_frequency == 'minute':
+                asset_end_dt = asset.end_minute.replace(hour=23, minute=59) \
+                    if asset.end_minute is not None else None
+            else:
+                asset_end_dt = asset.end_daily
+
+            if asset_end_dt is not None:
+                block_end_dt = min(block_end_dt, asset_end_dt)
+
+        block_end_dt = max(block_end_dt, end_dt)
+
+        # Falling back to the requested window alone if the block can't be
+        # read, for instance when an asset is delisted.
+        attempts = [(block_assets, block_end_dt)]
+        if block_assets != assets or block_end_dt != end_dt:
+            attempts.append((assets, end_dt))
+
+        version = self.bundle.version
+        for attempt_assets, attempt_end_dt in attempts:
+            delta = attempt_end_dt - start_dt
+            bar_count = int(
+                delta.total_seconds() //
+                get_delta(1, data_frequency).total_seconds()
+            ) + 1
+
+            try:
+                series = self.bundle.get_history_window_series(
+                    assets=attempt_assets,
+                    end_dt=attempt_end_dt,
+                    bar_count=bar_count,
+                    field=field,
+                    data_frequency=data_frequency,
+                )
+            except BLOCK_LOAD_ERRORS as e:
+                log.debug('unable to load history block: {}'.format(e))
+                continue
+
+            index = series[attempt_assets[0]].index
+            values = np.column_stack(
+                [series[asset].values for asset in attempt_assets]
+            )
+            log.debug(
+                'loaded {} history block of {} bars for {} assets'.format(
+                    field, len(index), len(attempt_assets)
+                )
+            )
+            return HistoryBlock(attempt_assets, index, values, version)
+
+        return None
@@ -0,0 +1,302 @@
+import os
+import pickle
+import struct
+import zlib
+
+from catalyst.constants import (
+    LOG_LEVEL,
+    JOURNAL_SNAPSHOT_INTERVAL,
+    JOURNAL_FSYNC_INTERVAL,
+)
+from catalyst.finance.performance import PerformanceTracker
+from catalyst.utils.paths import ensure_directory
+from logbook import Logger
+
+log = Logger('exchange_journal', level=LOG_LEVEL)
+
+# The length and the CRC32 checksum of the payload of a record.
+RECORD_HEADER = struct.Struct('>II')
+
+SNAPSHOT_FILE = 'snapshot.p'
+JOURNAL_FILE = 'journal.bin'
+
+_replace = getattr(os, 'replace', os.rename)
+
+
+def _fsync_directory(folder):
+    # Persists the renames of the directory entries, not supported on
+    # all platforms.
+    try:
+        fd = os.open(folder, os.O_RDONLY)
+
+    except OSError:
+        return
+
+    try:
+        os.fsync(fd)
+
+    except OSError:
+        pass
+
+    finally:
+        os.close(fd)
+
+
+class StateJournal(object):
+    """
+    A write-ahead journal of the state of a live algorithm.
+
+    The state is kept in a snapshot, rewritten atomically from time to
+    time, and in the journal of the changes applied since the snapshot.
+    Each record of the journal is a pickled object prefixed by its length
+    and its checksum, a record torn by a crash is discarded on recovery.
+
+    Snapshots and records carry a sequence number so that the records
+    already compacted into a snapshot are never replayed, even if the
+    process stops between the snapshot and the truncation of the journal.
+
+    Parameters
+    ----------
+    folder: str
+    snapshot_interval: int
+        The number of records after which a snapshot is due.
+    fsync_interval: int
+        The number of records written between two fsync calls.
+
+    """
+
+    def __init__(self, folder, snapshot_interval=JOURNAL_SNAPSHOT_INTERVAL,
+                 fsync_interval=JOURNAL_FSYNC_INTERVAL):
+        self.folder = folder
+        self.snapshot_interval = snapshot_interval
+        self.fsync_interval = fsync_interval
+
+        self.seq = 0
+        self.records = 0
+
+        self._file = None
+        self._unsynced = 0
+
+    @property
+    def snapshot_filename(self):
+        return os.path.join(self.folder, SNAPSHOT_FILE)
+
+    @property
+    def journal_filename(self):
+        return os.path.join(self.folder, JOURNAL_FILE)
+
+    @property
+    def needs_snapshot(self):
+        return self.records >= self.snapshot_interval
+
+    def recover(self):
+        """
+        Read the snapshot and the records journaled after it.
+
+        Returns
+        -------
+        snapshot: Object
+            The last snapshot, None if there is no snapshot.
+        records: list[Object]
+            The records to apply to the snapshot, in order.
+
+        """
+        ensure_directory(self.folder)
+
+        snapshot_seq = 0
+        snapshot = None
+        if os.path.isfile(self.snapshot_filename):
+            with open(self.snapshot_filename, 'rb') as handle:
+                snapshot_seq, snapshot = pickle.load(handle)
+
+        records = []
+        valid_size = 0
+        if os.path.isfile(self.journal_filename):
+            with open(self.journal_filename, 'rb') as handle:
+                while True:
+                    header = handle.read(RECORD_HEADER.size)
+                    if len(header) < RECORD_HEADER.size:
+                        break
+
+                    size, checksum = RECORD_HEADER.unpack(header)
+                    payload = handle.read(size)
+                    if len(payload) < size or \
+                            zlib.crc32(payload) & 0xffffffff != checksum:
+                        break
+
+                    valid_size = handle.tell()
+
+                    seq, record = pickle.loads(payload)
+                    if seq > snapshot_seq:
+                        records.append(record)
+
+                    self.seq = max(self.seq, seq)
+
+            if valid_size < os.path.getsize(self.journal_filename):
+                log.warn('discarding the incomplete end of the journal: '
+                         '{}'.format(self.journal_filename))
+                with open(self.journal_filename, 'r+b') as handle:
+                    handle.truncate(valid_size)
+
+        self.seq = max(self.seq, snapshot_seq)
+        self.records = len(records)
+
+        log.debug('recovered {} journal records after snapshot {}'.format(
+            len(records), snapshot_seq
+        ))
+        return snapshot, records
+
+    def append(self, record):
+        """
+        Write a record to the journal.
+
+        The record is flushed to the OS immediately and synced to the disk
+        every `fsync_interval` records.
+
+        Parameters
+        ----------
+        record: Object
+
+        """
+        if self._file is None:
+            ensure_directory(self.folder)
+            self._file = open(self.journal_filename, 'ab')
+
+        self.seq += 1
+        payload = pickle.dumps(
+            (self.seq, record), protocol=pickle.HIGHEST_PROTOCOL
+        )
+        self._file.write(RECORD_HEADER.pack(
+            len(payload), zlib.crc32(payload) & 0xffffffff
+        ))
+        self._file.write(payload)
+        self._file.flush()
+
+        self.records += 1
+        self._unsynced += 1
+        if self._unsynced >= self.fsync_interval:
+            self.sync()
+
+    def save_snapshot(self, snapshot):
+        """
+        Replace the snapshot atomically and truncate the journal.
+
+        Parameters
+        ----------
+        snapshot: Object
+            The state including the changes of all the records.
+
+        """
+        ensure_directory(self.folder)
+
+        tmp_filename = self.snapshot_filename + '.tmp'
+        with open(tmp_filename, 'wb') as handle:
+            pickle.dump(
+                (self.seq, snapshot), handle,
+                protocol=pickle.HIGHEST_PROTOCOL
+            )
+            handle.flush()
+            os.fsync(handle.fileno())
+
+        _replace(tmp_filename, self.snapshot_filename)
+        _fsync_directory(self.folder)
+
+        if self._file is not None:
+            self._file.close()
+
+        self._file = open(self.journal_filename, 'wb')
+        self._unsynced = 0
+        self.records = 0
+
+    def sync(self):
+        if self._file is not None and self._unsynced:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._unsynced = 0
+
+    def close(self):
+        if self._file is not None:
+            self.sync()
+            self._file.close()
+            self._file = None
+
+
+class JournaledPerformanceTracker(PerformanceTracker):
+    """
+    A PerformanceTracker keeping the events it processes until they are
+    written to the journal.
+
+    The events are applied again by `replay` on recovery.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(JournaledPerformanceTracker, self).__init__(*args, **kwargs)
+        self.journal_events = []
+
+    def process_transaction(self, transaction):
+        super(JournaledPerformanceTracker, self).process_transaction(
+            transaction
+        )
+        self.journal_events.append(('transaction', transaction))
+
+    def process_order(self, event):
+        super(JournaledPerformanceTracker, self).process_order(event)
+        self.journal_events.append(('order', event))
+
+    def process_commission(self, commission):
+        super(JournaledPerformanceTracker, self).process_commission(
+            commission
+        )
+        self.journal_events.append(('commission', commission))
+
+    def update_position(self, asset, amount, last_sale_date,
+                        last_sale_price):
+        """
+        Update a position synchronized with the exchange.
+
+        Parameters
+        ----------
+        asset: TradingPair
+        amount: float
+        last_sale_date: Timestamp
+        last_sale_price: float
+
+        """
+        position = dict(
+            asset=asset,
+            amount=amount,
+            last_sale_date=last_sale_date,
+            last_sale_price=last_sale_price,
+        )
+        self.position_tracker.update_position(**position)
+        self.journal_events.append(('position', position))
+
+    def pop_journal_events(self):
+        events, self.journal_events = self.journal_events, []
+        return events
+
+    def replay(self, events):
+        """
+        Apply the events of a journal record.
+
+        Parameters
+        ----------
+        events: list[tuple[str, Object]]
+
+        """
+        tracker = super(JournaledPerformanceTracker, self)
+        for kind, event in events:
+            if kind == 'transaction':
+                tracker.process_transaction(event)
+
+            elif kind == 'order':
+                tracker.process_order(event)
+
+            elif kind == 'commission':
+                tracker.process_commission(event)
+
+            elif kind == 'position':
+                self.position_tracker.update_position(**event)
+
+            else:
+                log.warn('unknown journal event: {}'.format(kind))
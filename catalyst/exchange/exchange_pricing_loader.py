@@ -11,23 +11,37 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from lru import LRU
+
 from catalyst.constants import LOG_LEVEL
 from catalyst.data.us_equity_pricing import BcolzDailyBarReader
 from catalyst.errors import NoFurtherDataError
-from catalyst.exchange.utils.factory import get_exchange
+from catalyst.exchange.exchange_bundle import ExchangeBundle
 from catalyst.lib.adjusted_array import AdjustedArray
 from catalyst.pipeline.data import DataSet, Column
 from catalyst.pipeline.loaders.base import PipelineLoader
 from catalyst.utils.calendars import get_calendar
+from catalyst.utils.memoize import lazyval
 from catalyst.utils.numpy_utils import float64_dtype
 from logbook import Logger
 from numpy import (
+    concatenate,
+    empty,
+    full,
     iinfo,
+    nan,
     uint32,
 )
 
 UINT32_MAX = iinfo(uint32).max
 
+# The number of sessions (or minutes) of a block of the cache, the blocks
+# are aligned on the calendar so that the overlapping windows of the
+# successive pipeline chunks share them.
+BLOCK_SIZE = 256
+# The number of blocks of a column kept in memory.
+BLOCK_CACHE_SIZE = 128
+
 log = Logger('ExchangePriceLoader', level=LOG_LEVEL)
 
 
@@ -46,30 +60,39 @@ class ExchangePricingLoader(PipelineLoader):
     """
     PipelineLoader for Crypto Pricing data
 
-    Delegates loading of baselines and adjustments.
+    The assets are grouped by exchange and each group is read from the
+    bundle of its exchange. The arrays read are cached by blocks of
+    consecutive sessions for each exchange and column, and by version of
+    the bundle so that the blocks read before an ingestion are not
+    served again.
     """
 
     def __init__(self, data_frequency):
 
-        cal = get_calendar('OPEN')
-
-        if data_frequency == 'daily':
-            reader = None
-            all_sessions = cal.all_sessions
-
-        elif data_frequency == 'minute':
-            reader = None
-            all_sessions = cal.all_minutes
-
-        else:
+        if data_frequency not in ('daily', 'minute'):
             raise ValueError(
                 'Invalid data frequency: {}'.format(data_frequency)
             )
 
         self.data_frequency = data_frequency
-        self.raw_price_loader = reader
+        self.raw_price_loader = None
         self._columns = TradingPairPricing.columns
-        self._all_sessions = all_sessions
+
+        self._bundles = dict()
+        # The version of the bundle of each exchange when its reader was
+        # last requested
+        self._reader_versions = dict()
+        self._blocks = LRU(BLOCK_CACHE_SIZE)
+
+    @lazyval
+    def _all_sessions(self):
+        # The minutes of the calendar are only built by the first minute
+        # pipeline, not when the loader is created
+        cal = get_calendar('OPEN')
+        if self.data_frequency == 'daily':
+            return cal.all_sessions
+
+        return cal.all_minutes
 
     @classmethod
     def from_files(cls, pricing_path):
@@ -102,20 +125,29 @@ class ExchangePricingLoader(PipelineLoader):
                 'Pipeline cannot load data with eligible assets.'
             )
 
-        exchange_names = []
-        for asset in assets:
-            if asset.exchange not in exchange_names:
-                exchange_names.append(asset.exchange)
+        start_idx = self._all_sessions.get_loc(start_date)
+        end_idx = self._all_sessions.get_loc(end_date)
 
-        exchange = get_exchange(exchange_names[0])
-        reader = exchange.bundle.get_reader(self.data_frequency)
+        # The positions of the assets in the output, by exchange
+        groups = dict()
+        for index, asset in enumerate(assets):
+            groups.setdefault(asset.exchange, []).append(index)
 
-        raw_arrays = reader.load_raw_arrays(
-            colnames,
-            start_date,
-            end_date,
-            assets,
-        )
+        raw_arrays = [
+            empty((end_idx - start_idx + 1, len(assets)))
+            for _ in colnames
+        ]
+        for exchange_name in groups:
+            indexes = groups[exchange_name]
+            group_arrays = self._load_exchange_arrays(
+                exchange_name,
+                colnames,
+                start_idx,
+                end_idx,
+                [assets[index] for index in indexes],
+            )
+            for raw, group_raw in zip(raw_arrays, group_arrays):
+                raw[:, indexes] = group_raw
 
         out = {}
         for c, c_raw in zip(columns, raw_arrays):
@@ -131,6 +163,162 @@ class ExchangePricingLoader(PipelineLoader):
     def columns(self):
         return self._columns
 
+    def get_bundle(self, exchange_name):
+        """
+        The bundle of an exchange, created once per exchange.
+
+        Parameters
+        ----------
+        exchange_name: str
+
+        Returns
+        -------
+        ExchangeBundle
+
+        """
+        if exchange_name not in self._bundles:
+            self._bundles[exchange_name] = ExchangeBundle(exchange_name)
+
+        return self._bundles[exchange_name]
+
+    def get_reader(self, exchange_name):
+        """
+        The bundle reader of an exchange.
+
+        Parameters
+        ----------
+        exchange_name: str
+
+        Returns
+        -------
+        BcolzExchangeBarReader
+            None if the exchange has no bundle for the data frequency.
+
+        """
+        bundle = self.get_bundle(exchange_name)
+        reader = bundle.get_reader(self.data_frequency)
+
+        # The reader fixes the bars available when it is opened, it is
+        # opened again once data was ingested, possibly by another
+        # instance of the bundle.
+        version = bundle.version
+        if reader is not None \
+                and self._reader_versions.get(exchange_name, version) \
+                != version:
+            bundle._readers.pop(reader._rootdir, None)
+            reader = bundle.get_reader(self.data_frequency)
+
+        self._reader_versions[exchange_name] = version
+        return reader
+
+    def _load_exchange_arrays(self, exchange_name, colnames, start_idx,
+                              end_idx, assets):
+        """
+        The raw arrays of the assets of an exchange, assembled from the
+        blocks of the cache.
+
+        Parameters
+        ----------
+        exchange_name: str
+        colnames: list[str]
+        start_idx: int
+            The position of the first session in the calendar.
+        end_idx: int
+            The position of the last session in the calendar.
+        assets: list[TradingPair]
+
+        Returns
+        -------
+        list[np.ndarray]
+            An array of shape (end_idx - start_idx + 1, len(assets)) for
+            each column.
+
+        """
+        sids = tuple(asset.sid for asset in assets)
+        first_block = start_idx // BLOCK_SIZE
+        last_block = end_idx // BLOCK_SIZE
+
+        blocks = [
+            self._load_block(exchange_name, colnames, block, sids, assets)
+            for block in range(first_block, last_block + 1)
+        ]
+
+        offset = start_idx - first_block * BLOCK_SIZE
+        arrays = []
+        for column_blocks in zip(*blocks):
+            array = concatenate(column_blocks) \
+                if len(column_blocks) > 1 else column_blocks[0]
+            arrays.append(array[offset:offset + end_idx - start_idx + 1])
+
+        return arrays
+
+    def _load_block(self, exchange_name, colnames, block, sids, assets):
+        """
+        The arrays of a block of sessions, read from the bundle for the
+        columns which are not cached.
+
+        Returns
+        -------
+        list[np.ndarray]
+            An array of shape (BLOCK_SIZE, len(assets)) for each column,
+            shorter for the last block of the calendar.
+
+        """
+        # The blocks of the previous versions of the bundle are never
+        # requested again and leave the cache as it fills up.
+        version = self.get_bundle(exchange_name).version
+
+        arrays = dict()
+        for name in colnames:
+            key = (exchange_name, version, name, block, sids)
+            if key in self._blocks:
+                arrays[name] = self._blocks[key]
+
+        missing = [name for name in colnames if name not in arrays]
+        if missing:
+            block_start = block * BLOCK_SIZE
+            block_end = min(block_start + BLOCK_SIZE, len(self._all_sessions))
+
+            for name in missing:
+                arrays[name] = full(
+                    (block_end - block_start, len(sids)), _fill_value(name)
+                )
+
+            reader = self.get_reader(exchange_name)
+            if reader is None:
+                log.warn(
+                    'no {} bundle for {}, the pipeline has no data for '
+                    'its assets'.format(self.data_frequency, exchange_name)
+                )
+            else:
+                # Only the sessions of the block in the bundle are read
+                start_dt = max(
+                    self._all_sessions[block_start], reader.first_trading_day
+                )
+                end_dt = min(
+                    self._all_sessions[block_end - 1],
+                    reader.last_available_dt,
+                )
+                if start_dt <= end_dt:
+                    start = self._all_sessions.searchsorted(start_dt) - \
+                        block_start
+                    raw_arrays = reader.load_raw_arrays(
+                        missing, start_dt, end_dt, assets
+                    )
+                    for name, raw in zip(missing, raw_arrays):
+                        arrays[name][start:start + len(raw)] = raw
+
+            for name in missing:
+                self._blocks[(exchange_name, version, name, block, sids)] = \
+                    arrays[name]
+
+        return [arrays[name] for name in colnames]
+
+
+def _fill_value(column_name):
+    # The value of the bars missing from the bundle
+    return 0.0 if column_name == 'volume' else nan
+
 
 def _shift_dates(dates, start_date, end_date, shift):
     try:
@@ -0,0 +1,349 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from catalyst.data.minute_bars import _sid_subdir_path
+from catalyst.data.resample import DailyHistoryAggregator
+from catalyst.utils.paths import ensure_directory
+
+# The hourly and daily bars of the minute bundle, next to the bcolz tables
+ROLLUP_FOLDER = 'rollups'
+
+# The number of minutes in a bar of each rollup
+ROLLUP_SIZES = dict(hourly=60, daily=1440)
+
+ROLLUP_FIELDS = ['open', 'high', 'low', 'close', 'volume']
+
+
+def get_rollup_path(rootdir, frequency, sid, field):
+    """
+    The file of the rollup bars of a field for a sid.
+
+    Parameters
+    ----------
+    rootdir: str
+    frequency: str
+        'hourly' or 'daily'
+    sid: int
+    field: str
+
+    Returns
+    -------
+    str
+
+    """
+    sid_subdir = os.path.splitext(_sid_subdir_path(int(sid)))[0]
+    return os.path.join(
+        rootdir, ROLLUP_FOLDER, frequency, sid_subdir, '{}.dat'.format(field)
+    )
+
+
+def aggregate_bars(cols, size):
+    """
+    Roll the minute bars up into bars of the specified size.
+
+    The values are the unsigned integers of the bcolz tables, zero when
+    there is no bar.
+
+    Parameters
+    ----------
+    cols: dict[str, np.ndarray]
+        The minute values of each field, in complete bars of the size.
+    size: int
+        The number of minutes in a bar.
+
+    Returns
+    -------
+    dict[str, np.ndarray]
+
+    """
+    rows = len(cols['close']) // size
+    index = np.arange(rows)
+
+    out = dict()
+    for field in ROLLUP_FIELDS:
+        values = cols[field].reshape(rows, size)
+        traded = values != 0
+
+        if field == 'open':
+            out[field] = values[index, traded.argmax(axis=1)]
+
+        elif field == 'close':
+            last = size - 1 - traded[:, ::-1].argmax(axis=1)
+            out[field] = values[index, last]
+
+        elif field == 'high':
+            out[field] = values.max(axis=1)
+
+        elif field == 'low':
+            lows = np.where(traded, values, np.iinfo(np.uint64).max) \
+                .min(axis=1)
+            out[field] = np.where(traded.any(axis=1), lows, 0) \
+                .astype(np.uint64)
+
+        else:
+            out[field] = values.sum(axis=1)
+
+    return out
+
+
+def write_rollups(rootdir, sid, table, from_idx):
+    """
+    Update the rollups of a sid from the minute bars written from a
+    position of its table.
+
+    The rollups of the sids ingested before them are built from their
+    first bar.
+
+    Parameters
+    ----------
+    rootdir: str
+    sid: int
+    table: bcolz.ctable
+    from_idx: int
+
+    """
+    for frequency, size in ROLLUP_SIZES.items():
+        close_path = get_rollup_path(rootdir, frequency, sid, 'close')
+        rollup_len = os.path.getsize(close_path) // 8 \
+            if os.path.isfile(close_path) else 0
+
+        # The bar including from_idx may have been partially rolled up
+        start = min(from_idx // size, rollup_len)
+        end = -(-len(table) // size)
+        if end <= start:
+            continue
+
+        cols = dict()
+        for field in ROLLUP_FIELDS:
+            values = np.zeros((end - start) * size, dtype=np.uint64)
+            minutes = table[field][start * size:]
+            values[:len(minutes)] = minutes
+            cols[field] = values
+
+        bars = aggregate_bars(cols, size)
+        for field in ROLLUP_FIELDS:
+            filename = get_rollup_path(rootdir, frequency, sid, field)
+            ensure_directory(os.path.dirname(filename))
+
+            values = bars[field].astype(np.uint64)
+            mode = 'r+b' if os.path.isfile(filename) else 'wb'
+            with open(filename, mode) as handle:
+                handle.seek(start * values.itemsize)
+                handle.write(values.tobytes())
+
+
+def truncate_rollups(rootdir, size_for_day):
+    """
+    Zero the rollup bars after the specified number of minutes.
+
+    The files are not truncated, they may be mapped by readers.
+
+    Parameters
+    ----------
+    rootdir: str
+    size_for_day: int
+        The number of minutes to keep.
+
+    """
+    itemsize = np.dtype(np.uint64).itemsize
+    for frequency, size in ROLLUP_SIZES.items():
+        folder = os.path.join(rootdir, ROLLUP_FOLDER, frequency)
+        keep = -(-size_for_day // size) * itemsize
+
+        for dirpath, _, filenames in os.walk(folder):
+            for filename in filenames:
+                path = os.path.join(dirpath, filename)
+                extra = os.path.getsize(path) - keep
+                if extra > 0:
+                    with open(path, 'r+b') as handle:
+                        handle.seek(keep)
+                        handle.write(b'\0' * extra)
+
+
+class RollupHistoryAggregator(object):
+    """
+    History windows of hourly or daily candles of the minute bundle, for
+    minute simulations.
+
+    The complete candles are read from the rollups of the bundle and only
+    the minutes of the last candle are aggregated, the daily ones with a
+    DailyHistoryAggregator updated from one minute to the next.
+
+    Parameters
+    ----------
+    bundle: ExchangeBundle
+
+    """
+
+    def __init__(self, bundle):
+        self.bundle = bundle
+
+        self._reader = None
+        self._daily_aggregator = None
+        self._arrays = dict()
+
+    def _get_reader(self):
+        reader = self.bundle.get_reader('minute')
+        if reader is not self._reader:
+            self._reader = reader
+            self._daily_aggregator = None
+            self._arrays = dict()
+
+        return reader
+
+    def _get_array(self, frequency, sid, field, end_idx):
+        key = (frequency, sid, field)
+
+        values = self._arrays.get(key)
+        if values is None or len(values) <= end_idx:
+            # Mapped again when the rollup was extended
+            filename = get_rollup_path(
+                self._reader._rootdir, frequency, sid, field
+            )
+            if not os.path.isfile(filename) or \
+                    os.path.getsize(filename) == 0:
+                return None
+
+            values = self._arrays[key] = np.memmap(
+                filename, dtype=np.uint64, mode='r'
+            )
+
+        return values if len(values) > end_idx else None
+
+    def load_rollup_arrays(self, frequency, field, sids, start_dt, end_dt):
+        """
+        The rollup bars of the sids from start_dt to end_dt.
+
+        Parameters
+        ----------
+        frequency: str
+        field: str
+        sids: list[int]
+        start_dt: pd.Timestamp
+        end_dt: pd.Timestamp
+
+        Returns
+        -------
+        np.ndarray
+            The values with shape (bars, sids), None when a sid has no
+            rollup covering the range.
+
+        """
+        reader = self._get_reader()
+        if reader is None or start_dt < reader.first_trading_day:
+            return None
+
+        size = ROLLUP_SIZES[frequency]
+        start_idx = reader._find_position_of_minute(start_dt) // size
+        end_idx = reader._find_position_of_minute(end_dt) // size
+
+        inverse_ratios = reader._ohlc_ratio_inverses_for_sids(sids)
+        fill = 0.0 if field == 'volume' else np.nan
+
+        out = np.full((end_idx - start_idx + 1, len(sids)), fill)
+        for index, sid in enumerate(sids):
+            closes = self._get_array(frequency, sid, 'close', end_idx)
+            values = self._get_array(frequency, sid, field, end_idx)
+            if closes is None or values is None:
+                return None
+
+            # Like in the bundle, the bars without close are not traded
+            traded = closes[start_idx:end_idx + 1] != 0
+            out[traded, index] = \
+                values[start_idx:end_idx + 1][traded] * inverse_ratios[index]
+
+        return out
+
+    def _partial_bar(self, assets, field, frequency, start_dt, end_dt):
+        reader = self._reader
+        if frequency == 'daily':
+            if self._daily_aggregator is None:
+                calendar = self.bundle.calendar
+                self._daily_aggregator = DailyHistoryAggregator(
+                    calendar.schedule.market_open, reader, calendar
+                )
+
+            method = dict(
+                open='opens', high='highs', low='lows', close='closes',
+                volume='volumes',
+            )[field]
+            return np.array(
+                getattr(self._daily_aggregator, method)(assets, end_dt),
+                dtype=np.float64,
+            )
+
+        values = reader.load_raw_arrays(
+            [field], start_dt, end_dt, [asset.sid for asset in assets]
+        )[0]
+        if field == 'volume':
+            return values.sum(axis=0)
+
+        out = np.full(len(assets), np.nan)
+        for index in range(len(assets)):
+            traded = values[~np.isnan(values[:, index]), index]
+            if len(traded) == 0:
+                continue
+
+            if field == 'open':
+                out[index] = traded[0]
+            elif field == 'high':
+                out[index] = traded.max()
+            elif field == 'low':
+                out[index] = traded.min()
+            else:
+                out[index] = traded[-1]
+
+        return out
+
+    def get_history_window(self, assets, end_dt, bar_count, field,
+                           frequency):
+        """
+        The hourly or daily candles ending with the candle of end_dt,
+        truncated to end_dt.
+
+        Parameters
+        ----------
+        assets: list[TradingPair]
+        end_dt: pd.Timestamp
+            The last minute of the window.
+        bar_count: int
+        field: str
+        frequency: str
+            'hourly' or 'daily'
+
+        Returns
+        -------
+        DataFrame
+            None if the rollups do not include the window.
+
+        """
+        reader = self._get_reader()
+        if reader is None:
+            return None
+
+        delta = pd.Timedelta(minutes=ROLLUP_SIZES[frequency])
+        last_dt = end_dt.floor(delta)
+        index = pd.date_range(
+            last_dt - delta * (bar_count - 1), last_dt, freq=delta
+        )
+
+        values = np.empty((len(index), len(assets)))
+        if bar_count > 1:
+            arrays = self.load_rollup_arrays(
+                frequency,
+                field,
+                [asset.sid for asset in assets],
+                index[0],
+                index[-2],
+            )
+            if arrays is None:
+                return None
+
+            values[:-1] = arrays
+
+        values[-1] = self._partial_bar(
+            assets, field, frequency, last_dt, end_dt
+        )
+        return pd.DataFrame(values, index=index, columns=assets)
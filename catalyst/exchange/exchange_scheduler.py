@@ -0,0 +1,312 @@
+import copy
+import heapq
+import itertools
+import time
+from collections import defaultdict
+from threading import Condition, Event, Lock
+
+from catalyst.constants import LOG_LEVEL
+from logbook import Logger
+
+log = Logger('exchange_scheduler', level=LOG_LEVEL)
+
+# Lower values are sent first when requests are waiting for the rate limit.
+PRIORITY_TRADING = 0
+PRIORITY_ACCOUNT = 1
+PRIORITY_MARKET_DATA = 2
+
+REQUEST_PRIORITIES = dict(
+    create_order=PRIORITY_TRADING,
+    cancel_order=PRIORITY_TRADING,
+    fetch_balance=PRIORITY_ACCOUNT,
+    fetch_order=PRIORITY_ACCOUNT,
+    fetch_orders=PRIORITY_ACCOUNT,
+    fetch_open_orders=PRIORITY_ACCOUNT,
+    fetch_closed_orders=PRIORITY_ACCOUNT,
+    fetch_my_trades=PRIORITY_ACCOUNT,
+)
+
+# The seconds during which no request is sent after being rate limited.
+RATE_LIMITED_BACKOFF = 10
+
+
+class EndpointMetrics(object):
+    """
+    The request statistics of an endpoint.
+    """
+
+    def __init__(self):
+        self.requests = 0
+        self.merged = 0
+        self.errors = 0
+        self.rate_limited = 0
+        self.latency = 0.0
+        self.queue_time = 0.0
+
+    def to_dict(self):
+        return dict(
+            requests=self.requests,
+            merged=self.merged,
+            errors=self.errors,
+            rate_limited=self.rate_limited,
+            avg_latency=self.latency / self.requests
+            if self.requests else None,
+            avg_queue_time=self.queue_time / self.requests
+            if self.requests else None,
+            rate_limited_rate=float(self.rate_limited) / self.requests
+            if self.requests else None,
+        )
+
+
+class _InFlightRequest(object):
+    def __init__(self):
+        self.done = Event()
+        self.result = None
+        self.error = None
+        self.followers = 0
+
+
+class TokenBucket(object):
+    """
+    The request budget of an exchange.
+
+    The bucket is refilled at the rate limit of the exchange. When it is
+    empty, the waiting requests acquire the next tokens by priority.
+
+    Parameters
+    ----------
+    rate_limit: float
+        The minimum interval between requests in milliseconds.
+    burst: int
+        The number of requests which can be sent without waiting.
+
+    """
+
+    def __init__(self, rate_limit, burst=1):
+        self.rate = 1000.0 / rate_limit if rate_limit else float('inf')
+        self.burst = burst
+
+        self._condition = Condition(Lock())
+        self._tokens = float(burst)
+        self._refill_time = time.time()
+        self._paused_until = 0
+        self._waiting = []
+        self._sequence = itertools.count()
+
+    def _refill(self, now):
+        elapsed = now - self._refill_time
+        self._refill_time = now
+        if elapsed > 0:
+            self._tokens = min(
+                self.burst, self._tokens + elapsed * self.rate
+            )
+
+    def acquire(self, priority=PRIORITY_MARKET_DATA):
+        """
+        Wait for a token.
+
+        Parameters
+        ----------
+        priority: int
+
+        """
+        with self._condition:
+            ticket = (priority, next(self._sequence))
+            heapq.heappush(self._waiting, ticket)
+
+            while True:
+                timeout = None
+                if self._waiting[0] == ticket:
+                    now = time.time()
+                    self._refill(now)
+
+                    if now < self._paused_until:
+                        timeout = self._paused_until - now
+
+                    elif self._tokens >= 1:
+                        self._tokens -= 1
+                        heapq.heappop(self._waiting)
+                        self._condition.notify_all()
+                        return
+
+                    else:
+                        timeout = (1 - self._tokens) / self.rate
+
+                self._condition.wait(timeout)
+
+    def pause(self, seconds):
+        """
+        Hold the tokens for the specified duration, after the exchange
+        rejected a request for exceeding its rate limit.
+
+        Parameters
+        ----------
+        seconds: float
+
+        """
+        with self._condition:
+            self._tokens = 0
+            self._paused_until = time.time() + seconds
+            self._condition.notify_all()
+
+
+token_buckets = dict()
+token_buckets_lock = Lock()
+
+
+def get_token_bucket(exchange_name, rate_limit, burst=1):
+    """
+    The token bucket shared by the clients of an exchange.
+
+    Parameters
+    ----------
+    exchange_name: str
+    rate_limit: float
+    burst: int
+
+    Returns
+    -------
+    TokenBucket
+
+    """
+    with token_buckets_lock:
+        if exchange_name not in token_buckets:
+            token_buckets[exchange_name] = TokenBucket(rate_limit, burst)
+
+        return token_buckets[exchange_name]
+
+
+class RequestScheduler(object):
+    """
+    Sends the requests of an exchange client within its rate limit.
+
+    The requests draw from the token bucket of the exchange, sending
+    trading requests first, then account and market data requests.
+    Identical read requests made while one of them is in flight share its
+    result.
+
+    Parameters
+    ----------
+    api: Object
+        The exchange client, a CCXT exchange for instance.
+    bucket: TokenBucket
+    rate_limit_errors: tuple[type]
+        The errors raised by the client when the exchange rejects a request
+        for exceeding its rate limit.
+
+    """
+
+    def __init__(self, api, bucket, rate_limit_errors=()):
+        self.api = api
+        self.bucket = bucket
+        self.rate_limit_errors = rate_limit_errors
+
+        self._in_flight = dict()
+        self._in_flight_lock = Lock()
+
+        self._metrics = defaultdict(EndpointMetrics)
+
+    def _send(self, method, args, kwargs, priority):
+        metrics = self._metrics[method]
+
+        start = time.time()
+        self.bucket.acquire(priority)
+        sent = time.time()
+
+        try:
+            return getattr(self.api, method)(*args, **kwargs)
+
+        except self.rate_limit_errors as e:
+            log.warn(
+                '{} rate limited, pausing requests for {}s: {}'.format(
+                    method, RATE_LIMITED_BACKOFF, e
+                )
+            )
+            metrics.rate_limited += 1
+            metrics.errors += 1
+            self.bucket.pause(RATE_LIMITED_BACKOFF)
+            raise
+
+        except Exception:
+            metrics.errors += 1
+            raise
+
+        finally:
+            metrics.requests += 1
+            metrics.queue_time += sent - start
+            metrics.latency += time.time() - sent
+
+    def call(self, method, *args, **kwargs):
+        """
+        Call a method of the exchange client once the rate limit allows it.
+
+        Parameters
+        ----------
+        method: str
+            The name of the method, `fetch_ticker` for instance.
+        args:
+        kwargs:
+
+        Returns
+        -------
+        Object
+            The result of the method.
+
+        """
+        priority = REQUEST_PRIORITIES.get(method, PRIORITY_MARKET_DATA)
+        if priority == PRIORITY_TRADING:
+            return self._send(method, args, kwargs, priority)
+
+        key = (method, repr(args), repr(sorted(kwargs.items())))
+        with self._in_flight_lock:
+            request = self._in_flight.get(key)
+            is_owner = request is None
+            if is_owner:
+                request = self._in_flight[key] = _InFlightRequest()
+
+            else:
+                request.followers += 1
+
+        if not is_owner:
+            request.done.wait()
+            self._metrics[method].merged += 1
+
+            if request.error is not None:
+                raise request.error
+
+            return copy.deepcopy(request.result)
+
+        try:
+            request.result = self._send(method, args, kwargs, priority)
+
+        except Exception as e:
+            request.error = e
+            raise
+
+        finally:
+            with self._in_flight_lock:
+                del self._in_flight[key]
+
+            request.done.set()
+
+        # The results are mutable, each caller gets its own copy when the
+        # request was merged.
+        if request.followers:
+            return copy.deepcopy(request.result)
+
+        return request.result
+
+    @property
+    def metrics(self):
+        """
+        The request statistics by endpoint.
+
+        Returns
+        -------
+        dict[str, dict[str, Object]]
+
+        """
+        return {
+            method: metrics.to_dict()
+            for method, metrics in self._metrics.items()
+        }
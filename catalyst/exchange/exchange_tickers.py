@@ -0,0 +1,107 @@
+import time
+
+from catalyst.constants import TICKER_TTL
+
+
+class TickerSnapshot(object):
+    """
+    The tickers of an exchange fetched in the current bar.
+
+    All the consumers of the bar, the portfolio synchronization and
+    `data.current` for instance, read the same tickers instead of
+    requesting them again. The snapshot is cleared when the clock moves
+    forward.
+
+    Parameters
+    ----------
+    ttl: float
+        The seconds after which a ticker is stale, even in the same bar.
+    watch_bars: int
+        The number of bars during which an asset stays watched after
+        its last request.
+
+    """
+
+    def __init__(self, ttl=TICKER_TTL, watch_bars=3):
+        self.ttl = ttl
+        self.watch_bars = watch_bars
+        self.dt = None
+        # The bar in which each watched asset was last requested
+        self.watched = dict()
+        self._bar = 0
+        self._tickers = dict()
+
+    def advance(self, dt):
+        """
+        Move the snapshot to the specified bar.
+
+        Parameters
+        ----------
+        dt: pd.Timestamp
+
+        """
+        if self.dt is None or dt > self.dt:
+            self._tickers.clear()
+            self._bar += 1
+
+            for asset in list(self.watched):
+                if self._bar - self.watched[asset] > self.watch_bars:
+                    del self.watched[asset]
+
+        self.dt = dt
+
+    def watch(self, assets):
+        """
+        Mark assets as requested in the current bar, their tickers are
+        refreshed along with the next requests.
+
+        Parameters
+        ----------
+        assets: list[TradingPair]
+
+        """
+        for asset in assets:
+            self.watched[asset] = self._bar
+
+    def get(self, asset, now=None):
+        """
+        The ticker of the asset if fresh.
+
+        Parameters
+        ----------
+        asset: TradingPair
+        now: float
+
+        Returns
+        -------
+        dict[str, Object]
+            The ticker or None if missing or stale.
+
+        """
+        if asset not in self._tickers:
+            return None
+
+        fetched_time, ticker = self._tickers[asset]
+        if now is None:
+            now = time.time()
+
+        if now - fetched_time > self.ttl:
+            return None
+
+        return ticker
+
+    def update(self, tickers, now=None):
+        """
+        Add fetched tickers to the snapshot.
+
+        Parameters
+        ----------
+        tickers: dict[TradingPair, dict[str, Object]]
+        now: float
+
+        """
+        if now is None:
+            now = time.time()
+
+        for asset in tickers:
+            self._tickers[asset] = (now, tickers[asset])
@@ -0,0 +1,92 @@
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from threading import Event
+
+import pandas as pd
+from catalyst.constants import LOG_LEVEL
+from catalyst.exchange.simple_clock import SimpleClock
+from catalyst.gens.sim_engine import (
+    BAR,
+    SESSION_START,
+    SESSION_END,
+)
+from logbook import Logger
+
+log = Logger('StreamingClock', level=LOG_LEVEL)
+
+
+class StreamingClock(SimpleClock):
+    """Realtime clock driven by market data feeds.
+
+    A bar is emitted as soon as a feed closes a minute, instead of
+    polling the wall clock. When the feeds stay silent, the bar of the
+    current minute is emitted `fallback_delay` seconds after it starts,
+    like the SimpleClock would.
+
+    :param:`feeds` are the MarketFeed instances of the exchanges.
+    """
+
+    def __init__(self, sessions, feeds, time_skew=pd.Timedelta("0s"),
+                 start=None, end=None, fallback_delay=5):
+        super(StreamingClock, self).__init__(
+            sessions, time_skew=time_skew, start=start, end=end
+        )
+        self.feeds = feeds
+        self.fallback_delay = pd.Timedelta(seconds=fallback_delay)
+
+        self._bar_closed = Event()
+        for feed in feeds:
+            feed.add_bar_listener(self._bar_closed)
+
+    def _next_bar(self, current_time):
+        closed_minutes = [
+            feed.closed_minute for feed in self.feeds
+            if feed.closed_minute is not None
+        ]
+        bar_dt = max(closed_minutes) + pd.Timedelta(minutes=1) \
+            if closed_minutes else None
+
+        current_minute = current_time.floor('1 min')
+        if (bar_dt is None or bar_dt < current_minute) and \
+                current_time - current_minute >= self.fallback_delay:
+            bar_dt = current_minute
+
+        if bar_dt is not None and \
+                (self._last_emit is None or bar_dt > self._last_emit):
+            return bar_dt
+
+        return None
+
+    def __iter__(self):
+        self.handle_late_start()
+        yield pd.Timestamp.utcnow(), SESSION_START
+
+        while True:
+            current_time = pd.Timestamp.utcnow()
+            current_minute = current_time.floor('1 min')
+
+            if self.end is not None and current_minute >= self.end:
+                break
+
+            self._bar_closed.clear()
+            bar_dt = self._next_bar(current_time)
+            if bar_dt is not None:
+                log.debug('emitting streamed bar: {}'.format(bar_dt))
+
+                self._last_emit = bar_dt
+                yield bar_dt, BAR
+            else:
+                self._bar_closed.wait(1)
+
+        yield current_minute, SESSION_END
@@ -5,6 +5,7 @@ import pickle
 import shutil
 from datetime import date, datetime
 
+import numpy as np
 import pandas as pd
 from catalyst.assets._assets import TradingPair
 from six import string_types
@@ -785,20 +786,112 @@ def transform_candles_to_df(candles):
     return pd.DataFrame(candles).set_index('last_traded')
 
 
+def get_candle_arrays(candles):
+    """
+    Columnar OHLCV arrays from a list of candles.
+
+    Parameters
+    ----------
+    candles: list[dict[str, Object]]
+
+    Returns
+    -------
+    dict[str, Object]
+        The values of each OHLCV field in a float64 array and the
+        timestamps of the candles in a DatetimeIndex, under `last_traded`.
+
+    """
+    arrays = dict(
+        last_traded=pd.DatetimeIndex(
+            [candle['last_traded'] for candle in candles]
+        )
+    )
+    for field in ['open', 'high', 'low', 'close', 'volume']:
+        arrays[field] = np.array(
+            [candle[field] for candle in candles], dtype=np.float64
+        )
+
+    return arrays
+
+
+def forward_fill_arrays(arrays, periods):
+    """
+    Align columnar candles to the specified periods, forward filling
+    the periods without candles like forward_fill_df_if_needed.
+
+    Parameters
+    ----------
+    arrays: dict[str, Object]
+    periods: DatetimeIndex
+
+    Returns
+    -------
+    dict[str, np.ndarray]
+
+    """
+    positions = periods.get_indexer(arrays['last_traded'])
+    found = positions >= 0
+
+    aligned = dict()
+    for field in ['open', 'high', 'low', 'close', 'volume']:
+        values = np.full(len(periods), np.nan)
+        values[positions[found]] = arrays[field][found]
+        aligned[field] = values
+
+    # volume should always be 0 (if there were no trades in this interval)
+    aligned['volume'][np.isnan(aligned['volume'])] = 0.0
+
+    # ie pull the last close into this close
+    close = aligned['close']
+    last_valid = np.where(~np.isnan(close), np.arange(len(close)), 0)
+    np.maximum.accumulate(last_valid, out=last_valid)
+    aligned['close'] = close = close[last_valid]
+
+    # now copy the close that was pulled down from the last timestep
+    # into this row, across into o/h/l
+    for field in ['open', 'high', 'low']:
+        values = aligned[field]
+        missing = np.isnan(values)
+        values[missing] = close[missing]
+
+    return aligned
+
+
 def get_candles_df(candles, field, freq, bar_count, end_dt):
-    all_series = dict()
+    """
+    A DataFrame of a field of the specified candles, aligned to the
+    `bar_count` periods ending at `end_dt`.
+
+    Parameters
+    ----------
+    candles: dict[TradingPair, dict[str, Object] | list[dict[str, Object]]]
+        The candles of each asset, as columnar arrays or a list of
+        candles.
+    field: str
+    freq: str
+    bar_count: int
+    end_dt: pd.Timestamp
+
+    Returns
+    -------
+    DataFrame
+
+    """
+    rounded_end_dt = end_dt.floor(freq)
+    periods = pd.date_range(end=rounded_end_dt,
+                            periods=bar_count,
+                            freq=freq)
 
-    for asset in candles:
-        asset_df = transform_candles_to_df(candles[asset])
-        rounded_end_dt = end_dt.floor(freq)
-        periods = pd.date_range(end=rounded_end_dt,
-                                periods=bar_count,
-                                freq=freq)
-        asset_df = forward_fill_df_if_needed(asset_df, periods)
+    assets = list(candles)
+    values = np.empty((len(periods), len(assets)))
+    for index, asset in enumerate(assets):
+        arrays = candles[asset]
+        if not isinstance(arrays, dict):
+            arrays = get_candle_arrays(arrays)
 
-        all_series[asset] = pd.Series(asset_df[field])
+        values[:, index] = forward_fill_arrays(arrays, periods)[field]
 
-    df = pd.DataFrame(all_series)
+    df = pd.DataFrame(values, index=periods, columns=assets)
     df.dropna(inplace=True)
 
     return df
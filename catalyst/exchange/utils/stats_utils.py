@@ -15,6 +15,9 @@ from operator import itemgetter
 s3_conn = []
 mailgun = []
 
+# The number of rows kept in memory by the stats buffers of live algos.
+STATS_CAPACITY = 1440 * 4
+
 
 def trend_direction(series):
     if series[-1] is np.nan or series[-1] is np.nan:
@@ -172,67 +175,73 @@ def set_position_row(row, asset, asset_values=list()):
     return asset_cols
 
 
-def prepare_stats(stats, recorded_cols=list()):
+def flatten_period_stats(period_stats, recorded_cols=None):
     """
-    Prepare the stats DataFrame for user-friendly output.
+    The output rows of the stats of a period, one per asset.
 
     Parameters
     ----------
-    stats: list[Object]
+    period_stats: dict[str, Object]
     recorded_cols: list[str]
 
     Returns
     -------
+    list[dict[str, Object]]
+        The rows, copies of the period stats with the asset columns.
+    list[str]
+        The asset columns.
 
     """
-    asset_cols = list()
+    assets = [p['sid'] for p in period_stats['positions']]
 
-    stats = copy.deepcopy(stats)
-    # Using a copy since we are adding rows inside the loop.
-    for row_index, row_data in enumerate(list(stats)):
-        assets = [p['sid'] for p in row_data['positions']]
+    asset_values = dict()
+    if recorded_cols is not None:
+        for column in recorded_cols[:]:
+            value = period_stats[column]
+            if isinstance(value, pd.Series):
+                value = value.to_dict()
 
-        asset_values = dict()
-        if recorded_cols is not None:
-            for column in recorded_cols[:]:
-                value = row_data[column]
-                if isinstance(value, pd.Series):
-                    value = value.to_dict()
+            if type(value) is dict:
+                for asset in value:
+                    if not isinstance(asset, TradingPair):
+                        break
 
-                if type(value) is dict:
-                    for asset in value:
-                        if not isinstance(asset, TradingPair):
-                            break
+                    if asset not in assets:
+                        assets.append(asset)
 
-                        if asset not in assets:
-                            assets.append(asset)
+                    if asset not in asset_values:
+                        asset_values[asset] = dict()
 
-                        if asset not in asset_values:
-                            asset_values[asset] = dict()
+                    asset_values[asset][column] = value[asset]
 
-                        asset_values[asset][column] = value[asset]
+    if not assets:
+        return [copy.copy(period_stats)], list()
 
-        if len(assets) == 1:
-            row = stats[row_index]
-            asset_cols = set_position_row(row, assets[0], asset_values)
+    rows = []
+    asset_cols = list()
+    for asset in assets:
+        row = copy.copy(period_stats)
+        asset_cols = set_position_row(row, asset, asset_values)
+        rows.append(row)
 
-        elif len(assets) > 1:
-            for asset_index, asset in enumerate(assets):
-                if asset_index > 0:
-                    row = copy.deepcopy(row_data)
-                    stats.append(row)
+    return rows, asset_cols
 
-                else:
-                    row = stats[row_index]
 
-                asset_cols = set_position_row(row, assets[asset_index],
-                                              asset_values)
+def get_stats_columns(recorded_cols, asset_cols):
+    """
+    The index and value columns of the stats output.
 
-    df = pd.DataFrame(stats)
-    df['orders'] = df['orders'].apply(lambda orders: len(orders))
-    df['transactions'] = df['transactions'].apply(
-        lambda transactions: len(transactions)
-    )
+    Parameters
+    ----------
+    recorded_cols: list[str]
+    asset_cols: list[str]
+
+    Returns
+    -------
+    list[str]
+    list[str]
+
+    """
     index_cols = [
         'period_close', 'starting_cash', 'ending_cash', 'portfolio_value',
         'pnl', 'long_exposure', 'short_exposure', 'orders', 'transactions',
@@ -245,12 +254,49 @@ def prepare_stats(stats, recorded_cols=list()):
             index_cols.append(column)
 
     if asset_cols:
-        columns = asset_cols
-        df.set_index(index_cols, drop=True, inplace=True)
+        return index_cols, list(asset_cols)
 
     else:
-        columns = index_cols
+        columns = list(index_cols)
         columns.remove('period_close')
+        return ['period_close'], columns
+
+
+def prepare_stats(stats, recorded_cols=list()):
+    """
+    Prepare the stats DataFrame for user-friendly output.
+
+    Parameters
+    ----------
+    stats: list[Object]
+    recorded_cols: list[str]
+
+    Returns
+    -------
+
+    """
+    asset_cols = list()
+
+    rows = []
+    for row_data in stats:
+        period_rows, period_asset_cols = flatten_period_stats(
+            row_data, recorded_cols
+        )
+        rows += period_rows
+        if period_asset_cols:
+            asset_cols = period_asset_cols
+
+    df = pd.DataFrame(rows)
+    df['orders'] = df['orders'].apply(lambda orders: len(orders))
+    df['transactions'] = df['transactions'].apply(
+        lambda transactions: len(transactions)
+    )
+    index_cols, columns = get_stats_columns(recorded_cols, asset_cols)
+
+    if asset_cols:
+        df.set_index(index_cols, drop=True, inplace=True)
+
+    else:
         df.set_index('period_close', drop=False, inplace=True)
 
     df.dropna(axis=1, how='all', inplace=True)
@@ -259,6 +305,173 @@ def prepare_stats(stats, recorded_cols=list()):
     return df, columns
 
 
+class StatsBuffer(object):
+    """
+    An append-only columnar buffer of the period stats of a live algo.
+
+    The output columns of each period are stored in preallocated ring
+    arrays, so that appending a period and rendering the last periods
+    don't depend on the number of periods already recorded.
+
+    Parameters
+    ----------
+    capacity: int
+        The number of rows kept in memory.
+
+    """
+
+    def __init__(self, capacity=STATS_CAPACITY):
+        self.capacity = capacity
+        self.recorded_cols = None
+        self.asset_cols = list()
+
+        self.rows = 0
+        self.periods = 0
+        self.version = 0
+
+        self._arrays = dict()
+        self._periods = np.empty(capacity, dtype=np.int64)
+
+        # The progress of append_stats_to_algo_folder
+        self.csv_state = None
+
+    def _set_value(self, column, position, value):
+        array = self._arrays.get(column)
+        if array is None:
+            dtype = np.float64 if isinstance(value, numbers.Number) \
+                and not isinstance(value, bool) else object
+            array = self._arrays[column] = np.full(
+                self.capacity, np.nan, dtype=dtype
+            )
+
+        elif array.dtype != object and not (
+                isinstance(value, numbers.Number) or value is None):
+            array = self._arrays[column] = array.astype(object)
+
+        array[position] = np.nan if value is None else value
+
+    def append(self, period_stats, recorded_cols=None):
+        """
+        Add the stats of a period.
+
+        Parameters
+        ----------
+        period_stats: dict[str, Object]
+        recorded_cols: list[str]
+
+        """
+        rows, asset_cols = flatten_period_stats(period_stats, recorded_cols)
+
+        if recorded_cols != self.recorded_cols:
+            self.recorded_cols = \
+                list(recorded_cols) if recorded_cols is not None else None
+            self.version += 1
+
+        new_cols = [col for col in asset_cols if col not in self.asset_cols]
+        if new_cols:
+            self.asset_cols += new_cols
+            self.version += 1
+
+        index_cols, columns = self.columns
+        output_cols = index_cols + columns
+        for row in rows:
+            position = self.rows % self.capacity
+            for column in output_cols:
+                value = row.get(column)
+                if column in ('orders', 'transactions'):
+                    value = len(value) if value is not None else 0
+
+                self._set_value(column, position, value)
+
+            # Clearing the values left in this slot by the previous rows
+            for column in self._arrays:
+                if column not in output_cols:
+                    self._set_value(column, position, None)
+
+            self._periods[position] = self.periods
+            self.rows += 1
+
+        self.periods += 1
+
+    @property
+    def columns(self):
+        """
+        The index and value columns of the output.
+
+        Returns
+        -------
+        list[str]
+        list[str]
+
+        """
+        return get_stats_columns(self.recorded_cols, self.asset_cols)
+
+    def to_frame(self, start=None, periods=None):
+        """
+        The buffered rows in a flat DataFrame.
+
+        Parameters
+        ----------
+        start: int
+            The first row, by number of rows appended. The oldest row in
+            memory if None.
+        periods: int
+            Only the rows of the last periods if specified.
+
+        Returns
+        -------
+        DataFrame
+
+        """
+        first = max(0, self.rows - self.capacity)
+        if start is not None:
+            if start < first:
+                raise ValueError(
+                    'row {} is not in the buffer anymore'.format(start)
+                )
+
+            first = start
+
+        positions = np.arange(first, self.rows) % self.capacity
+        if periods is not None:
+            positions = positions[
+                self._periods[positions] >= self.periods - periods
+            ]
+
+        index_cols, columns = self.columns
+        return pd.DataFrame(
+            {col: self._arrays[col][positions]
+             for col in index_cols + columns if col in self._arrays},
+            columns=[col for col in index_cols + columns
+                     if col in self._arrays],
+        )
+
+    def tail(self, periods):
+        """
+        The rows of the last periods formatted like prepare_stats.
+
+        Parameters
+        ----------
+        periods: int
+
+        Returns
+        -------
+        DataFrame
+        list[str]
+
+        """
+        df = self.to_frame(periods=periods)
+        index_cols, columns = self.columns
+        if self.asset_cols:
+            df.set_index(index_cols, drop=True, inplace=True)
+
+        else:
+            df.set_index('period_close', drop=False, inplace=True)
+
+        df.dropna(axis=1, how='all', inplace=True)
+        return df, [col for col in columns if col in df.columns]
+
+
 def set_print_settings():
     pd.set_option('display.expand_frame_repr', False)
     pd.set_option('precision', 8)
@@ -284,6 +497,11 @@ def get_pretty_stats(stats, recorded_cols=None, num_rows=10, show_tail=True):
     str
 
     """
+    if isinstance(stats, StatsBuffer):
+        df, columns = stats.tail(num_rows)
+        set_print_settings()
+        return df.to_string(columns=columns)
+
     if isinstance(stats, pd.DataFrame):
         stats = list(stats.T.to_dict().values())
         stats.sort(key=itemgetter('period_close'))
@@ -429,6 +647,66 @@ def stats_to_algo_folder(stats, algo_namespace,
     return bytes_to_write
 
 
+def append_stats_to_algo_folder(stats, algo_namespace, folder_name):
+    """
+    Appends the new rows of a stats buffer to the CSV file of the day in
+    the algo local folder.
+
+    The file is only rewritten when the columns change or when a new
+    file is started.
+
+    Parameters
+    ----------
+    stats: StatsBuffer
+    algo_namespace: str
+    folder_name: str
+
+    Returns
+    -------
+    str
+        The path of the file.
+
+    """
+    timestr = time.strftime('%Y%m%d')
+    folder = get_algo_folder(algo_namespace)
+
+    stats_folder = os.path.join(folder, folder_name)
+    ensure_directory(stats_folder)
+
+    filename = os.path.join(stats_folder, '{}.csv'.format(timestr))
+
+    state = stats.csv_state
+    index_cols, columns = stats.columns
+    header = index_cols + columns
+
+    if state is None or state['filename'] != filename \
+            or not os.path.exists(filename):
+        # A new file, starting with the rows in memory
+        df = stats.to_frame().reindex(columns=header)
+        df.to_csv(filename, index=False, quoting=csv.QUOTE_NONNUMERIC)
+
+    else:
+        start = max(state['rows'], stats.rows - stats.capacity)
+        df = stats.to_frame(start=start).reindex(columns=header)
+        if state['header'] != header:
+            # Rewriting the previous rows with the new columns
+            previous = pd.read_csv(filename).reindex(columns=header)
+            df = pd.concat([previous, df], ignore_index=True)
+            df.to_csv(filename, index=False, quoting=csv.QUOTE_NONNUMERIC)
+
+        else:
+            df.to_csv(
+                filename,
+                mode='a',
+                header=False,
+                index=False,
+                quoting=csv.QUOTE_NONNUMERIC,
+            )
+
+    stats.csv_state = dict(filename=filename, header=header, rows=stats.rows)
+    return filename
+
+
 def df_to_string(df):
     """
     Create a formatted str representation of the DataFrame.
@@ -20,7 +20,7 @@ import numpy as np
 from collections import namedtuple
 from math import isnan
 
-from six import iteritems, itervalues
+from six import iteritems
 
 from catalyst.finance.performance.position import Position
 from catalyst.finance.transaction import Transaction
@@ -36,6 +36,8 @@ from catalyst.constants import LOG_LEVEL
 
 log = logbook.Logger('Performance', level=LOG_LEVEL)
 
+# The initial number of slots of the position arrays.
+INITIAL_SLOTS = 16
 
 PositionStats = namedtuple('PositionStats',
                            ['net_exposure',
@@ -115,6 +117,14 @@ def calc_gross_value(long_value, short_value):
 
 
 class PositionTracker(object):
+    """
+    The positions of a portfolio.
+
+    Besides the Position objects, the amount, cost basis, last sale price
+    and multiplier of each position are kept in parallel arrays, indexed
+    by the slot of the asset. The prices are synchronized with a single
+    read of the data portal, and the stats are reductions of the arrays.
+    """
 
     def __init__(self, data_frequency):
         # asset => position object
@@ -125,6 +135,90 @@ class PositionTracker(object):
 
         self.data_frequency = data_frequency
 
+        self._init_slots()
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+
+        # Trackers pickled before the position arrays
+        if '_slots' not in state:
+            self._rebuild_slots()
+
+    def _init_slots(self, size=INITIAL_SLOTS):
+        # asset => index in the position arrays
+        self._slots = {}
+        self._slot_assets = []
+
+        self._amounts = np.zeros(size)
+        self._cost_bases = np.zeros(size)
+        self._last_sale_prices = np.zeros(size)
+        # The multipliers of the position values and exposures, futures
+        # do not have an inherent value.
+        self._value_multipliers = np.zeros(size)
+        self._exposure_multipliers = np.zeros(size)
+
+    def _rebuild_slots(self):
+        self._init_slots(max(INITIAL_SLOTS, len(self.positions)))
+        for position in list(self.positions.values()):
+            if position is not None:
+                self._sync_slot(position)
+
+    def _sync_slot(self, position):
+        """
+        Copy a position to the arrays, adding a slot for a new asset.
+
+        Parameters
+        ----------
+        position: Position
+
+        """
+        asset = position.asset
+        slot = self._slots.get(asset)
+        if slot is None:
+            slot = len(self._slot_assets)
+            if slot == len(self._amounts):
+                for name in ('_amounts', '_cost_bases', '_last_sale_prices',
+                             '_value_multipliers', '_exposure_multipliers'):
+                    array = getattr(self, name)
+                    setattr(self, name, np.concatenate(
+                        [array, np.zeros(len(array))]
+                    ))
+
+            self._slots[asset] = slot
+            self._slot_assets.append(asset)
+
+            if isinstance(asset, Future):
+                self._value_multipliers[slot] = 0.0
+                self._exposure_multipliers[slot] = asset.multiplier
+            else:
+                self._value_multipliers[slot] = 1.0
+                self._exposure_multipliers[slot] = 1.0
+
+        self._amounts[slot] = position.amount
+        self._cost_bases[slot] = position.cost_basis
+        self._last_sale_prices[slot] = position.last_sale_price
+
+    def _release_slot(self, asset):
+        slot = self._slots.pop(asset, None)
+        if slot is None:
+            return
+
+        # The last slot takes the place of the released one.
+        last = len(self._slot_assets) - 1
+        last_asset = self._slot_assets.pop()
+        if slot != last:
+            self._slot_assets[slot] = last_asset
+            self._slots[last_asset] = slot
+            for array in (self._amounts, self._cost_bases,
+                          self._last_sale_prices, self._value_multipliers,
+                          self._exposure_multipliers):
+                array[slot] = array[last]
+
+    def _ensure_slots(self):
+        # Positions can be set directly in the positions dict.
+        if len(self._slot_assets) != len(self.positions):
+            self._rebuild_slots()
+
     @expect_types(asset=Asset)
     def update_position(self, asset, amount=None, last_sale_price=None,
                         last_sale_date=None, cost_basis=None):
@@ -143,6 +237,8 @@ class PositionTracker(object):
         if cost_basis is not None:
             position.cost_basis = cost_basis
 
+        self._sync_slot(position)
+
     def execute_transaction(self, txn):
         # Update Position
         # ----------------
@@ -158,6 +254,7 @@ class PositionTracker(object):
 
         if position.amount == 0:
             del self.positions[asset]
+            self._release_slot(asset)
 
             try:
                 # if this position exists in our user-facing dictionary,
@@ -166,11 +263,16 @@ class PositionTracker(object):
             except KeyError:
                 pass
 
+        else:
+            self._sync_slot(position)
+
     @expect_types(asset=Asset)
     def handle_commission(self, asset, cost):
         # Adjust the cost basis of the stock if we own it
         if asset in self.positions:
-            self.positions[asset].adjust_commission_cost_basis(asset, cost)
+            position = self.positions[asset]
+            position.adjust_commission_cost_basis(asset, cost)
+            self._sync_slot(position)
 
     def handle_splits(self, splits):
         """
@@ -195,6 +297,7 @@ class PositionTracker(object):
                 position = self.positions[asset]
                 leftover_cash = position.handle_split(asset, ratio)
                 total_leftover_cash += leftover_cash
+                self._sync_slot(position)
 
         return total_leftover_cash
 
@@ -270,6 +373,7 @@ class PositionTracker(object):
                     Position(payment_asset)
 
             position.amount += share_count
+            self._sync_slot(position)
 
         return net_cash_payment
 
@@ -333,49 +437,56 @@ class PositionTracker(object):
 
     def sync_last_sale_prices(self, dt, handle_non_market_minutes,
                               data_portal):
-        if not handle_non_market_minutes:
-            for asset, position in iteritems(self.positions):
-                last_sale_price = data_portal.get_spot_value(
-                    asset, 'price', dt, self.data_frequency
-                )
+        self._ensure_slots()
+
+        assets = list(self._slot_assets)
+        if not assets:
+            return
 
-                if not np.isnan(last_sale_price):
-                    position.last_sale_price = last_sale_price
+        if not handle_non_market_minutes:
+            # A single read for all the positions
+            last_sale_prices = data_portal.get_spot_value(
+                assets, 'price', dt, self.data_frequency
+            )
         else:
-            for asset, position in iteritems(self.positions):
-                last_sale_price = data_portal.get_adjusted_value(
+            previous_minute = data_portal.trading_calendar.previous_minute(dt)
+            last_sale_prices = [
+                data_portal.get_adjusted_value(
                     asset,
                     'price',
-                    data_portal.trading_calendar.previous_minute(dt),
+                    previous_minute,
                     dt,
                     self.data_frequency
                 )
+                for asset in assets
+            ]
 
-                if not np.isnan(last_sale_price):
-                    position.last_sale_price = last_sale_price
+        last_sale_prices = np.array(last_sale_prices, dtype=np.float64)
+        updated = np.flatnonzero(~np.isnan(last_sale_prices))
+        self._last_sale_prices[updated] = last_sale_prices[updated]
+
+        for slot in updated:
+            self.positions[assets[slot]].last_sale_price = \
+                last_sale_prices[slot]
 
     def stats(self):
-        amounts = []
-        last_sale_prices = []
-        for pos in itervalues(self.positions):
-            amounts.append(pos.amount)
-            last_sale_prices.append(pos.last_sale_price)
-
-        position_values = calc_position_values(itervalues(self.positions))
-        position_exposures = calc_position_exposures(
-            itervalues(self.positions)
-        )
+        self._ensure_slots()
+
+        count = len(self._slot_assets)
+        notional = self._amounts[:count] * self._last_sale_prices[:count]
+        position_values = notional * self._value_multipliers[:count]
+        position_exposures = notional * self._exposure_multipliers[:count]
 
-        long_value = calc_long_value(position_values)
-        short_value = calc_short_value(position_values)
+        long_value = position_values[position_values > 0].sum()
+        short_value = position_values[position_values < 0].sum()
         gross_value = calc_gross_value(long_value, short_value)
-        long_exposure = calc_long_exposure(position_exposures)
-        short_exposure = calc_short_exposure(position_exposures)
+        long_exposure = position_exposures[position_exposures > 0].sum()
+        short_exposure = position_exposures[position_exposures < 0].sum()
         gross_exposure = calc_gross_exposure(long_exposure, short_exposure)
-        net_exposure = calc_net(position_exposures)
-        longs_count = calc_longs_count(position_exposures)
-        shorts_count = calc_shorts_count(position_exposures)
-        net_value = calc_net(position_values)
+        net_exposure = position_exposures.sum()
+        longs_count = int(np.count_nonzero(position_exposures > 0))
+        shorts_count = int(np.count_nonzero(position_exposures < 0))
+        net_value = position_values.sum()
 
         return PositionStats(
             long_value=long_value,
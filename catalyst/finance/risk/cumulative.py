@@ -27,16 +27,7 @@ from .risk import (
     choose_treasury
 )
 
-from catalyst.patches.stats import (
-    alpha_beta_aligned,
-    annual_volatility,
-    downside_risk,
-    information_ratio,
-    max_drawdown,
-    sharpe_ratio,
-    sortino_ratio,
-    cum_returns,
-)
+from .online import ReturnsMoments
 import warnings
 from catalyst.constants import LOG_LEVEL
 
@@ -51,6 +42,11 @@ class RiskMetricsCumulative(object):
     :Usage:
         Instantiate RiskMetricsCumulative once.
         Call update() method on each dt to update the metrics.
+
+    The metrics are updated from running statistics of the returns, in
+    constant time per update: the returns of the previous sessions are
+    final, only the returns of the current session change between two
+    updates of the same session.
     """
 
     METRIC_NAMES = (
@@ -143,6 +139,11 @@ class RiskMetricsCumulative(object):
 
         self.num_trading_days = 0
 
+        # The statistics of the returns of the sessions before
+        # `_final_loc`.
+        self._final_moments = ReturnsMoments()
+        self._final_loc = 0
+
     def update(self, dt, algorithm_returns, benchmark_returns, leverage):
         warnings.filterwarnings('error')
 
@@ -161,13 +162,11 @@ class RiskMetricsCumulative(object):
             if len(self.algorithm_returns) == 1:
                 self.algorithm_returns = np.append(0.0, self.algorithm_returns)
 
-        try:
-            self.algorithm_cumulative_returns[dt_loc] = cum_returns(
-                self.algorithm_returns
-            )[-1]
-        except Exception as e:
-            log.debug('unable to calculate cum returns: {}'.format(e))
-            self.algorithm_cumulative_returns[dt_loc] = np.nan
+        self.benchmark_returns_cont[dt_loc] = benchmark_returns
+        moments = self._update_moments(dt_loc)
+
+        self.algorithm_cumulative_returns[dt_loc] = \
+            moments.algorithm_cumulative_return
 
         algo_cumulative_returns_to_date = \
             self.algorithm_cumulative_returns[:dt_loc + 1]
@@ -189,22 +188,14 @@ class RiskMetricsCumulative(object):
                 self.annualized_mean_returns = np.append(
                     0.0, self.annualized_mean_returns)
 
-        self.benchmark_returns_cont[dt_loc] = benchmark_returns
         self.benchmark_returns = self.benchmark_returns_cont[:dt_loc + 1]
 
         if self.create_first_day_stats:
             if len(self.benchmark_returns) == 1:
                 self.benchmark_returns = np.append(0.0, self.benchmark_returns)
 
-        try:
-            self.benchmark_cumulative_returns[dt_loc] = cum_returns(
-                self.benchmark_returns
-            )[-1]
-        except Exception as e:
-            log.debug(
-                'unable to calculate benchmark cum returns: {}'.format(e)
-            )
-            self.benchmark_cumulative_returns[dt_loc] = np.nan
+        self.benchmark_cumulative_returns[dt_loc] = \
+            moments.benchmark_cumulative_return
 
         benchmark_cumulative_returns_to_date = \
             self.benchmark_cumulative_returns[:dt_loc + 1]
@@ -244,12 +235,8 @@ algorithm_returns ({algo_count}) in range {start} : {end} on {dt}"
             raise Exception(message)
 
         self.update_current_max()
-        self.benchmark_volatility[dt_loc] = annual_volatility(
-            self.benchmark_returns
-        )
-        self.algorithm_volatility[dt_loc] = annual_volatility(
-            self.algorithm_returns
-        )
+        self.benchmark_volatility[dt_loc] = moments.benchmark_volatility
+        self.algorithm_volatility[dt_loc] = moments.algorithm_volatility
 
         # caching the treasury rates for the minutely case is a
         # big speedup, because it avoids searching the treasury
@@ -269,49 +256,13 @@ algorithm_returns ({algo_count}) in range {start} : {end} on {dt}"
             self.algorithm_cumulative_returns[dt_loc] -
             self.treasury_period_return)
 
-        self.alpha[dt_loc], self.beta[dt_loc] = alpha_beta_aligned(
-            self.algorithm_returns,
-            self.benchmark_returns,
-        )
-        self.sharpe[dt_loc] = sharpe_ratio(
-            self.algorithm_returns,
-        )
-
-        try:
-            self.downside_risk[dt_loc] = downside_risk(
-                self.algorithm_returns
-            )
-        except Exception as e:
-            log.debug(
-                'unable to calculate downside risk returns: {}'.format(e)
-            )
-            self.downside_risk[dt_loc] = np.nan
-
-        try:
-            risk = self.downside_risk[dt_loc]
-            self.sortino[dt_loc] = sortino_ratio(
-                self.algorithm_returns,
-                _downside_risk=risk
-            )
-        except Exception as e:
-            log.debug(
-                'unable to calculate benchmark cum returns: {}'.format(e)
-            )
-            self.sortino[dt_loc] = np.nan
-
-        self.information[dt_loc] = information_ratio(
-            self.algorithm_returns,
-            self.benchmark_returns,
-        )
-        try:
-            self.max_drawdown = max_drawdown(
-                self.algorithm_returns
-            )
-        except Exception as e:
-            log.debug(
-                'unable to calculate max drawdown: {}'.format(e)
-            )
-            self.max_drawdown = np.nan
+        self.alpha[dt_loc] = moments.alpha
+        self.beta[dt_loc] = moments.beta
+        self.sharpe[dt_loc] = moments.sharpe
+        self.downside_risk[dt_loc] = moments.downside_risk
+        self.sortino[dt_loc] = moments.sortino
+        self.information[dt_loc] = moments.information
+        self.max_drawdown = moments.max_drawdown
 
         self.max_drawdowns[dt_loc] = self.max_drawdown
         self.max_leverage = self.calculate_max_leverage()
@@ -319,6 +270,45 @@ algorithm_returns ({algo_count}) in range {start} : {end} on {dt}"
 
         warnings.resetwarnings()
 
+    def _update_moments(self, dt_loc):
+        """
+        The statistics of the returns up to the specified session.
+
+        Parameters
+        ----------
+        dt_loc: int
+
+        Returns
+        -------
+        ReturnsMoments
+
+        """
+        if dt_loc < self._final_loc:
+            # Going back in time, the statistics are computed again
+            self._final_moments = ReturnsMoments()
+            self._final_loc = 0
+
+        while self._final_loc < dt_loc:
+            self._final_moments.add(
+                self.algorithm_returns_cont[self._final_loc],
+                self.benchmark_returns_cont[self._final_loc],
+            )
+            self._final_loc += 1
+
+        if dt_loc == 0 and self.create_first_day_stats:
+            # The first session is compared with a zero return
+            moments = ReturnsMoments()
+            moments.add(0.0, 0.0)
+
+        else:
+            moments = self._final_moments.copy()
+
+        moments.add(
+            self.algorithm_returns_cont[dt_loc],
+            self.benchmark_returns_cont[dt_loc],
+        )
+        return moments
+
     def to_dict(self):
         """
         Creates a dictionary representing the state of the risk report.
@@ -0,0 +1,222 @@
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import copy
+from math import isnan, sqrt
+
+import numpy as np
+
+from catalyst.patches.stats import APPROX_BDAYS_PER_YEAR
+
+
+def _welford(n, mean, m2, value):
+    n += 1
+    delta = value - mean
+    mean += delta / n
+    m2 += delta * (value - mean)
+    return n, mean, m2
+
+
+class ReturnsMoments(object):
+    """
+    Running statistics of aligned algorithm and benchmark returns, updated
+    one period at a time.
+
+    The metrics match the functions of `catalyst.patches.stats` applied to
+    the whole series of returns: NaN returns are skipped like the nan*
+    functions do, and count as a zero return in the cumulative returns and
+    the drawdowns. Variances and covariances are maintained with Welford's
+    algorithm.
+    """
+
+    def __init__(self):
+        # The number of periods, including the NaN returns.
+        self.count = 0
+
+        self.algo_n = 0
+        self.algo_mean = 0.0
+        self.algo_m2 = 0.0
+        self.downside_squares = 0.0
+
+        self.benchmark_n = 0
+        self.benchmark_mean = 0.0
+        self.benchmark_m2 = 0.0
+
+        # The periods where both returns are available.
+        self.joint_n = 0
+        self.joint_algo_mean = 0.0
+        self.joint_benchmark_mean = 0.0
+        self.joint_benchmark_m2 = 0.0
+        self.joint_comoment = 0.0
+
+        self.active_n = 0
+        self.active_mean = 0.0
+        self.active_m2 = 0.0
+
+        self.algo_growth = 1.0
+        self.benchmark_growth = 1.0
+        self.peak = -np.inf
+        self.worst_drawdown = np.inf
+
+    def copy(self):
+        return copy.copy(self)
+
+    def add(self, algo_return, benchmark_return):
+        """
+        Add the returns of a period.
+
+        Parameters
+        ----------
+        algo_return: float
+        benchmark_return: float
+
+        """
+        self.count += 1
+
+        algo_missing = isnan(algo_return)
+        benchmark_missing = isnan(benchmark_return)
+
+        if not algo_missing:
+            self.algo_n, self.algo_mean, self.algo_m2 = _welford(
+                self.algo_n, self.algo_mean, self.algo_m2, algo_return
+            )
+            if algo_return < 0:
+                self.downside_squares += algo_return * algo_return
+
+            self.algo_growth *= 1.0 + algo_return
+
+        if not benchmark_missing:
+            self.benchmark_n, self.benchmark_mean, self.benchmark_m2 = \
+                _welford(
+                    self.benchmark_n,
+                    self.benchmark_mean,
+                    self.benchmark_m2,
+                    benchmark_return,
+                )
+            self.benchmark_growth *= 1.0 + benchmark_return
+
+        if not algo_missing and not benchmark_missing:
+            self.joint_n += 1
+            algo_delta = algo_return - self.joint_algo_mean
+            self.joint_algo_mean += algo_delta / self.joint_n
+            benchmark_delta = benchmark_return - self.joint_benchmark_mean
+            self.joint_benchmark_mean += benchmark_delta / self.joint_n
+            benchmark_residual = benchmark_return - self.joint_benchmark_mean
+            self.joint_benchmark_m2 += benchmark_delta * benchmark_residual
+            self.joint_comoment += algo_delta * benchmark_residual
+
+            self.active_n, self.active_mean, self.active_m2 = _welford(
+                self.active_n,
+                self.active_mean,
+                self.active_m2,
+                algo_return - benchmark_return,
+            )
+
+        self.peak = max(self.peak, self.algo_growth)
+        self.worst_drawdown = min(
+            self.worst_drawdown, (self.algo_growth - self.peak) / self.peak
+        )
+
+    @property
+    def algorithm_cumulative_return(self):
+        return self.algo_growth - 1.0 if self.count else np.nan
+
+    @property
+    def benchmark_cumulative_return(self):
+        return self.benchmark_growth - 1.0 if self.count else np.nan
+
+    @staticmethod
+    def _std(n, m2):
+        return sqrt(max(m2, 0.0) / (n - 1)) if n > 1 else np.nan
+
+    @property
+    def algorithm_volatility(self):
+        if self.count < 2:
+            return np.nan
+
+        return self._std(self.algo_n, self.algo_m2) * \
+            sqrt(APPROX_BDAYS_PER_YEAR)
+
+    @property
+    def benchmark_volatility(self):
+        if self.count < 2:
+            return np.nan
+
+        return self._std(self.benchmark_n, self.benchmark_m2) * \
+            sqrt(APPROX_BDAYS_PER_YEAR)
+
+    @property
+    def beta(self):
+        if self.count < 2 or self.joint_n < 2:
+            return np.nan
+
+        if abs(self.joint_benchmark_m2 / self.joint_n) < 1.0e-30:
+            return np.nan
+
+        return self.joint_comoment / self.joint_benchmark_m2
+
+    @property
+    def alpha(self):
+        beta = self.beta
+        if isnan(beta):
+            return np.nan
+
+        return (self.joint_algo_mean - beta * self.joint_benchmark_mean) * \
+            APPROX_BDAYS_PER_YEAR
+
+    @property
+    def sharpe(self):
+        if self.count < 2:
+            return np.nan
+
+        std = self._std(self.algo_n, self.algo_m2)
+        if isnan(std) or std == 0:
+            return np.nan
+
+        return self.algo_mean / std * sqrt(APPROX_BDAYS_PER_YEAR)
+
+    @property
+    def downside_risk(self):
+        if self.count < 1 or self.algo_n == 0:
+            return np.nan
+
+        return sqrt(self.downside_squares / self.algo_n) * \
+            sqrt(APPROX_BDAYS_PER_YEAR)
+
+    @property
+    def sortino(self):
+        if self.count < 2:
+            return np.nan
+
+        downside_risk = self.downside_risk
+        if isnan(downside_risk) or downside_risk == 0:
+            return np.nan
+
+        return self.algo_mean / downside_risk * APPROX_BDAYS_PER_YEAR
+
+    @property
+    def information(self):
+        if self.count < 2:
+            return np.nan
+
+        tracking_error = self._std(self.active_n, self.active_m2)
+        if isnan(tracking_error):
+            return 0.0
+
+        if tracking_error == 0:
+            return np.nan
+
+        return self.active_mean / tracking_error
+
+    @property
+    def max_drawdown(self):
+        return self.worst_drawdown if self.count else np.nan
@@ -5,13 +5,19 @@ from abc import (
     ABCMeta,
     abstractmethod,
 )
+from functools import partial
+import multiprocessing
+from multiprocessing.pool import ThreadPool
+import os
+import sys
 from uuid import uuid4
 
-import six
 from six import (
     iteritems,
+    reraise,
     with_metaclass,
 )
+from six.moves.queue import Queue
 from numpy import array
 from pandas import DataFrame, MultiIndex
 from toolz import groupby, juxt
@@ -30,7 +36,6 @@ from .term import AssetExists, InputDates, LoadableTerm
 
 from catalyst.utils.date_utils import compute_date_range_chunks
 from catalyst.utils.pandas_utils import categorical_df_concat
-from catalyst.utils.sharedoc import copydoc
 
 
 class PipelineEngine(with_metaclass(ABCMeta)):
@@ -185,6 +190,10 @@ class SimplePipelineEngine(PipelineEngine):
         computing a pipeline. See
         :func:`catalyst.pipeline.engine.default_populate_initial_workspace`
         for more info.
+    num_threads : int, optional
+        The number of threads computing the independent terms of the
+        pipeline concurrently. Default is 1, computing the terms one at a
+        time.
 
     See Also
     --------
@@ -197,13 +206,17 @@ class SimplePipelineEngine(PipelineEngine):
         '_root_mask_term',
         '_root_mask_dates_term',
         '_populate_initial_workspace',
+        '_num_threads',
+        '_pool',
+        '_pool_pid',
     )
 
     def __init__(self,
                  get_loader,
                  calendar,
                  asset_finder,
-                 populate_initial_workspace=None):
+                 populate_initial_workspace=None,
+                 num_threads=1):
         self._get_loader = get_loader
         self._calendar = calendar
         self._finder = asset_finder
@@ -214,6 +227,16 @@ class SimplePipelineEngine(PipelineEngine):
         self._populate_initial_workspace = (
             populate_initial_workspace or default_populate_initial_workspace
         )
+        self._num_threads = num_threads
+        self._pool = None
+        self._pool_pid = None
+
+    def __del__(self):
+        # The threads of the pool would otherwise outlive the engine, the
+        # forked processes inherit the pool without its threads
+        if getattr(self, '_pool', None) is not None \
+                and self._pool_pid == os.getpid():
+            self._pool.terminate()
 
     def run_pipeline(self, pipeline, start_date, end_date):
         """
@@ -321,18 +344,110 @@ class SimplePipelineEngine(PipelineEngine):
             assets,
         )
 
-    @copydoc(PipelineEngine.run_chunked_pipeline)
-    def run_chunked_pipeline(self, pipeline, start_date, end_date, chunksize):
-        ranges = compute_date_range_chunks(
+    def run_chunked_pipeline(self, pipeline, start_date, end_date, chunksize,
+                             processes=1, memory_budget=None):
+        """
+        Compute values for `pipeline` in number of days equal to `chunksize`
+        and return stitched up result. Computing in chunks is useful for
+        pipelines computed over a long period of time.
+
+        Parameters
+        ----------
+        pipeline : Pipeline
+            The pipeline to run.
+        start_date : pd.Timestamp
+            The start date to run the pipeline for.
+        end_date : pd.Timestamp
+            The end date to run the pipeline for.
+        chunksize : int or None
+            The number of days to execute at a time. If None, then
+            results will be calculated for entire date range at once, unless
+            a `memory_budget` is given.
+        processes : int, optional
+            The number of processes computing the chunks concurrently. The
+            processes are forked from the current one, the chunks are
+            computed one after another where fork is not available.
+            Default is 1.
+        memory_budget : int, optional
+            The number of bytes the workspaces of the chunks computed at the
+            same time can use. When `chunksize` is None, the largest chunk
+            size within the budget is used.
+
+        Returns
+        -------
+        result : pd.DataFrame
+            A frame of computed results.
+
+        See Also
+        --------
+        :meth:`catalyst.pipeline.engine.PipelineEngine.run_chunked_pipeline`
+        """
+        if chunksize is None and memory_budget is not None:
+            chunksize = self._chunksize_for_budget(
+                pipeline, start_date, end_date, memory_budget // processes,
+            )
+
+        ranges = list(compute_date_range_chunks(
             self._calendar,
             start_date,
             end_date,
             chunksize,
-        )
-        chunks = [self.run_pipeline(pipeline, s, e) for s, e in ranges]
+        ))
+
+        pool = _fork_pool(processes) \
+            if processes > 1 and len(ranges) > 1 else None
+
+        if pool is None:
+            chunks = [self.run_pipeline(pipeline, s, e) for s, e in ranges]
+        else:
+            global _chunk_context
+            _chunk_context = self, pipeline
+            try:
+                # The results come back in the order of the ranges
+                chunks = pool.map(_run_chunk, ranges, chunksize=1)
+            finally:
+                pool.terminate()
+                pool.join()
+                _chunk_context = None
 
         return categorical_df_concat(chunks, inplace=True)
 
+    def _chunksize_for_budget(self, pipeline, start_date, end_date,
+                              memory_budget):
+        """
+        The number of days of the chunks whose workspace fits in a memory
+        budget.
+
+        The workspace of a chunk is estimated as an array of float64 for
+        each term of the pipeline, with a column for each asset existing on
+        `end_date` and a row for each day of the chunk and of the longest
+        lookback window.
+
+        Parameters
+        ----------
+        pipeline : Pipeline
+        start_date : pd.Timestamp
+        end_date : pd.Timestamp
+        memory_budget : int
+            The number of bytes of the workspace of a chunk.
+
+        Returns
+        -------
+        chunksize : int
+        """
+        graph = pipeline.to_execution_plan(
+            uuid4().hex,
+            self._root_mask_term,
+            self._calendar,
+            start_date,
+            end_date,
+        )
+        extra_rows = graph.extra_rows[self._root_mask_term]
+        num_assets = self._compute_root_mask(end_date, end_date, 0).shape[1]
+
+        row_bytes = len(graph.graph) * max(num_assets, 1) * 8
+        return max(memory_budget // row_bytes - extra_rows, 1)
+
     def _compute_root_mask(self, start_date, end_date, extra_rows):
         """
         Compute a lifetimes matrix from our AssetFinder, then drop columns that
@@ -467,14 +582,16 @@ class SimplePipelineEngine(PipelineEngine):
 
         refcounts = graph.initial_refcounts(workspace)
 
-        for term in graph.execution_order(refcounts):
-            # `term` may have been supplied in `initial_workspace`, and in the
-            # future we may pre-compute loadable terms coming from the same
-            # dataset.  In either case, we will already have an entry for this
-            # term, which we shouldn't re-compute.
-            if term in workspace:
-                continue
+        # `term` may have been supplied in `initial_workspace`, and in the
+        # future we may pre-compute loadable terms coming from the same
+        # dataset.  In either case, we will already have an entry for this
+        # term, which we shouldn't re-compute.
+        terms = [
+            term for term in graph.execution_order(refcounts)
+            if term not in workspace
+        ]
 
+        def task_for_term(term):
             # Asset labels are always the same, but date labels vary by how
             # many extra rows are needed.
             mask, mask_dates = graph.mask_and_dates_for_term(
@@ -485,34 +602,46 @@ class SimplePipelineEngine(PipelineEngine):
             )
 
             if isinstance(term, LoadableTerm):
-                # term_key = loader_group_key(term)
-                # TODO: temp workaround
+                loader = get_loader(term)
                 to_load = sorted(
-                    six.next(six.itervalues(loader_groups)),
+                    loader_groups[loader_group_key(term)],
                     key=lambda t: t.dataset
                 )
-                loader = get_loader(term)
-                loaded = loader.load_adjusted_array(
+                return to_load, partial(
+                    loader.load_adjusted_array,
                     to_load, mask_dates, assets, mask,
                 )
-                workspace.update(loaded)
-            else:
-                workspace[term] = term._compute(
-                    self._inputs_for_term(term, workspace, graph),
-                    mask_dates,
-                    assets,
-                    mask,
-                )
-                if term.ndim == 2:
-                    assert workspace[term].shape == mask.shape
-                else:
-                    assert workspace[term].shape == (mask.shape[0], 1)
+
+            return [term], partial(
+                _compute_term,
+                term,
+                self._inputs_for_term(term, workspace, graph),
+                mask_dates,
+                assets,
+                mask,
+            )
+
+        def store(results):
+            workspace.update(results)
+            for term in results:
+                if isinstance(term, LoadableTerm):
+                    continue
 
                 # Decref dependencies of ``term``, and clear any terms whose
                 # refcounts hit 0.
                 for garbage_term in graph.decref_dependencies(term, refcounts):
                     del workspace[garbage_term]
 
+        if self._num_threads > 1 and len(terms) > 1:
+            self._compute_concurrently(graph, terms, task_for_term, store)
+        else:
+            for term in terms:
+                if term in workspace:
+                    continue
+
+                _, task = task_for_term(term)
+                store(task())
+
         out = {}
         graph_extra_rows = graph.extra_rows
         for name, term in iteritems(graph.outputs):
@@ -520,6 +649,87 @@ class SimplePipelineEngine(PipelineEngine):
             out[name] = workspace[term][graph_extra_rows[term]:]
         return out
 
+    def _compute_concurrently(self, graph, terms, task_for_term, store):
+        """
+        Compute the terms on a pool of threads, each term as soon as all
+        its inputs are in the workspace.
+
+        The tasks are created and their results stored by the calling
+        thread only, the threads only run the loaders and the `compute`
+        of the terms, which release the GIL in their numpy operations.
+
+        Parameters
+        ----------
+        graph : catalyst.pipeline.graph.TermGraph
+        terms : list[Term]
+            The terms to compute, in topological order.
+        task_for_term : callable
+            A function returning the terms computed by the task of a term
+            and the task, a callable returning a dict of term -> output.
+        store : callable
+            A function writing the outputs of a task in the workspace.
+        """
+        remaining = set(terms)
+        waiting = {
+            term: sum(
+                1 for parent in graph.graph.predecessors(term)
+                if parent in remaining
+            )
+            for term in terms
+        }
+        ready = [term for term in terms if not waiting[term]]
+        scheduled = set()
+
+        # Each call has its own queue, the tasks still running after a
+        # failure put their results in a queue nobody reads.
+        done = Queue()
+        running = 0
+
+        # The pool is created once and shared by all the chunks of the
+        # pipeline. The processes forked by run_chunked_pipeline inherit
+        # the pool without its threads and create their own.
+        if self._pool is None or self._pool_pid != os.getpid():
+            self._pool = ThreadPool(self._num_threads)
+            self._pool_pid = os.getpid()
+
+        while remaining:
+            for term in ready:
+                if term in scheduled:
+                    # Loaded with another term of its loader group
+                    continue
+
+                to_compute, task = task_for_term(term)
+                scheduled.update(to_compute)
+                self._pool.apply_async(_run_task, (task, done))
+                running += 1
+
+            ready = []
+
+            if not running:
+                raise ValueError(
+                    'Pipeline terms never computed: {}'.format(
+                        ', '.join(map(repr, remaining))
+                    )
+                )
+
+            results, exc_info = done.get()
+            running -= 1
+            if exc_info is not None:
+                reraise(*exc_info)
+
+            store(results)
+
+            for term in results:
+                if term not in remaining:
+                    continue
+
+                remaining.remove(term)
+                for child in graph.graph.successors(term):
+                    if child in remaining:
+                        waiting[child] -= 1
+                        if not waiting[child]:
+                            ready.append(child)
+
     def _to_narrow(self, terms, data, mask, dates, assets):
         """
         Convert raw computed pipeline results into a DataFrame for public APIs.
@@ -615,3 +825,55 @@ class SimplePipelineEngine(PipelineEngine):
                     implied=implied_shape,
                 )
             )
+
+
+# The engine and the pipeline of the chunks computed by the processes of
+# run_chunked_pipeline, inherited by the forked processes.
+_chunk_context = None
+
+
+def _run_chunk(dates):
+    engine, pipeline = _chunk_context
+    return engine.run_pipeline(pipeline, *dates)
+
+
+def _fork_pool(processes):
+    """
+    A pool of processes forked from the current one, whose memory is
+    shared with the engine and its loaders without pickling them.
+
+    Returns
+    -------
+    multiprocessing.pool.Pool
+        None if processes cannot be forked on the platform.
+    """
+    try:
+        context = multiprocessing.get_context('fork')
+    except AttributeError:
+        # Python 2 always forks on the platforms supporting it
+        if not hasattr(os, 'fork'):
+            return None
+        context = multiprocessing
+    except ValueError:
+        return None
+
+    return context.Pool(processes)
+
+
+def _compute_term(term, inputs, dates, assets, mask):
+    result = term._compute(inputs, dates, assets, mask)
+    if term.ndim == 2:
+        assert result.shape == mask.shape
+    else:
+        assert result.shape == (mask.shape[0], 1)
+
+    return {term: result}
+
+
+def _run_task(task, done):
+    # Runs in the threads of the pool, the results and the errors are
+    # handed back to the calling thread through the queue.
+    try:
+        done.put((task(), None))
+    except Exception:
+        done.put((None, sys.exc_info()))
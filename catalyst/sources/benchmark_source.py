@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import numpy as np
 import pandas as pd
 
 from catalyst.errors import (
@@ -71,14 +72,32 @@ class BenchmarkSource(object):
             raise Exception("Must provide either benchmark_asset or "
                             "benchmark_returns.")
 
+        # The values are read by position, the dts are the nanoseconds of
+        # the index.
+        series = self._precalculated_series
+        self._dts = series.index.values.astype('datetime64[ns]') \
+            .view(np.int64)
+        self._values = series.values.astype(np.float64)
+        if self._values.ndim > 1:
+            # The returns of the trading environment are a frame with a
+            # single column
+            self._values = self._values[:, 0]
+        self._position = 0
+
     def get_value(self, dt):
-        try:
-            series = self._precalculated_series
-            value = series.loc[dt]
-            return value
-        except Exception:
-            # TODO: workaround, find permanent fix
-            return 0
+        # The simulation asks for the dts in order, the position following
+        # the last value read is tried before searching the index.
+        dts = self._dts
+        position = self._position
+        value = dt.value
+        if position >= len(dts) or dts[position] != value:
+            position = dts.searchsorted(value)
+            if position >= len(dts) or dts[position] != value:
+                # TODO: workaround, find permanent fix
+                return 0
+
+        self._position = position + 1
+        return self._values[position]
 
     def get_range(self, start_dt, end_dt):
         return self._precalculated_series.loc[start_dt:end_dt]
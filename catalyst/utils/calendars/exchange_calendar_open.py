@@ -1,15 +1,32 @@
 from datetime import time
 from pytz import timezone
 
-from pandas import Timestamp
+import numpy as np
+from pandas import Timestamp, DatetimeIndex
 from pandas.tseries.offsets import DateOffset
 
+from catalyst.utils.input_validation import (
+    attrgetter,
+    coerce,
+    preprocess,
+)
 from catalyst.utils.memoize import lazyval
 
-from .trading_calendar import TradingCalendar
+from .trading_calendar import TradingCalendar, NANOS_IN_MINUTE
+
+NANOS_IN_DAY = 1440 * NANOS_IN_MINUTE
 
 
 class OpenExchangeCalendar(TradingCalendar):
+    """
+    The calendar of the crypto markets, open every minute of every day.
+
+    Since the minutes of the calendar have no gaps, the minute queries are
+    answered with integer arithmetic on the nanoseconds of the first
+    minute instead of searching the array of all the minutes, which is
+    only built when `all_minutes` is requested.
+    """
+
     @property
     def name(self):
         return 'OPEN'
@@ -33,3 +50,150 @@ class OpenExchangeCalendar(TradingCalendar):
     def __init__(self, *args, **kwargs):
         super(OpenExchangeCalendar, self).__init__(
             start=Timestamp('2015-3-1', tz='UTC'), **kwargs)
+
+        self._first_minute_nanos = int(self.market_opens_nanos[0])
+        self._last_minute_nanos = int(self.market_closes_nanos[-1])
+        self._minutes_count = (
+            self._last_minute_nanos - self._first_minute_nanos
+        ) // NANOS_IN_MINUTE + 1
+
+    def _minutes(self, start_idx, end_idx):
+        """
+        The minutes between two positions of the calendar, like a slice of
+        `all_minutes`.
+
+        Parameters
+        ----------
+        start_idx: int
+        end_idx: int
+
+        Returns
+        -------
+        pd.DatetimeIndex
+
+        """
+        start_idx = min(max(start_idx, 0), self._minutes_count)
+        end_idx = min(max(end_idx, start_idx), self._minutes_count)
+
+        return DatetimeIndex(np.arange(
+            self._first_minute_nanos + start_idx * NANOS_IN_MINUTE,
+            self._first_minute_nanos + end_idx * NANOS_IN_MINUTE,
+            NANOS_IN_MINUTE,
+            dtype=np.int64,
+        ).astype('datetime64[ns]'), tz='UTC')
+
+    def _minute(self, idx):
+        if idx < 0 or idx >= self._minutes_count:
+            raise IndexError('index out of the calendar minutes')
+
+        return Timestamp(
+            self._first_minute_nanos + idx * NANOS_IN_MINUTE, tz='UTC'
+        )
+
+    @lazyval
+    def all_minutes(self):
+        return self._minutes(0, self._minutes_count)
+
+    def is_open_on_minute(self, dt):
+        value = dt.value
+        return self._first_minute_nanos <= value <= self._last_minute_nanos \
+            and (value - self._first_minute_nanos) % NANOS_IN_DAY \
+            <= NANOS_IN_DAY - NANOS_IN_MINUTE
+
+    def next_minute(self, dt):
+        idx = (dt.value - self._first_minute_nanos) // NANOS_IN_MINUTE + 1
+        return self._minute(max(idx, 0))
+
+    def previous_minute(self, dt):
+        # The last minute strictly before dt
+        idx = -((self._first_minute_nanos - dt.value) // NANOS_IN_MINUTE) - 1
+        if idx < 0:
+            raise ValueError("Cannot go earlier in calendar!")
+
+        return self._minute(min(idx, self._minutes_count - 1))
+
+    def minutes_window(self, start_dt, count):
+        # The minute on or before start_dt
+        start_idx = \
+            (start_dt.value - self._first_minute_nanos) // NANOS_IN_MINUTE
+
+        if start_idx < 0 or start_idx >= self._minutes_count:
+            raise KeyError("Can't start minute window at {}".format(start_dt))
+
+        end_idx = start_idx + count
+
+        if start_idx > end_idx:
+            start_idx, end_idx = end_idx + 1, start_idx + 1
+
+        # Same bounds as the slice of all_minutes in the base calendar,
+        # where a negative position counts from the last minute.
+        start_idx, end_idx, _ = \
+            slice(start_idx, end_idx).indices(self._minutes_count)
+
+        return self._minutes(start_idx, end_idx)
+
+    def minutes_in_range(self, start_minute, end_minute):
+        # The first minute on or after start_minute and the first minute
+        # after end_minute
+        start_idx = -(
+            (self._first_minute_nanos - start_minute.value) // NANOS_IN_MINUTE
+        )
+        end_idx = (
+            end_minute.value - self._first_minute_nanos
+        ) // NANOS_IN_MINUTE + 1
+
+        return self._minutes(start_idx, end_idx)
+
+    def minutes_count_for_sessions_in_range(self, start_session, end_session):
+        start = max(start_session.value, self._first_minute_nanos)
+        end = min(end_session.value, self._last_minute_nanos)
+        if end < start:
+            return 0
+
+        return int((end - start) // NANOS_IN_DAY + 1) * 1440
+
+    def session_distance(self, start_session_label, end_session_label):
+        start = self.minute_to_session_label(start_session_label)
+        end = self.minute_to_session_label(end_session_label)
+
+        return int(abs(end.value - start.value) // NANOS_IN_DAY)
+
+    @preprocess(dt=coerce(Timestamp, attrgetter('value')))
+    def minute_to_session_label(self, dt, direction="next"):
+        if dt < self._first_minute_nanos or dt > self._last_minute_nanos:
+            return super(OpenExchangeCalendar, self).minute_to_session_label(
+                dt, direction
+            )
+
+        offset = (dt - self._first_minute_nanos) % NANOS_IN_DAY
+        session = dt - offset
+
+        if direction not in ("next", "previous", "none"):
+            raise ValueError("Invalid direction parameter: "
+                             "{0}".format(direction))
+
+        if offset > NANOS_IN_DAY - NANOS_IN_MINUTE:
+            # Between the close of a session and the open of the next one
+            if direction == "next":
+                session += NANOS_IN_DAY
+            elif direction == "none":
+                raise ValueError("The given dt is not an exchange minute!")
+
+        return Timestamp(session, tz='UTC')
+
+    def minute_index_to_session_labels(self, index):
+        nanos = index.values.astype(np.int64)
+        offsets = (nanos - self._first_minute_nanos) % NANOS_IN_DAY
+
+        # The base calendar gives a timestamp between two minutes the
+        # session of the timestamps before it in the index, which the
+        # arithmetic below doesn't reproduce.
+        if len(nanos) and (nanos[0] < self._first_minute_nanos or
+                           nanos[-1] > self._last_minute_nanos or
+                           (offsets % NANOS_IN_MINUTE).any()):
+            return super(OpenExchangeCalendar, self) \
+                .minute_index_to_session_labels(index)
+
+        labels = nanos - offsets
+
+        return DatetimeIndex(labels.astype('datetime64[ns]'), tz='UTC')
@@ -115,9 +115,6 @@ class TradingCalendar(with_metaclass(ABCMeta)):
         self.market_closes_nanos = self.schedule.market_close.values.\
             astype(np.int64)
 
-        self._trading_minutes_nanos = self.all_minutes.values.\
-            astype(np.int64)
-
         self.first_trading_session = _all_days[0]
         self.last_trading_session = _all_days[-1]
 
@@ -156,6 +153,10 @@ class TradingCalendar(with_metaclass(ABCMeta)):
     def close_offset(self):
         return 0
 
+    @lazyval
+    def _trading_minutes_nanos(self):
+        return self.all_minutes.values.astype(np.int64)
+
     @lazyval
     def _minutes_per_session(self):
         diff = self.schedule.market_close - self.schedule.market_open
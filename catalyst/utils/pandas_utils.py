@@ -244,9 +244,6 @@ def categorical_df_concat(df_list, inplace=False):
         Dataframe of concatenated list.
     """
 
-    if not inplace:
-        df_list = deepcopy(df_list)
-
     # Assert each dataframe has the same columns/dtypes
     df = df_list[0]
     if not all([(df.dtypes.equals(df_i.dtypes)) for df_i in df_list[1:]]):
@@ -254,6 +251,12 @@ def categorical_df_concat(df_list, inplace=False):
 
     categorical_columns = df.columns[df.dtypes == 'category']
 
+    # Only the categories are modified, the frames without categorical
+    # columns are left as they are and copied once by pd.concat.
+    if not inplace and len(categorical_columns):
+        df_list = deepcopy(df_list)
+        inplace = True
+
     for col in categorical_columns:
         new_categories = sorted(
             set().union(
@@ -265,4 +268,6 @@ def categorical_df_concat(df_list, inplace=False):
             for df in df_list:
                 df[col].cat.set_categories(new_categories, inplace=True)
 
-    return pd.concat(df_list)
+    # pd.concat copies the blocks of several frames anyway, a single frame
+    # is only copied if it belongs to the caller.
+    return pd.concat(df_list, copy=not inplace)
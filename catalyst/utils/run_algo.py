@@ -1,8 +1,10 @@
+import multiprocessing
 import os
 import re
 import sys
 import warnings
 from datetime import timedelta
+from itertools import product
 from runpy import run_path
 from time import sleep
 
@@ -13,6 +15,8 @@ from six import string_types
 import catalyst
 from catalyst.data.bundles import load
 from catalyst.data.data_portal import DataPortal
+from catalyst.exchange.exchange_errors import SymbolNotFoundOnExchange
+from catalyst.exchange.exchange_feed import StreamFeed
 from catalyst.exchange.exchange_pricing_loader import ExchangePricingLoader, \
     TradingPairPricing
 from catalyst.exchange.utils.factory import get_exchange
@@ -72,6 +76,131 @@ class _RunAlgoError(click.ClickException, ValueError):
         return self.pyfunc_msg
 
 
+def _create_exchanges(exchange, quote_currency, must_authenticate,
+                      auth_aliases):
+    """The exchanges of a comma-delimited list of exchange names.
+    """
+    if isinstance(auth_aliases, string_types):
+        aliases = auth_aliases.split(',')
+        if len(aliases) < 2 or len(aliases) % 2 != 0:
+            raise ValueError(
+                'the `auth_aliases` parameter must contain an even list '
+                'of comma-delimited values. For example, '
+                '"binance,auth2" or "binance,auth2,bittrex,auth2".'
+            )
+
+        auth_aliases = dict(zip(aliases[::2], aliases[1::2]))
+
+    exchange_list = [x.strip().lower() for x in exchange.split(',')]
+    exchanges = dict()
+    for name in exchange_list:
+        if auth_aliases is not None and name in auth_aliases:
+            auth_alias = auth_aliases[name]
+        else:
+            auth_alias = None
+
+        exchanges[name] = get_exchange(
+            exchange_name=name,
+            quote_currency=quote_currency,
+            must_authenticate=must_authenticate,
+            skip_init=True,
+            auth_alias=auth_alias,
+        )
+
+    return exchanges
+
+
+def _create_feeds(exchanges, feeds):
+    """The streaming market data feeds of the exchanges.
+
+    :param:`feeds` maps exchange names to `host:port` addresses, as a dict
+    or a list of "exchange=host:port" strings. Each feed is attached to
+    its exchange but not started.
+    """
+    if not isinstance(feeds, dict):
+        addresses = dict()
+        for feed in feeds:
+            name, sep, address = feed.partition('=')
+            if not sep:
+                raise ValueError(
+                    'invalid feed {}, it should be specified like this: '
+                    '"binance=127.0.0.1:9000"'.format(feed)
+                )
+
+            addresses[name] = address
+
+        feeds = addresses
+
+    created = dict()
+    for name, address in feeds.items():
+        name = name.strip().lower()
+        if name not in exchanges:
+            raise ValueError(
+                'the feed of {} does not match any exchange of the '
+                'algorithm'.format(name)
+            )
+
+        host, _, port = address.strip().rpartition(':')
+        if not host or not port.isdigit():
+            raise ValueError(
+                'invalid feed address {}, expected host:port'.format(address)
+            )
+
+        created[name] = StreamFeed(host, int(port))
+        exchanges[name].feed = created[name]
+
+    return created
+
+
+def _create_environment(exchanges, environ, start, end):
+    """The trading environment of the exchanges.
+    """
+    env = TradingEnvironment(
+        load=partial(
+            load_crypto_market_data,
+            environ=environ,
+            start_dt=start,
+            end_dt=end
+        ),
+        environ=environ,
+        exchange_tz='UTC',
+        asset_db_path=None  # We don't need an asset db, we have exchanges
+    )
+    env.asset_finder = ExchangeAssetFinder(exchanges=exchanges)
+    return env
+
+
+def _eval_defines(namespace, defines):
+    """Bind the names of the definitions of the form name=value in the
+    namespace.
+    """
+    for assign in defines:
+        try:
+            name, value = assign.split('=', 2)
+        except ValueError:
+            raise ValueError(
+                'invalid define %r, should be of the form name=value' %
+                assign,
+            )
+        try:
+            # evaluate in the same namespace so names may refer to
+            # eachother
+            namespace[name] = eval(value, namespace)
+        except Exception as e:
+            raise ValueError(
+                'failed to execute definition for name %r: %s' % (name, e),
+            )
+
+
+def _choose_loader(data_frequency, column):
+    bound_cols = TradingPairPricing.columns
+    if column in bound_cols:
+        return ExchangePricingLoader(data_frequency)
+    raise ValueError(
+        "No PipelineLoader registered for column %s." % column
+    )
+
+
 def _run(handle_data,
          initialize,
          before_trading_start,
@@ -98,7 +227,8 @@ def _run(handle_data,
          analyze_live,
          simulate_orders,
          auth_aliases,
-         stats_output):
+         stats_output,
+         feeds=None):
     """Run a backtest for the given algorithm.
 
     This is shared between the cli and :func:`catalyst.run_algo`.
@@ -111,22 +241,7 @@ def _run(handle_data,
         else:
             namespace = {}
 
-        for assign in defines:
-            try:
-                name, value = assign.split('=', 2)
-            except ValueError:
-                raise ValueError(
-                    'invalid define %r, should be of the form name=value' %
-                    assign,
-                )
-            try:
-                # evaluate in the same namespace so names may refer to
-                # eachother
-                namespace[name] = eval(value, namespace)
-            except Exception as e:
-                raise ValueError(
-                    'failed to execute definition for name %r: %s' % (name, e),
-                )
+        _eval_defines(namespace, defines)
     elif defines:
         raise _RunAlgoError(
             'cannot pass define without `algotext`',
@@ -167,55 +282,22 @@ def _run(handle_data,
     if exchange_name is None:
         raise ValueError('Please specify at least one exchange.')
 
-    if isinstance(auth_aliases, string_types):
-        aliases = auth_aliases.split(',')
-        if len(aliases) < 2 or len(aliases) % 2 != 0:
-            raise ValueError(
-                'the `auth_aliases` parameter must contain an even list '
-                'of comma-delimited values. For example, '
-                '"binance,auth2" or "binance,auth2,bittrex,auth2".'
-            )
-
-        auth_aliases = dict(zip(aliases[::2], aliases[1::2]))
-
-    exchange_list = [x.strip().lower() for x in exchange.split(',')]
-    exchanges = dict()
-    for name in exchange_list:
-        if auth_aliases is not None and name in auth_aliases:
-            auth_alias = auth_aliases[name]
-        else:
-            auth_alias = None
-
-        exchanges[name] = get_exchange(
-            exchange_name=name,
-            quote_currency=quote_currency,
-            must_authenticate=(live and not simulate_orders),
-            skip_init=True,
-            auth_alias=auth_alias,
-        )
+    exchanges = _create_exchanges(
+        exchange=exchange,
+        quote_currency=quote_currency,
+        must_authenticate=(live and not simulate_orders),
+        auth_aliases=auth_aliases,
+    )
 
     open_calendar = get_calendar('OPEN')
 
-    env = TradingEnvironment(
-        load=partial(
-            load_crypto_market_data,
-            environ=environ,
-            start_dt=start,
-            end_dt=end
-        ),
-        environ=environ,
-        exchange_tz='UTC',
-        asset_db_path=None  # We don't need an asset db, we have exchanges
-    )
-    env.asset_finder = ExchangeAssetFinder(exchanges=exchanges)
+    env = _create_environment(exchanges, environ, start, end)
 
-    def choose_loader(column):
-        bound_cols = TradingPairPricing.columns
-        if column in bound_cols:
-            return ExchangePricingLoader(data_frequency)
-        raise ValueError(
-            "No PipelineLoader registered for column %s." % column
-        )
+    choose_loader = partial(_choose_loader, data_frequency)
+
+    market_feeds = dict()
+    if live and feeds:
+        market_feeds = _create_feeds(exchanges, feeds)
 
     if live:
         # TODO: fix the start data.
@@ -342,24 +424,37 @@ def _run(handle_data,
             adjustment_reader=bundle_data.adjustment_reader,
         )
 
-    perf = algorithm_class(
-        namespace=namespace,
-        env=env,
-        get_pipeline_loader=choose_loader,
-        sim_params=sim_params,
-        **{
-            'initialize': initialize,
-            'handle_data': handle_data,
-            'before_trading_start': before_trading_start,
-            'analyze': analyze,
-        } if algotext is None else {
-            'algo_filename': getattr(algofile, 'name', '<algorithm>'),
-            'script': algotext,
-        }
-    ).run(
-        data,
-        overwrite_sim_params=False,
-    )
+    try:
+        # The feeds stream during the whole run, the live clock emits a
+        # bar as soon as one of them closes a minute.
+        for name, feed in market_feeds.items():
+            log.info('streaming market data of {} from {}:{}'.format(
+                name, feed.host, feed.port
+            ))
+            feed.start()
+
+        perf = algorithm_class(
+            namespace=namespace,
+            env=env,
+            get_pipeline_loader=choose_loader,
+            sim_params=sim_params,
+            **{
+                'initialize': initialize,
+                'handle_data': handle_data,
+                'before_trading_start': before_trading_start,
+                'analyze': analyze,
+            } if algotext is None else {
+                'algo_filename': getattr(algofile, 'name', '<algorithm>'),
+                'script': algotext,
+            }
+        ).run(
+            data,
+            overwrite_sim_params=False,
+        )
+
+    finally:
+        for feed in market_feeds.values():
+            feed.stop()
 
     if output == '-':
         click.echo(str(perf))
@@ -448,7 +543,8 @@ def run_algorithm(initialize,
                   simulate_orders=True,
                   auth_aliases=None,
                   stats_output=None,
-                  output=os.devnull):
+                  output=os.devnull,
+                  feeds=None):
     """
     Run a trading algorithm.
 
@@ -534,6 +630,9 @@ def run_algorithm(initialize,
     output: str, optional
         The output file path to which the algorithm performance
         is serialized.
+    feeds: dict[str, str], optional
+        The `host:port` address of the streaming market data feed of each
+        exchange, by exchange name. Live mode only.
 
     Returns
     -------
@@ -640,5 +739,335 @@ def run_algorithm(initialize,
         analyze_live=analyze_live,
         simulate_orders=simulate_orders,
         auth_aliases=auth_aliases,
-        stats_output=stats_output
+        stats_output=stats_output,
+        feeds=feeds,
+    )
+
+
+# The backtests of the running sweep, inherited by the forked processes
+_sweep = None
+
+
+def _get_sweep_variants(sweeps, namespace=None):
+    """The combinations of the values of the names of a sweep, given as
+    assignments of the form name=values.
+    """
+    names = []
+    values = []
+    for assign in sweeps:
+        try:
+            name, value = assign.split('=', 1)
+        except ValueError:
+            raise ValueError(
+                'invalid sweep %r, should be of the form name=values' %
+                assign,
+            )
+        try:
+            values.append(list(eval(value, dict(namespace or {}))))
+        except Exception as e:
+            raise ValueError(
+                'failed to execute the values of the sweep for name %r: %s'
+                % (name, e),
+            )
+        names.append(name)
+
+    return [dict(zip(names, combination)) for combination in product(*values)]
+
+
+def _load_sweep_data(data, exchanges, symbols, start, end, data_frequency):
+    """Load the bars of the trading pairs of a sweep in shared memory.
+
+    The missing bars are ingested here when auto ingestion is enabled,
+    the forked backtests must not write to the bundles concurrently.
+    """
+    end_dt = end.replace(hour=23, minute=59) \
+        if data_frequency == 'minute' else end
+
+    total = 0
+    for exchange_name in exchanges:
+        exchange = exchanges[exchange_name]
+        # The assets are loaded once for all the backtests
+        exchange.init()
+
+        assets = []
+        for symbol in symbols:
+            try:
+                assets.append(exchange.get_asset(symbol, data_frequency))
+            except SymbolNotFoundOnExchange:
+                continue
+
+        bundle = data.exchange_bundles[exchange_name]
+        if bundle.auto_ingest and assets:
+            bundle.ingest_assets(
+                assets=assets,
+                data_frequency=data_frequency,
+                start_dt=start,
+                end_dt=end_dt,
+                show_progress=True,
+            )
+
+        # The backtests only read the bundles, the bars they miss are
+        # reported as not loaded.
+        bundle.auto_ingest = False
+
+        reader = bundle.get_reader(data_frequency)
+        if reader is None:
+            continue
+
+        for asset in assets:
+            try:
+                total += reader.load_shared_block([asset.sid], start, end_dt)
+            except (IOError, OSError, ValueError) as e:
+                log.warn(
+                    'unable to load {} / {} in shared memory, reading it '
+                    'from the bundle: {}'.format(
+                        exchange_name, asset.symbol, e
+                    )
+                )
+
+    log.info('loaded {:.1f}MB of bars in shared memory'.format(
+        total / 1e6
+    ))
+
+
+def _run_sweep_backtest(index):
+    sweep = _sweep
+    params = sweep['variants'][index]
+    log.info('running backtest {} of the sweep: {}'.format(index, params))
+
+    namespace = dict(sweep['namespace'])
+    if sweep['algotext'] is None:
+        functions = {
+            'initialize': partial(sweep['initialize'], **params),
+            'handle_data': sweep['handle_data'],
+            'before_trading_start': sweep['before_trading_start'],
+            'analyze': sweep['analyze'],
+        }
+    else:
+        namespace.update(params)
+        functions = {
+            'algo_filename': sweep['algo_filename'],
+            'script': sweep['algotext'],
+        }
+
+    return ExchangeTradingAlgorithmBacktest(
+        exchanges=sweep['exchanges'],
+        namespace=namespace,
+        env=sweep['env'],
+        get_pipeline_loader=sweep['choose_loader'],
+        sim_params=sweep['sim_params'],
+        **functions
+    ).run(
+        sweep['data'],
+        overwrite_sim_params=False,
+    )
+
+
+def _run_sweep(handle_data,
+               initialize,
+               before_trading_start,
+               analyze,
+               algofile,
+               algotext,
+               defines,
+               variants,
+               symbols,
+               processes,
+               data_frequency,
+               capital_base,
+               start,
+               end,
+               environ,
+               exchange,
+               quote_currency):
+    """Run a backtest of the algorithm for each variant of its parameters.
+
+    The exchanges, the environment and the data portal are created once
+    and the bars of the symbols are loaded in shared memory before forking
+    the processes running the backtests.
+
+    This is shared between the cli and :func:`catalyst.run_sweep`.
+    """
+    global _sweep
+
+    if algotext is None and algofile is not None:
+        algotext = algofile.read()
+
+    namespace = {}
+    if algotext is not None:
+        _eval_defines(namespace, defines)
+    elif defines:
+        raise _RunAlgoError(
+            'cannot pass define without `algotext`',
+            "cannot pass '-D' / '--define' without '-t' / '--algotext'",
+        )
+
+    log.info('Catalyst version {}'.format(catalyst.__version__))
+    if not DISABLE_ALPHA_WARNING:
+        log.warn(ALPHA_WARNING_MESSAGE)
+        sleep(3)
+
+    if exchange is None:
+        raise ValueError('Please specify at least one exchange.')
+
+    if isinstance(symbols, string_types):
+        symbols = [x.strip().lower() for x in symbols.split(',')]
+
+    log.info('running a sweep of {} backtests'.format(len(variants)))
+
+    exchanges = _create_exchanges(
+        exchange=exchange,
+        quote_currency=quote_currency,
+        must_authenticate=False,
+        auth_aliases=None,
+    )
+    env = _create_environment(exchanges, environ, start, end)
+
+    data = DataPortalExchangeBacktest(
+        exchange_names=[ex_name for ex_name in exchanges],
+        asset_finder=None,
+        trading_calendar=get_calendar('OPEN'),
+        first_trading_day=start,
+        last_available_session=end
+    )
+    _load_sweep_data(
+        data, exchanges, symbols or [], start, end, data_frequency
+    )
+
+    sim_params = create_simulation_parameters(
+        start=start,
+        end=end,
+        capital_base=capital_base,
+        data_frequency=data_frequency,
+        emission_rate=data_frequency,
+    )
+
+    _sweep = dict(
+        variants=variants,
+        namespace=namespace,
+        algotext=algotext,
+        algo_filename=getattr(algofile, 'name', '<algorithm>'),
+        initialize=initialize,
+        handle_data=handle_data,
+        before_trading_start=before_trading_start,
+        analyze=analyze,
+        exchanges=exchanges,
+        env=env,
+        choose_loader=partial(_choose_loader, data_frequency),
+        sim_params=sim_params,
+        data=data,
+    )
+    try:
+        # The processes must be forked to inherit the sweep
+        if processes == 1 or len(variants) < 2 or not hasattr(os, 'fork'):
+            return [_run_sweep_backtest(i) for i in range(len(variants))]
+
+        context = multiprocessing.get_context('fork') \
+            if hasattr(multiprocessing, 'get_context') else multiprocessing
+        pool = context.Pool(processes)
+        try:
+            return pool.map(_run_sweep_backtest, range(len(variants)), 1)
+        finally:
+            pool.close()
+            pool.join()
+
+    finally:
+        _sweep = None
+
+
+def run_sweep(initialize,
+              variants,
+              capital_base=None,
+              start=None,
+              end=None,
+              handle_data=None,
+              before_trading_start=None,
+              analyze=None,
+              data_frequency='daily',
+              default_extension=True,
+              extensions=(),
+              strict_extensions=True,
+              environ=os.environ,
+              exchange_name=None,
+              quote_currency=None,
+              symbols=None,
+              processes=None):
+    """
+    Run a backtest of a trading algorithm for each variant of its
+    parameters, in parallel.
+
+    The bundles are opened once and the bars of the specified trading
+    pairs are loaded in shared memory, so that the backtests don't read
+    the same data from the disk.
+
+    Parameters
+    ----------
+    initialize : callable[context -> None]
+        The initialize function to use for the algorithm. It is called
+        with the parameters of a variant as keyword arguments.
+    variants : list[dict[str, object]]
+        The parameters of each backtest.
+    capital_base : float
+        The starting capital for the backtests.
+    start : datetime
+        The start date of the backtests.
+    end : datetime
+        The end date of the backtests.
+    handle_data : callable[(context, BarData) -> None], optional
+        The handle_data function to use for the algorithm.
+    before_trading_start : callable[(context, BarData) -> None], optional
+        The before_trading_start function for the algorithm.
+    analyze : callable[(context, pd.DataFrame) -> None], optional
+        The analyze function to use for the algorithm.
+    data_frequency : {'daily', 'minute'}, optional
+        The data frequency to run the algorithm at.
+    default_extension : bool, optional
+        Should the default catalyst extension be loaded.
+    extensions : iterable[str], optional
+        The names of any other extensions to load.
+    strict_extensions : bool, optional
+        Should the run fail if any extensions fail to load.
+    environ : mapping[str -> str], optional
+        The os environment to use.
+    exchange_name: str
+        The name of the exchange to be used in the backtests.
+    quote_currency: str
+        The base currency to be used in the backtests.
+    symbols: list[str], optional
+        The trading pairs to load in shared memory. The other pairs are
+        read from the bundles by each backtest.
+    processes: int, optional
+        The number of processes running the backtests, the number of cpus
+        by default.
+
+    Returns
+    -------
+    list[pd.DataFrame]
+        The daily performance of each variant.
+    """
+    load_extensions(
+        default_extension, extensions, strict_extensions, environ
+    )
+
+    if capital_base is None:
+        raise ValueError('Please specify a `capital_base` parameter.')
+
+    return _run_sweep(
+        handle_data=handle_data,
+        initialize=initialize,
+        before_trading_start=before_trading_start,
+        analyze=analyze,
+        algofile=None,
+        algotext=None,
+        defines=(),
+        variants=variants,
+        symbols=symbols,
+        processes=processes,
+        data_frequency=data_frequency,
+        capital_base=capital_base,
+        start=start,
+        end=end,
+        environ=environ,
+        exchange=exchange_name,
+        quote_currency=quote_currency,
     )
@@ -0,0 +1,102 @@
+from unittest import TestCase
+
+import pandas as pd
+from pandas.util.testing import assert_index_equal
+
+from catalyst.utils.calendars.exchange_calendar_open import \
+    OpenExchangeCalendar
+from catalyst.utils.calendars.trading_calendar import TradingCalendar
+
+
+class OpenCalendarTestCase(TestCase):
+    """
+    Compares the arithmetic of the OPEN calendar with the searches of the
+    base TradingCalendar on the same schedule.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.calendar = OpenExchangeCalendar(
+            end=pd.Timestamp('2015-03-10', tz='UTC')
+        )
+        cls.dts = [
+            pd.Timestamp('2015-03-01 00:00', tz='UTC'),
+            pd.Timestamp('2015-03-02 13:37', tz='UTC'),
+            pd.Timestamp('2015-03-03 23:59', tz='UTC'),
+            pd.Timestamp('2015-03-03 23:59:30', tz='UTC'),
+            pd.Timestamp('2015-03-05 00:00:30', tz='UTC'),
+        ]
+
+    def test_all_minutes(self):
+        minutes = self.calendar._all_minutes_with_interval(1)
+        assert_index_equal(self.calendar.all_minutes, minutes)
+        self.assertEqual(len(minutes), 10 * 1440)
+
+    def test_minutes_in_range(self):
+        for start in self.dts:
+            for end in self.dts:
+                assert_index_equal(
+                    self.calendar.minutes_in_range(start, end),
+                    TradingCalendar.minutes_in_range(
+                        self.calendar, start, end
+                    ),
+                )
+
+    def test_minutes_window(self):
+        for dt in self.dts:
+            for count in (-1000, -1, 1, 1000):
+                assert_index_equal(
+                    self.calendar.minutes_window(dt, count),
+                    TradingCalendar.minutes_window(self.calendar, dt, count),
+                )
+
+    def test_next_and_previous_minute(self):
+        for dt in self.dts[1:]:
+            self.assertEqual(
+                self.calendar.next_minute(dt),
+                TradingCalendar.next_minute(self.calendar, dt),
+            )
+            self.assertEqual(
+                self.calendar.previous_minute(dt),
+                TradingCalendar.previous_minute(self.calendar, dt),
+            )
+
+        with self.assertRaises(ValueError):
+            self.calendar.previous_minute(self.dts[0])
+
+    def test_minute_to_session_label(self):
+        for dt in self.dts:
+            for direction in ('next', 'previous'):
+                self.assertEqual(
+                    self.calendar.minute_to_session_label(dt, direction),
+                    TradingCalendar.minute_to_session_label(
+                        self.calendar, dt, direction
+                    ),
+                )
+
+            self.assertEqual(
+                self.calendar.is_open_on_minute(dt),
+                TradingCalendar.is_open_on_minute(self.calendar, dt),
+            )
+
+        with self.assertRaises(ValueError):
+            self.calendar.minute_to_session_label(self.dts[3], 'none')
+
+        index = pd.DatetimeIndex(self.dts)
+        assert_index_equal(
+            self.calendar.minute_index_to_session_labels(index),
+            TradingCalendar.minute_index_to_session_labels(
+                self.calendar, index
+            ),
+        )
+
+    def test_session_distance(self):
+        self.assertEqual(
+            self.calendar.session_distance(self.dts[4], self.dts[1]), 3
+        )
+        self.assertEqual(
+            self.calendar.minutes_count_for_sessions_in_range(
+                self.calendar.all_sessions[1], self.calendar.all_sessions[3]
+            ),
+            3 * 1440,
+        )
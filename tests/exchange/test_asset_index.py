@@ -0,0 +1,100 @@
+import os
+import tempfile
+
+from mock import MagicMock
+from nose.tools import assert_equals
+
+from catalyst.exchange.exchange_asset_index import ExchangeAssetIndex, \
+    get_catalog_key, read_asset_catalog, write_asset_catalog
+
+
+class TestExchangeAssetIndex(object):
+    def setup(self):
+        self.eth_btc = MagicMock(
+            sid=1, symbol='eth_btc', exchange_symbol='ETHBTC'
+        )
+        self.local_eth_btc = MagicMock(
+            sid=1, symbol='eth_btc', exchange_symbol='ETHBTC'
+        )
+        self.neo_btc = MagicMock(
+            sid=2, symbol='neo_btc', exchange_symbol='NEOBTC'
+        )
+        self.assets = [self.eth_btc, self.neo_btc, self.local_eth_btc]
+        self.index = ExchangeAssetIndex(
+            self.assets, lambda asset: asset.symbol.replace('_', '/')
+        )
+
+    def test_lookup_sid(self):
+        assert_equals(self.index.lookup_sid(1), self.eth_btc)
+        assert_equals(self.index.lookup_sid(3), None)
+        assert_equals(self.index.sids, {1, 2})
+
+    def test_lookup_sids(self):
+        assets = self.index.lookup_sids([1, 3])
+        assert_equals(assets, [self.eth_btc, self.local_eth_btc])
+
+        assets = self.index.lookup_sids([2, 1])
+        assert_equals(assets, self.assets)
+
+    def test_lookup_symbol(self):
+        assert_equals(
+            self.index.lookup_symbol('ETH/btc'),
+            [self.eth_btc, self.local_eth_btc],
+        )
+        assert_equals(
+            self.index.lookup_symbol('neobtc', is_exchange_symbol=True),
+            [self.neo_btc],
+        )
+        assert_equals(self.index.lookup_symbol('neo_btc'), [])
+        assert_equals(self.index.symbols, ['eth_btc', 'neo_btc'])
+
+    def test_stats(self):
+        self.index.lookup_sid(1)
+        self.index.lookup_sid(5)
+        self.index.lookup_sids([1, 2, 6])
+        self.index.lookup_symbol('xrp/btc')
+
+        assert_equals(self.index.hits, 3)
+        assert_equals(self.index.misses, 3)
+
+    def test_is_current(self):
+        assert_equals(self.index.is_current(self.assets), True)
+        assert_equals(self.index.is_current(list(self.assets)), False)
+
+        self.assets.append(MagicMock(sid=4, symbol='xrp_btc'))
+        assert_equals(self.index.is_current(self.assets), False)
+
+
+class TestAssetCatalog(object):
+    def setup(self):
+        self.folder = tempfile.mkdtemp()
+        self.filename = os.path.join(self.folder, 'cctx_assets.p')
+
+        self.markets_filename = os.path.join(self.folder, 'markets.json')
+        with open(self.markets_filename, 'w') as handle:
+            handle.write('[]')
+
+    def test_read_write(self):
+        key = get_catalog_key([self.markets_filename], 2)
+        assert_equals(read_asset_catalog(self.filename, key), None)
+
+        write_asset_catalog(self.filename, key, ['eth_btc', 'neo_btc'])
+        assert_equals(
+            read_asset_catalog(self.filename, key), ['eth_btc', 'neo_btc']
+        )
+        assert_equals(
+            read_asset_catalog(
+                self.filename, get_catalog_key([self.markets_filename], 3)
+            ),
+            None,
+        )
+
+    def test_modified_files(self):
+        key = get_catalog_key([self.markets_filename])
+        write_asset_catalog(self.filename, key, ['eth_btc'])
+
+        with open(self.markets_filename, 'w') as handle:
+            handle.write('[{}]')
+
+        key = get_catalog_key([self.markets_filename])
+        assert_equals(read_asset_catalog(self.filename, key), None)
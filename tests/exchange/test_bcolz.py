@@ -2,11 +2,12 @@ import random
 import shutil
 import tempfile
 
+import numpy as np
 import pandas as pd
 from nose.tools import assert_equals
 
 from catalyst.exchange.exchange_bcolz import BcolzExchangeBarWriter, \
-    BcolzExchangeBarReader
+    BcolzExchangeBarReader, HotTierArray
 from catalyst.exchange.exchange_bundle import ExchangeBundle
 from catalyst.exchange.utils.bundle_utils import get_df_from_arrays
 
@@ -106,6 +107,134 @@ class TestBcolzWriter(object):
         writer.write(data)
         pass
 
+    def test_bcolz_minute_read_multiple_sids(self):
+        start = pd.to_datetime('2015-04-01 00:00', utc=True)
+        end = pd.to_datetime('2015-04-02 23:59', utc=True)
+        freq = 'minute'
+
+        writer = BcolzExchangeBarWriter(
+            rootdir=self.root_dir,
+            start_session=start,
+            end_session=end,
+            data_frequency=freq,
+            write_metadata=True)
+
+        first = self.generate_df('bitfinex', freq, start, end)
+        # The second sid starts trading later and has a gap.
+        second = self.generate_df('bitfinex', freq, start, end)
+        second.iloc[:60] = 0
+        second.iloc[120:180] = 0
+        writer.write([(1, first), (2, second)])
+
+        reader = BcolzExchangeBarReader(rootdir=self.root_dir,
+                                        data_frequency=freq)
+        closes, volumes = reader.load_raw_arrays(
+            ['close', 'volume'], start, end, [1, 2]
+        )
+
+        for index, df in enumerate([first, second]):
+            sid_closes, sid_volumes = reader.load_raw_arrays(
+                ['close', 'volume'], start, end, [index + 1]
+            )
+            np.testing.assert_array_equal(closes[:, index], sid_closes[:, 0])
+            np.testing.assert_array_equal(
+                volumes[:, index], sid_volumes[:, 0]
+            )
+
+        assert_equals(np.isnan(closes[:60, 1]).all(), True)
+        assert_equals(np.isnan(closes[120:180, 1]).all(), True)
+        assert_equals((volumes[:60, 1] == 0).all(), True)
+        assert_equals(np.isnan(closes[:, 0]).any(), False)
+        np.testing.assert_allclose(closes[:, 0], first['close'].values)
+
+    def test_bcolz_hot_tier(self):
+        start = pd.to_datetime('2016-01-01', utc=True)
+        end = pd.to_datetime('2016-04-30', utc=True)
+        freq = 'daily'
+
+        writer = BcolzExchangeBarWriter(
+            rootdir=self.root_dir,
+            start_session=start,
+            end_session=end,
+            data_frequency=freq,
+            write_metadata=True)
+
+        df = self.generate_df('bitfinex', freq, start, end)
+        df['close'] = np.arange(1, len(df) + 1, dtype=np.float64)
+        split = df.index.get_loc(pd.to_datetime('2016-03-01', utc=True))
+
+        writer.write([(1, df.iloc[:split])])
+        writer.build_hot_tier(
+            pd.to_datetime('2016-02-01', utc=True),
+            pd.to_datetime('2016-03-31', utc=True),
+        )
+        # Written after the hot tier was built
+        writer.write([(1, df.iloc[split:])])
+
+        reader = BcolzExchangeBarReader(rootdir=self.root_dir,
+                                        data_frequency=freq)
+        assert isinstance(reader._open_minute_file('close', 1), HotTierArray)
+
+        for range_start, range_end in [
+            ('2016-02-01', '2016-03-31'),
+            ('2016-02-15', '2016-03-15'),
+            ('2016-01-15', '2016-04-15'),
+        ]:
+            range_start = pd.to_datetime(range_start, utc=True)
+            range_end = pd.to_datetime(range_end, utc=True)
+            closes, = reader.load_raw_arrays(
+                ['close'], range_start, range_end, [1]
+            )
+            np.testing.assert_allclose(
+                closes[:, 0], df['close'][range_start:range_end].values
+            )
+
+        assert_equals(
+            reader.get_value(1, pd.to_datetime('2016-03-10', utc=True),
+                             'close'),
+            df['close']['2016-03-10'],
+        )
+
+    def test_bcolz_shared_block(self):
+        start = pd.to_datetime('2016-01-01', utc=True)
+        end = pd.to_datetime('2016-04-30', utc=True)
+        freq = 'daily'
+
+        writer = BcolzExchangeBarWriter(
+            rootdir=self.root_dir,
+            start_session=start,
+            end_session=end,
+            data_frequency=freq,
+            write_metadata=True)
+
+        df = self.generate_df('bitfinex', freq, start, end)
+        df['close'] = np.arange(1, len(df) + 1, dtype=np.float64)
+        writer.write([(1, df)])
+
+        reader = BcolzExchangeBarReader(rootdir=self.root_dir,
+                                        data_frequency=freq)
+        size = reader.load_shared_block(
+            [1],
+            pd.to_datetime('2016-02-01', utc=True),
+            pd.to_datetime('2016-03-31', utc=True),
+        )
+        assert_equals(size, 5 * 60 * 8)
+        assert isinstance(reader._open_minute_file('close', 1), HotTierArray)
+
+        # The ranges partially loaded are read from the bcolz tables
+        for range_start, range_end in [
+            ('2016-02-15', '2016-03-15'),
+            ('2016-01-15', '2016-04-15'),
+        ]:
+            range_start = pd.to_datetime(range_start, utc=True)
+            range_end = pd.to_datetime(range_end, utc=True)
+            closes, = reader.load_raw_arrays(
+                ['close'], range_start, range_end, [1]
+            )
+            np.testing.assert_allclose(
+                closes[:, 0], df['close'][range_start:range_end].values
+            )
+
     def bcolz_exchange_daily_write_read(self, exchange_name):
         start = pd.to_datetime('2017-10-01 00:00')
         end = pd.to_datetime('today')
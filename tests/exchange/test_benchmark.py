@@ -0,0 +1,96 @@
+import tempfile
+
+import numpy as np
+import pandas as pd
+from mock import MagicMock, patch
+from nose.tools import assert_equals
+
+from catalyst.exchange.exchange_benchmark import ExchangeBenchmarkSource
+from catalyst.exchange.exchange_bundle import ExchangeBundle
+from catalyst.utils.calendars import get_calendar
+
+
+class TestExchangeBenchmarkSource(object):
+    def setup(self):
+        self.folder = tempfile.mkdtemp()
+        self.calendar = get_calendar('OPEN')
+        self.sessions = pd.date_range(
+            '2017-06-02', '2017-06-06', freq='1D', tz='UTC'
+        )
+
+        self.asset = MagicMock(
+            exchange='poloniex',
+            symbol='btc_usdt',
+            sid=1,
+            start_date=pd.Timestamp('2017-01-01', tz='UTC'),
+            end_date=pd.Timestamp('2018-01-01', tz='UTC'),
+        )
+
+        # The closes of the day before the simulation and of each session,
+        # with a day without trades.
+        self.closes = np.array([100.0, 110.0, np.nan, 121.0, 121.0, 133.1])
+
+        self.reader = MagicMock()
+        self.reader.get_value.return_value = 100.0
+        self.reader.load_raw_arrays.side_effect = \
+            lambda fields, start_dt, end_dt, sids: [self.closes[:, None]]
+
+        bundle = MagicMock()
+        bundle.get_reader.return_value = self.reader
+
+        self.data_portal = MagicMock(exchange_bundles=dict(poloniex=bundle))
+        self.data_portal.get_stock_dividends.return_value = []
+
+    def create_source(self):
+        with patch('catalyst.exchange.exchange_benchmark.'
+                   'get_exchange_folder') as get_exchange_folder:
+            get_exchange_folder.return_value = self.folder
+
+            return ExchangeBenchmarkSource(
+                benchmark_asset=self.asset,
+                trading_calendar=self.calendar,
+                sessions=self.sessions,
+                data_portal=self.data_portal,
+            )
+
+    def test_returns(self):
+        source = self.create_source()
+
+        expected = [0.1, 0.0, 0.1, 0.0, 0.1]
+        for dt, value in zip(self.sessions, expected):
+            np.testing.assert_almost_equal(source.get_value(dt), value)
+
+        # Out of order and unknown dts
+        np.testing.assert_almost_equal(
+            source.get_value(self.sessions[2]), 0.1
+        )
+        assert_equals(
+            source.get_value(pd.Timestamp('2017-07-01', tz='UTC')), 0
+        )
+
+        self.data_portal.get_history_window.assert_not_called()
+
+    def test_cached_returns(self):
+        self.create_source()
+        assert_equals(self.reader.load_raw_arrays.call_count, 1)
+
+        source = self.create_source()
+        assert_equals(self.reader.load_raw_arrays.call_count, 1)
+        np.testing.assert_almost_equal(
+            source.get_range(self.sessions[0], self.sessions[-1]).values,
+            [0.1, 0.0, 0.1, 0.0, 0.1],
+        )
+
+    def test_cache_removed_by_ingestion(self):
+        self.create_source()
+        assert_equals(self.reader.load_raw_arrays.call_count, 1)
+
+        # Written by another instance of the bundle, possibly in another
+        # process
+        with patch('catalyst.exchange.exchange_bundle.'
+                   'get_exchange_folder') as get_exchange_folder:
+            get_exchange_folder.return_value = self.folder
+            ExchangeBundle('poloniex')._increment_version()
+
+        self.create_source()
+        assert_equals(self.reader.load_raw_arrays.call_count, 2)
@@ -1,9 +1,12 @@
 # import hashlib
 import os
 import tempfile
+import time
 from logging import getLogger
 
+import numpy as np
 import pandas as pd
+from mock import patch, MagicMock
 
 from catalyst.exchange.exchange_bcolz import BcolzExchangeBarReader, \
     BcolzExchangeBarWriter
@@ -40,6 +43,112 @@ class TestExchangeBundle:
         # )
         pass
 
+    def test_ingest_chunks_pipeline(self):
+        exchange_bundle = ExchangeBundle('poloniex')
+        asset = MagicMock(symbol='eth_btc')
+        chunks = [
+            dict(asset=asset, period='{}-{:02d}'.format(y, m))
+            for y in (2017, 2018) for m in range(1, 13)
+        ]
+        writer = MagicMock()
+        fetched = []
+        waiting = []
+
+        with patch.object(ExchangeBundle, 'fetch_ctable') as fetch, \
+                patch.object(ExchangeBundle, 'decode_ctable') as decode, \
+                patch.object(ExchangeBundle, 'ingest_df') as ingest_df, \
+                patch.object(ExchangeBundle, 'remove_ctable') as remove:
+            def fetch_ctable(asset, frequency, period):
+                fetched.append(period)
+                return period
+
+            def decode_ctable(asset, frequency, reader):
+                # The earliest chunks of a year are the slowest to decode
+                time.sleep(0.005 * (13 - int(reader[-2:])))
+                return reader
+
+            def write(**kwargs):
+                waiting.append(len(fetched) - len(waiting))
+                return [None]
+
+            fetch.side_effect = fetch_ctable
+            decode.side_effect = decode_ctable
+            ingest_df.side_effect = write
+
+            problems = exchange_bundle.ingest_chunks(
+                chunks=chunks,
+                data_frequency='minute',
+                writer=writer,
+                jobs=2,
+            )
+
+        assert problems == []
+        assert fetch.call_count == len(chunks)
+        assert remove.call_count == len(chunks)
+        # The chunks of an asset are written in the order of their periods
+        assert [
+            call[1]['ohlcv_df'] for call in ingest_df.call_args_list
+        ] == [chunk['period'] for chunk in chunks]
+        for call in ingest_df.call_args_list:
+            assert call[1]['writer'] is writer
+
+        # The chunks fetched ahead of the writer are bounded
+        assert max(waiting) <= 3 * 2
+
+    def test_fetch_incremental(self):
+        exchange_bundle = ExchangeBundle('poloniex')
+        exchange_bundle.exchange = MagicMock()
+
+        def get_candle_arrays(freq, assets, bar_count, start_dt):
+            # The exchange returns pages of 3 bars
+            dts = pd.date_range(start_dt, periods=3, freq=freq)
+            values = np.arange(len(dts), dtype=np.float64)
+            return dict(
+                last_traded=dts, open=values, high=values, low=values,
+                close=values, volume=values
+            )
+
+        exchange_bundle.exchange.get_candle_arrays.side_effect = \
+            get_candle_arrays
+
+        start = pd.Timestamp('2018-03-01 00:00', tz='UTC')
+        end = pd.Timestamp('2018-03-01 00:05', tz='UTC')
+        df = exchange_bundle.fetch_incremental(
+            MagicMock(), 'minute', start, end
+        )
+
+        assert list(df.index) == list(
+            pd.date_range(start, end, freq='1T')
+        )
+        assert exchange_bundle.exchange.get_candle_arrays.call_count == 2
+
+    def test_write_incremental(self):
+        with patch('catalyst.exchange.exchange_bundle.'
+                   'get_exchange_folder') as get_exchange_folder, \
+                patch.object(ExchangeBundle, 'get_reader') as get_reader:
+            get_exchange_folder.return_value = tempfile.mkdtemp()
+            get_reader.return_value = None
+
+            exchange_bundle = ExchangeBundle('poloniex')
+            asset = MagicMock(sid=1)
+            dts = pd.date_range(
+                '2018-03-01 00:02', periods=3, freq='1T', tz='UTC'
+            )
+            df = pd.DataFrame(1.0, index=dts, columns=[
+                'open', 'high', 'low', 'close', 'volume'
+            ])
+            start_dt = pd.Timestamp('2018-03-01 00:00', tz='UTC')
+            exchange_bundle._write_incremental(
+                asset, start_dt, df, MagicMock(), 'minute'
+            )
+
+            # The range fetched is covered up to the last bar written
+            coverage = exchange_bundle.get_coverage('minute')
+            assert coverage.covers(1, start_dt, dts[-1])
+            assert not coverage.covers(
+                1, start_dt, dts[-1] + pd.Timedelta(minutes=1)
+            )
+
     def _test_ingest_minute(self):
         data_frequency = 'minute'
         exchange_name = 'binance'
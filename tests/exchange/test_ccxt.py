@@ -437,6 +437,67 @@ class TestCCXT(BaseExchangeTestCase):
             except ExchangeRequestError:
                 pass
 
+    def test_process_orders(self):
+        """
+        the open orders are reconciled with a single request of each
+        method, and the trades already processed are skipped.
+        :return:
+        """
+        asset = [pair for pair in self.exchange.assets if
+                 pair.symbol == 'eth_usdt'][0]
+        orders = [
+            Order(
+                dt=pd.to_datetime('2018-05-01 19:54', utc=True),
+                asset=asset,
+                amount=2,
+                stop=None,
+                limit=0.0025,
+                id='111'
+            ),
+            Order(
+                dt=pd.to_datetime('2018-05-01 19:55', utc=True),
+                asset=asset,
+                amount=1,
+                stop=None,
+                limit=0.0024,
+                id='112'
+            ),
+        ]
+        trades = [
+            dict(id='1', order='111', amount=1.5, price=0.0025,
+                 timestamp=1525204500000),
+            dict(id='2', order='999', amount=1, price=0.0025,
+                 timestamp=1525204560000),
+        ]
+        open_orders = [dict(id='111', status='open', filled=1.5),
+                       dict(id='112', status='open', filled=0)]
+
+        self.exchange.api.has = {'fetchMyTrades': True,
+                                 'fetchOpenOrders': True,
+                                 'fetchClosedOrders': True,
+                                 }
+        self.exchange.scheduler = MagicMock()
+        self.exchange.scheduler.call.side_effect = \
+            lambda method, **kwargs: \
+            trades if method == 'fetch_my_trades' else open_orders
+
+        cursor = dict()
+        transactions = self.exchange.process_orders(orders, cursor)
+        assert list(transactions) == ['111']
+        assert transactions['111'][0].amount == 1.5
+        assert orders[0].filled == 1.5
+        assert self.exchange.scheduler.call.call_count == 2
+        assert cursor['since'][self.exchange.get_symbol(asset)] == \
+            1525204560000
+
+        # The trade of the first call is not processed again
+        trades.append(dict(id='3', order='111', amount=0.5, price=0.0024,
+                           timestamp=1525204620000))
+        transactions = self.exchange.process_orders(orders, cursor)
+        assert [t.amount for t in transactions['111']] == [0.5]
+        assert orders[0].filled == 2
+        assert '111' not in cursor['trades']
+
     # def test_order(self):
     #     log.info('creating order')
     #     asset = self.exchange.get_asset('eth_usdt')
@@ -0,0 +1,149 @@
+import tempfile
+
+import pandas as pd
+from mock import MagicMock, patch
+from nose.tools import assert_equals, assert_false, assert_true
+
+from catalyst.data.minute_bars import BcolzMinuteOverlappingData
+from catalyst.exchange.exchange_bundle import ExchangeBundle
+from catalyst.exchange.exchange_coverage import CoverageIndex
+
+
+class TestCoverageIndex(object):
+    def setup(self):
+        self.folder = tempfile.mkdtemp()
+
+    def test_intervals(self):
+        coverage = CoverageIndex(self.folder, 'daily')
+        assert_false(coverage.has_sid(1))
+
+        coverage.add(1, pd.Timestamp('2017-01-01', tz='UTC'),
+                     pd.Timestamp('2017-01-31', tz='UTC'))
+        coverage.add(1, pd.Timestamp('2017-03-01', tz='UTC'),
+                     pd.Timestamp('2017-03-31', tz='UTC'))
+        assert_equals(len(coverage.intervals(1)), 2)
+
+        assert_true(coverage.covers(
+            1, pd.Timestamp('2017-01-10', tz='UTC'),
+            pd.Timestamp('2017-01-31', tz='UTC')
+        ))
+        # The hole of february
+        assert_false(coverage.covers(
+            1, pd.Timestamp('2017-01-10', tz='UTC'),
+            pd.Timestamp('2017-03-10', tz='UTC')
+        ))
+        assert_false(coverage.covers(
+            1, pd.Timestamp('2016-12-31', tz='UTC'),
+            pd.Timestamp('2017-01-10', tz='UTC')
+        ))
+
+        # Filling the hole merges the intervals
+        coverage.add(1, pd.Timestamp('2017-02-01', tz='UTC'),
+                     pd.Timestamp('2017-02-28', tz='UTC'))
+        assert_equals(coverage.intervals(1), [(
+            pd.Timestamp('2017-01-01', tz='UTC'),
+            pd.Timestamp('2017-03-31', tz='UTC'),
+        )])
+        assert_true(coverage.covers(
+            1, pd.Timestamp('2017-01-10', tz='UTC'),
+            pd.Timestamp('2017-03-10', tz='UTC')
+        ))
+
+    def test_reload(self):
+        coverage = CoverageIndex(self.folder, 'minute')
+        other = CoverageIndex(self.folder, 'minute')
+        assert_false(other.has_sid(2))
+
+        coverage.add(2, pd.Timestamp('2017-01-01 00:00', tz='UTC'),
+                     pd.Timestamp('2017-01-01 23:59', tz='UTC'))
+        assert_true(other.covers(
+            2, pd.Timestamp('2017-01-01 12:00', tz='UTC'),
+            pd.Timestamp('2017-01-01 23:59', tz='UTC')
+        ))
+        assert_false(other.covers(
+            2, pd.Timestamp('2017-01-01 12:00', tz='UTC'),
+            pd.Timestamp('2017-01-02 00:01', tz='UTC')
+        ))
+
+
+class TestBundleCoverage(object):
+    def setup(self):
+        self.folder = tempfile.mkdtemp()
+        self.asset = MagicMock(
+            symbol='btc_usdt',
+            sid=1,
+            start_date=pd.Timestamp('2017-01-01', tz='UTC'),
+        )
+
+    def test_legacy_bundle(self):
+        # A bundle ingested before the coverage index
+        reader = MagicMock(first_trading_day=pd.Timestamp(
+            '2016-01-01', tz='UTC'
+        ))
+        reader._get_carray_path.return_value = self.folder
+        reader.table_len.return_value = 10
+        reader._pos_to_minute.return_value = pd.Timestamp(
+            '2017-01-31', tz='UTC'
+        )
+
+        with patch('catalyst.exchange.exchange_bundle.'
+                   'get_exchange_folder') as get_exchange_folder:
+            get_exchange_folder.return_value = self.folder
+
+            bundle = ExchangeBundle('poloniex')
+            assert_true(bundle.range_in_bundle(
+                self.asset,
+                pd.Timestamp('2017-01-01', tz='UTC'),
+                pd.Timestamp('2017-01-31', tz='UTC'),
+                'daily',
+                reader,
+            ))
+            assert_false(bundle.range_in_bundle(
+                self.asset,
+                pd.Timestamp('2016-12-31', tz='UTC'),
+                pd.Timestamp('2017-01-31', tz='UTC'),
+                'daily',
+                reader,
+            ))
+            reader._pos_to_minute.assert_called_once_with(9)
+
+            # The sids without data are indexed too
+            reader._get_carray_path.return_value = \
+                self.folder + '/missing'
+            asset = MagicMock(symbol='eth_usdt', sid=2,
+                              start_date=self.asset.start_date)
+            assert_false(bundle.range_in_bundle(
+                asset,
+                pd.Timestamp('2017-01-01', tz='UTC'),
+                pd.Timestamp('2017-01-31', tz='UTC'),
+                'daily',
+                reader,
+            ))
+            assert_true(bundle.get_coverage('daily').has_sid(2))
+
+    def test_overlapping_chunk(self):
+        dates = pd.date_range('2017-02-01', periods=5, freq='D', tz='UTC')
+        df = pd.DataFrame(1.0, index=dates, columns=[
+            'open', 'high', 'low', 'close', 'volume'
+        ])
+        writer = MagicMock()
+
+        with patch('catalyst.exchange.exchange_bundle.'
+                   'get_exchange_folder') as get_exchange_folder, \
+                patch.object(ExchangeBundle, 'get_reader') as get_reader:
+            get_exchange_folder.return_value = self.folder
+            get_reader.return_value = None
+
+            bundle = ExchangeBundle('poloniex')
+
+            # The chunk dropped by the writer is not recorded
+            writer.write.side_effect = BcolzMinuteOverlappingData()
+            bundle.ingest_df(df.copy(), 'daily', self.asset, writer,
+                             empty_rows_behavior='ignore')
+            coverage = bundle.get_coverage('daily')
+            assert_false(coverage.covers(1, dates[0], dates[-1]))
+
+            writer.write.side_effect = None
+            bundle.ingest_df(df.copy(), 'daily', self.asset, writer,
+                             empty_rows_behavior='ignore')
+            assert_true(coverage.covers(1, dates[0], dates[-1]))
@@ -0,0 +1,77 @@
+from threading import Event
+
+from mock import MagicMock
+from nose.tools import assert_equals, assert_raises
+
+from catalyst.exchange.exchange_algorithm import \
+    ExchangeTradingAlgorithmLive
+from catalyst.exchange.exchange_errors import ExchangeRequestError
+
+
+class TestSynchronizePortfolio(object):
+    def setup(self):
+        self.algo = MagicMock(
+            simulate_orders=False,
+            attempts=dict(synchronize_portfolio_timeout=5),
+        )
+        self.algo.blotter.open_orders = dict()
+        self.algo.portfolio.positions = dict()
+        self.algo.portfolio.cash = 100
+        self.algo._pending_syncs = dict()
+
+        self.exchanges = dict()
+        for name, cash in [('binance', 10), ('bitfinex', 20)]:
+            exchange = MagicMock()
+            exchange.name = name
+            exchange.sync_positions.return_value = (cash, 0)
+            self.exchanges[name] = exchange
+
+        self.algo.exchanges = self.exchanges
+
+    def test_partial_failure(self):
+        bitfinex = self.exchanges['bitfinex']
+        bitfinex.sync_positions.side_effect = \
+            ExchangeRequestError(error='timeout')
+
+        synced = dict()
+        with assert_raises(ExchangeRequestError):
+            ExchangeTradingAlgorithmLive.synchronize_portfolio(
+                self.algo, synced
+            )
+        assert_equals(list(synced), ['binance'])
+
+        # The next attempt only syncs the exchange which failed
+        bitfinex.sync_positions.side_effect = None
+        cash, positions_value = \
+            ExchangeTradingAlgorithmLive.synchronize_portfolio(
+                self.algo, synced
+            )
+        assert_equals(cash, 30)
+        assert_equals(
+            self.exchanges['binance'].sync_positions.call_count, 1
+        )
+        assert_equals(bitfinex.sync_positions.call_count, 2)
+
+    def test_timeout(self):
+        self.algo.attempts['synchronize_portfolio_timeout'] = 0.1
+
+        released = Event()
+        bitfinex = self.exchanges['bitfinex']
+        bitfinex.sync_positions.side_effect = \
+            lambda **kwargs: released.wait(10) and (20, 0)
+
+        synced = dict()
+        with assert_raises(ExchangeRequestError):
+            ExchangeTradingAlgorithmLive.synchronize_portfolio(
+                self.algo, synced
+            )
+
+        # The next attempt waits for the sync still running
+        released.set()
+        cash, positions_value = \
+            ExchangeTradingAlgorithmLive.synchronize_portfolio(
+                self.algo, synced
+            )
+        assert_equals(cash, 30)
+        assert_equals(bitfinex.sync_positions.call_count, 1)
+        assert_equals(self.algo._pending_syncs, dict())
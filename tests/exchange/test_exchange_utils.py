@@ -1,9 +1,9 @@
 from catalyst.exchange.utils.exchange_utils import transform_candles_to_df, \
-    forward_fill_df_if_needed, get_candles_df
+    forward_fill_df_if_needed, get_candles_df, get_candle_arrays
 
 from catalyst.testing.fixtures import WithLogger, CatalystTestCase
 from datetime import timedelta
-from pandas import Timestamp, DataFrame, concat
+from pandas import Timestamp, DataFrame, concat, date_range
 
 import numpy as np
 
@@ -173,3 +173,40 @@ class TestExchangeUtils(WithLogger, CatalystTestCase):
         self.verify_forward_fill_df_if_needed(candles, periods, expected_df)
         # Not the same due to dropna - commenting out for now
         # self.verify_get_candles_df(assets, candles, periods[2], expected_df)
+
+    def test_get_candles_df_arrays(self):
+        assets = ['btc_usdt', 'eth_usdt']
+        candles = [{'high': 595, 'volume': 10, 'low': 594,
+                    'close': 595, 'open': 594,
+                    'last_traded': Timestamp('2018-03-01 09:45:00+0000',
+                                             tz='UTC')
+                    },
+                   {'high': 594, 'volume': 108, 'low': 592,
+                    'close': 593, 'open': 592,
+                    'last_traded': Timestamp('2018-03-01 09:55:00+0000',
+                                             tz='UTC')
+                    }]
+        arrays = get_candle_arrays(candles)
+
+        end_dt = Timestamp('2018-03-01 10:02:00+0000', tz='UTC')
+        periods = date_range(end='2018-03-01 10:00:00', periods=4,
+                             freq='5T', tz='UTC')
+        # The bars of 09:50 and 10:00 have no candle, they take the
+        # previous close and no volume like forward_fill_df_if_needed
+        expected = dict(
+            open=[594, 595, 592, 593],
+            high=[595, 595, 594, 593],
+            low=[594, 595, 592, 593],
+            close=[595, 595, 593, 593],
+            volume=[10, 0, 108, 0],
+        )
+        for field in expected:
+            for asset_candles in [candles, arrays]:
+                observed_df = get_candles_df({assets[0]: asset_candles,
+                                              assets[1]: asset_candles},
+                                             field, '5T', 4, end_dt=end_dt)
+                self.assertEqual(list(observed_df.index), list(periods))
+                for asset in assets:
+                    np.testing.assert_array_equal(
+                        observed_df[asset].values, expected[field]
+                    )
@@ -0,0 +1,163 @@
+from threading import Event
+
+import pandas as pd
+from mock import MagicMock
+from nose.tools import assert_equals, assert_raises
+
+from catalyst.constants import ORDER_RECONCILE_INTERVAL
+from catalyst.exchange.exchange_blotter import ExchangeBlotter
+from catalyst.exchange.exchange_feed import ReplayServer, StreamFeed
+from catalyst.finance.order import Order
+from catalyst.utils.run_algo import _create_feeds
+
+START = 1514764800000  # 2018-01-01 00:00 UTC
+
+MESSAGES = [
+    dict(type='snapshot', symbol='ETH/BTC', timestamp=START,
+         bids=[[0.050, 1.0], [0.049, 2.0]],
+         asks=[[0.051, 1.5], [0.052, 3.0]]),
+    dict(type='ticker', symbol='ETH/BTC', timestamp=START + 500,
+         volume=1000.0),
+    dict(type='trade', symbol='ETH/BTC', timestamp=START + 1000,
+         price=0.0505, amount=1.0, side='buy'),
+    dict(type='trade', symbol='ETH/BTC', timestamp=START + 30000,
+         price=0.0510, amount=2.0, side='buy'),
+    dict(type='book', symbol='ETH/BTC', timestamp=START + 40000,
+         bids=[[0.050, 0]], asks=[[0.0505, 0.5]]),
+    dict(type='trade', symbol='ETH/BTC', timestamp=START + 59000,
+         price=0.0500, amount=0.5, side='sell'),
+    dict(type='trade', symbol='ETH/BTC', timestamp=START + 61000,
+         price=0.0502, amount=1.0, side='buy'),
+]
+
+
+class FakeAsset(object):
+    exchange = 'binance'
+    symbol = 'eth_btc'
+
+
+class TestMarketFeed(object):
+    def setup(self):
+        self.feed = StreamFeed('127.0.0.1', 0)
+
+    def test_order_book(self):
+        for message in MESSAGES:
+            self.feed.on_message(message)
+
+        book = self.feed.get_order_book('ETH/BTC', limit=2)
+        assert_equals(book['bids'], [[0.049, 2.0]])
+        assert_equals(book['asks'], [[0.0505, 0.5], [0.051, 1.5]])
+        assert_equals(book['timestamp'], START + 40000)
+
+    def test_candles(self):
+        bar_closed = Event()
+        self.feed.add_bar_listener(bar_closed)
+
+        for message in MESSAGES[:-1]:
+            self.feed.on_message(message)
+
+        assert not bar_closed.is_set()
+        assert_equals(self.feed.get_candles('ETH/BTC'), [])
+
+        self.feed.on_message(MESSAGES[-1])
+        assert bar_closed.is_set()
+        assert_equals(
+            self.feed.closed_minute,
+            pd.Timestamp('2018-01-01 00:00', tz='UTC'),
+        )
+        assert_equals(self.feed.get_candles('ETH/BTC'), [dict(
+            timestamp=START,
+            open=0.0505,
+            high=0.0510,
+            low=0.0500,
+            close=0.0500,
+            volume=3.5,
+        )])
+
+        ticker = self.feed.get_ticker('ETH/BTC')
+        assert_equals(ticker['last_price'], 0.0502)
+        assert_equals(ticker['volume'], 1000.0)
+        assert_equals(ticker['bid'], 0.049)
+        assert_equals(ticker['ask'], 0.0505)
+
+    def test_may_have_filled(self):
+        for message in MESSAGES:
+            self.feed.on_message(message)
+
+        kwargs = dict(symbol='ETH/BTC', since=START + 20000)
+        assert self.feed.may_have_filled(limit=0.0500, is_buy=True, **kwargs)
+        assert not self.feed.may_have_filled(
+            limit=0.0499, is_buy=True, **kwargs
+        )
+        assert not self.feed.may_have_filled(
+            limit=0.0511, is_buy=False, **kwargs
+        )
+        # Placed before the first message of the feed
+        assert self.feed.may_have_filled(
+            symbol='ETH/BTC', since=START - 1000, limit=0.0499, is_buy=True
+        )
+
+    def test_reconcile_interval(self):
+        for message in MESSAGES:
+            self.feed.on_message(message)
+
+        exchange = MagicMock(feed=self.feed)
+        exchange.name = 'binance'
+        exchange.get_symbol.return_value = 'ETH/BTC'
+        exchange.process_orders.return_value = dict()
+        blotter = ExchangeBlotter(
+            data_frequency='minute', exchanges=dict(binance=exchange)
+        )
+
+        # Below every trade streamed since the order was placed
+        asset = FakeAsset()
+        order = Order(
+            dt=pd.Timestamp(START + 20000, unit='ms', tz='UTC'),
+            asset=asset,
+            amount=1,
+            limit=0.0499,
+        )
+        blotter.open_orders[asset].append(order)
+
+        list(blotter.check_open_orders())
+        assert_equals(exchange.process_orders.call_count, 1)
+
+        list(blotter.check_open_orders())
+        assert_equals(exchange.process_orders.call_count, 1)
+
+        blotter.reconciled_at['binance'] -= pd.Timedelta(
+            seconds=ORDER_RECONCILE_INTERVAL
+        )
+        list(blotter.check_open_orders())
+        assert_equals(exchange.process_orders.call_count, 2)
+
+    def test_replay(self):
+        server = ReplayServer(MESSAGES)
+        host, port = server.start()
+
+        feed = StreamFeed(host, port)
+        feed.start()
+        feed.join(timeout=10)
+        server.stop()
+
+        assert not feed.connected
+        assert_equals(len(feed.get_trades('ETH/BTC')), 4)
+        assert_equals(len(feed.get_trades('ETH/BTC', since=START + 60000)), 1)
+        assert_equals(feed.get_ticker('ETH/BTC')['last'], 0.0502)
+
+    def test_create_feeds(self):
+        exchanges = dict(binance=MagicMock(feed=None), bitfinex=MagicMock())
+
+        feeds = _create_feeds(exchanges, ['binance=127.0.0.1:9000'])
+        assert_equals(list(feeds), ['binance'])
+        assert exchanges['binance'].feed is feeds['binance']
+        assert_equals(
+            (feeds['binance'].host, feeds['binance'].port),
+            ('127.0.0.1', 9000)
+        )
+
+        with assert_raises(ValueError):
+            _create_feeds(exchanges, dict(poloniex='127.0.0.1:9000'))
+
+        with assert_raises(ValueError):
+            _create_feeds(exchanges, ['binance:9000'])
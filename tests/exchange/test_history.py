@@ -0,0 +1,103 @@
+import numpy as np
+import pandas as pd
+from mock import MagicMock
+from nose.tools import assert_equals
+
+from catalyst.exchange.exchange_history import ExchangeHistoryCache
+
+
+class Asset(object):
+    # A hashable asset which, unlike a MagicMock, can't be iterated
+    # when used as a DataFrame column.
+    def __init__(self, symbol):
+        self.symbol = symbol
+        self.end_minute = None
+
+
+class TestExchangeHistoryCache(object):
+    def setup(self):
+        self.assets = [Asset('eth_btc'), Asset('neo_btc')]
+        self.index = pd.date_range(
+            '2018-01-01', periods=600, freq='T', tz='UTC'
+        )
+        self.values = np.arange(1200, dtype=np.float64).reshape(600, 2)
+
+        self.bundle = MagicMock(version=0)
+        self.bundle.get_adj_dates.side_effect = \
+            lambda start, end, assets, data_frequency: (start, end)
+        self.bundle.get_history_window_series.side_effect = \
+            self.get_history_window_series
+
+    def get_history_window_series(self, assets, end_dt, bar_count, field,
+                                  data_frequency):
+        end = self.index.get_loc(end_dt) + 1
+        return {
+            asset: pd.Series(
+                self.values[end - bar_count:end, self.assets.index(asset)],
+                index=self.index[end - bar_count:end]
+            ) for asset in assets
+        }
+
+    def test_rolling_windows(self):
+        cache = ExchangeHistoryCache(self.bundle, prefetch=dict(minute=100))
+
+        for end in range(20, 150):
+            df = cache.get_history_window(
+                assets=self.assets,
+                end_dt=self.index[end],
+                bar_count=10,
+                field='close',
+                data_frequency='minute',
+            )
+            np.testing.assert_array_equal(
+                df.values, self.values[end - 9:end + 1]
+            )
+            assert_equals(list(df.index), list(self.index[end - 9:end + 1]))
+
+        # One block up to bar 120, a second one for the rest
+        assert_equals(self.bundle.get_history_window_series.call_count, 2)
+
+    def test_window_is_a_copy(self):
+        cache = ExchangeHistoryCache(self.bundle, prefetch=dict(minute=100))
+
+        kwargs = dict(
+            assets=self.assets,
+            end_dt=self.index[20],
+            bar_count=5,
+            field='close',
+            data_frequency='minute',
+        )
+        df = cache.get_history_window(**kwargs)
+        df.iloc[0, 0] = -1.0
+
+        df = cache.get_history_window(**kwargs)
+        np.testing.assert_array_equal(df.values, self.values[16:21])
+
+    def test_invalidated_by_ingestion(self):
+        cache = ExchangeHistoryCache(self.bundle, prefetch=dict(minute=100))
+
+        kwargs = dict(
+            assets=self.assets[:1],
+            bar_count=5,
+            field='close',
+            data_frequency='minute',
+        )
+        cache.get_history_window(end_dt=self.index[10], **kwargs)
+        self.bundle.version += 1
+        df = cache.get_history_window(end_dt=self.index[11], **kwargs)
+
+        np.testing.assert_array_equal(df.values[:, 0], self.values[7:12, 0])
+        assert_equals(self.bundle.get_history_window_series.call_count, 2)
+
+    def test_missing_bars(self):
+        self.values[50:60] = np.nan
+        cache = ExchangeHistoryCache(self.bundle, prefetch=dict(minute=100))
+
+        df = cache.get_history_window(
+            assets=self.assets,
+            end_dt=self.index[55],
+            bar_count=5,
+            field='close',
+            data_frequency='minute',
+        )
+        assert_equals(df, None)
@@ -0,0 +1,87 @@
+import os
+import tempfile
+
+from nose.tools import assert_equals
+
+from catalyst.exchange.exchange_journal import StateJournal
+
+
+class TestStateJournal(object):
+    def setup(self):
+        self.folder = tempfile.mkdtemp()
+
+    def test_recover(self):
+        journal = StateJournal(self.folder, fsync_interval=2)
+        journal.save_snapshot(dict(value=0))
+        for value in range(1, 4):
+            journal.append(dict(value=value))
+        journal.close()
+
+        snapshot, records = StateJournal(self.folder).recover()
+        assert_equals(snapshot, dict(value=0))
+        assert_equals(records, [dict(value=1), dict(value=2), dict(value=3)])
+
+    def test_snapshot(self):
+        journal = StateJournal(self.folder, snapshot_interval=2)
+        journal.recover()
+        journal.append(dict(value=1))
+        assert not journal.needs_snapshot
+
+        journal.append(dict(value=2))
+        assert journal.needs_snapshot
+
+        journal.save_snapshot(dict(value=2))
+        assert not journal.needs_snapshot
+
+        journal.append(dict(value=3))
+        journal.close()
+
+        snapshot, records = StateJournal(self.folder).recover()
+        assert_equals(snapshot, dict(value=2))
+        assert_equals(records, [dict(value=3)])
+
+    def test_compacted_records(self):
+        journal = StateJournal(self.folder)
+        journal.append(dict(value=1))
+        journal.append(dict(value=2))
+        journal.close()
+
+        with open(journal.journal_filename, 'rb') as handle:
+            content = handle.read()
+
+        # Stopped between the snapshot and the truncation of the journal
+        journal.save_snapshot(dict(value=2))
+        journal.append(dict(value=3))
+        journal.close()
+
+        with open(journal.journal_filename, 'rb') as handle:
+            content += handle.read()
+
+        with open(journal.journal_filename, 'wb') as handle:
+            handle.write(content)
+
+        snapshot, records = StateJournal(self.folder).recover()
+        assert_equals(snapshot, dict(value=2))
+        assert_equals(records, [dict(value=3)])
+
+    def test_torn_record(self):
+        journal = StateJournal(self.folder)
+        journal.append(dict(value=1))
+        journal.append(dict(value=2))
+        journal.close()
+
+        size = os.path.getsize(journal.journal_filename)
+        with open(journal.journal_filename, 'r+b') as handle:
+            handle.truncate(size - 3)
+
+        journal = StateJournal(self.folder)
+        snapshot, records = journal.recover()
+        assert snapshot is None
+        assert_equals(records, [dict(value=1)])
+
+        # The next records follow the last valid one
+        journal.append(dict(value=3))
+        journal.close()
+
+        snapshot, records = StateJournal(self.folder).recover()
+        assert_equals(records, [dict(value=1), dict(value=3)])
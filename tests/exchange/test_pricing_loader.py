@@ -0,0 +1,131 @@
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+from mock import patch
+from nose.tools import assert_equals
+
+from catalyst.exchange.exchange_bundle import ExchangeBundle
+from catalyst.exchange.exchange_pricing_loader import (
+    ExchangePricingLoader,
+    TradingPairPricing,
+)
+
+FakeAsset = namedtuple('FakeAsset', ['exchange', 'sid'])
+
+EPOCH = pd.Timestamp('2015-03-01', tz='UTC')
+
+
+class FakeReader(object):
+    first_trading_day = pd.Timestamp('2017-01-01', tz='UTC')
+    last_available_dt = pd.Timestamp('2017-12-31 23:59', tz='UTC')
+
+    def __init__(self, rootdir='bundle', data_frequency='daily'):
+        self._rootdir = rootdir
+        self.calls = []
+
+    def load_raw_arrays(self, fields, start_dt, end_dt, sids):
+        self.calls.append((fields, start_dt, end_dt, sids))
+
+        days = pd.date_range(start_dt.floor('1D'), end_dt, freq='1D')
+        offsets = np.array([(day - EPOCH).days for day in days])
+        values = np.array([asset.sid for asset in sids]) * 10000.0 + \
+            offsets[:, np.newaxis]
+        return [values.copy() for _ in fields]
+
+
+class FakeBundle(object):
+    def __init__(self, reader):
+        self.reader = reader
+        self.version = 0
+        self._readers = dict()
+
+    def get_reader(self, data_frequency):
+        return self.reader
+
+
+class TestExchangePricingLoader(object):
+    def setup(self):
+        self.loader = ExchangePricingLoader('daily')
+        self.readers = dict(
+            poloniex=FakeReader(),
+            bitfinex=FakeReader(),
+        )
+        for name, reader in self.readers.items():
+            self.loader._bundles[name] = FakeBundle(reader)
+
+        self.assets = [
+            FakeAsset('poloniex', 1),
+            FakeAsset('bitfinex', 1),
+            FakeAsset('poloniex', 2),
+        ]
+
+    def load(self, start, end):
+        dates = pd.date_range(start, end, freq='1D', tz='UTC')
+        mask = np.ones((len(dates), len(self.assets)), dtype=bool)
+        columns = [TradingPairPricing.close, TradingPairPricing.volume]
+
+        out = self.loader.load_adjusted_array(
+            columns, dates, self.assets, mask
+        )
+        return dates, out[TradingPairPricing.close].data
+
+    def test_assets_of_all_exchanges(self):
+        dates, close = self.load('2017-06-02', '2017-06-20')
+
+        # The data known on each date is the data of the previous day
+        offsets = np.array([(dt - EPOCH).days - 1 for dt in dates])
+        for index, asset in enumerate(self.assets):
+            np.testing.assert_array_equal(
+                close[:, index], asset.sid * 10000.0 + offsets
+            )
+
+        for name, reader in self.readers.items():
+            for _, _, _, sids in reader.calls:
+                assert all(asset.exchange == name for asset in sids)
+
+    def test_block_cache(self):
+        self.load('2017-06-02', '2017-06-20')
+        calls = len(self.readers['poloniex'].calls)
+
+        # The windows of the following days are in the cached blocks
+        self.load('2017-06-03', '2017-06-21')
+        assert_equals(len(self.readers['poloniex'].calls), calls)
+
+    def test_block_cache_invalidated_by_ingestion(self):
+        self.load('2017-06-02', '2017-06-20')
+        calls = len(self.readers['poloniex'].calls)
+
+        self.loader._bundles['poloniex'].version += 1
+        self.load('2017-06-02', '2017-06-20')
+        assert len(self.readers['poloniex'].calls) > calls
+
+    def test_reader_reopened_after_ingestion(self):
+        ingested = dict(last=pd.Timestamp('2017-06-10', tz='UTC'))
+
+        class BundleReader(FakeReader):
+            def __init__(self, rootdir, data_frequency):
+                super(BundleReader, self).__init__(rootdir, data_frequency)
+                # The bars available are fixed when the reader opens
+                self.last_available_dt = ingested['last']
+
+        with patch('catalyst.exchange.exchange_bundle.get_exchange_folder',
+                   return_value='poloniex'), \
+                patch('catalyst.exchange.exchange_bundle.'
+                      'BcolzExchangeBarReader', BundleReader):
+            del self.loader._bundles['poloniex']
+            _, close = self.load('2017-06-02', '2017-06-20')
+            assert np.isnan(close[10:, [0, 2]]).all()
+
+            # Another instance of the bundle ingests the following bars
+            ingested['last'] = pd.Timestamp('2017-12-31 23:59', tz='UTC')
+            ExchangeBundle('poloniex')._increment_version()
+
+            _, close = self.load('2017-06-02', '2017-06-20')
+            assert not np.isnan(close).any()
+
+    def test_outside_of_bundle(self):
+        dates, close = self.load('2016-12-30', '2017-01-03')
+
+        assert np.isnan(close[:3]).all()
+        assert not np.isnan(close[3:]).any()
@@ -0,0 +1,125 @@
+import tempfile
+
+import numpy as np
+import pandas as pd
+from mock import MagicMock
+from nose.tools import assert_equals
+
+from catalyst.exchange.exchange_data_portal import \
+    DataPortalExchangeBacktest
+from catalyst.exchange.exchange_rollups import aggregate_bars, \
+    write_rollups, truncate_rollups, RollupHistoryAggregator
+
+
+class Asset(object):
+    # Used as a column of the windows, pandas would try to iterate over
+    # a MagicMock
+    def __init__(self, sid, symbol):
+        self.sid = sid
+        self.symbol = symbol
+
+
+class TestRollups(object):
+    def setup(self):
+        self.folder = tempfile.mkdtemp()
+        self.first_day = pd.Timestamp('2018-01-01', tz='UTC')
+
+        # Three hours of minutes with a price of the minute of the day,
+        # not traded in the second hour.
+        minutes = np.arange(180, dtype=np.uint64) + 1
+        minutes[60:120] = 0
+        self.table = pd.DataFrame({
+            field: minutes for field in
+            ['open', 'high', 'low', 'close', 'volume']
+        })
+
+    def test_aggregate_bars(self):
+        cols = {
+            field: self.table[field].values
+            for field in self.table.columns
+        }
+        bars = aggregate_bars(cols, 60)
+
+        np.testing.assert_array_equal(bars['open'], [1, 0, 121])
+        np.testing.assert_array_equal(bars['high'], [60, 0, 180])
+        np.testing.assert_array_equal(bars['low'], [1, 0, 121])
+        np.testing.assert_array_equal(bars['close'], [60, 0, 180])
+        np.testing.assert_array_equal(
+            bars['volume'], [1830, 0, 9030]
+        )
+
+    def create_aggregator(self):
+        reader = MagicMock(
+            _rootdir=self.folder,
+            first_trading_day=self.first_day,
+        )
+        reader._find_position_of_minute.side_effect = \
+            lambda dt: int((dt - self.first_day).total_seconds() // 60)
+        reader._ohlc_ratio_inverses_for_sids.side_effect = \
+            lambda sids: np.full(len(sids), 0.5)
+
+        bundle = MagicMock()
+        bundle.get_reader.return_value = reader
+
+        return RollupHistoryAggregator(bundle), reader
+
+    def test_history_window(self):
+        # Written in two parts, the first hour being partially rolled up
+        write_rollups(self.folder, 1, self.table[:30], 0)
+        write_rollups(self.folder, 1, self.table, 30)
+
+        aggregator, reader = self.create_aggregator()
+        reader.load_raw_arrays.return_value = [np.array([[242.0], [244.0]])]
+
+        asset = Asset(1, 'eth_btc')
+        df = aggregator.get_history_window(
+            assets=[asset],
+            end_dt=self.first_day + pd.Timedelta(minutes=121),
+            bar_count=3,
+            field='close',
+            frequency='hourly',
+        )
+
+        assert_equals(list(df.index), list(pd.date_range(
+            self.first_day, periods=3, freq='1H'
+        )))
+        np.testing.assert_array_equal(df[asset].values, [30, np.nan, 244])
+
+        # The rollups do not include the window
+        df = aggregator.get_history_window(
+            assets=[asset],
+            end_dt=self.first_day + pd.Timedelta(days=1),
+            bar_count=3,
+            field='close',
+            frequency='hourly',
+        )
+        assert df is None
+
+    def test_truncate(self):
+        write_rollups(self.folder, 1, self.table, 0)
+        truncate_rollups(self.folder, 60)
+
+        aggregator, _ = self.create_aggregator()
+        values = aggregator.load_rollup_arrays(
+            'hourly', 'close', [1], self.first_day,
+            self.first_day + pd.Timedelta(hours=2),
+        )
+        np.testing.assert_array_equal(values[:, 0], [30, np.nan, np.nan])
+
+    def test_window_not_in_bundle(self):
+        bundle = MagicMock()
+        bundle.range_in_bundle.return_value = False
+        portal = DataPortalExchangeBacktest.__new__(
+            DataPortalExchangeBacktest
+        )
+        portal.exchange_bundles = dict(poloniex=bundle)
+        portal.rollup_aggregators = dict(poloniex=MagicMock())
+
+        # The missing bars are loaded like the other windows
+        end_dt = self.first_day + pd.Timedelta(minutes=179)
+        df = portal._get_rollup_history_window(
+            'poloniex', [Asset(1, 'btc_usdt')], end_dt, 120, '60T', 'close'
+        )
+        assert df is None
+        portal.rollup_aggregators['poloniex'].get_history_window \
+            .assert_not_called()
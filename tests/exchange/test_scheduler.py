@@ -0,0 +1,109 @@
+from threading import Event, Thread
+
+from mock import MagicMock
+from nose.tools import assert_equals, assert_raises
+
+from catalyst.exchange.exchange_scheduler import RequestScheduler, \
+    TokenBucket
+
+
+class RateLimitError(Exception):
+    pass
+
+
+class TestRequestScheduler(object):
+    def setup(self):
+        self.api = MagicMock()
+        self.scheduler = RequestScheduler(
+            api=self.api,
+            bucket=TokenBucket(rate_limit=0),
+            rate_limit_errors=(RateLimitError,),
+        )
+
+    def test_merge_in_flight_requests(self):
+        sent = Event()
+        release = Event()
+
+        def fetch_ticker(symbol):
+            sent.set()
+            release.wait(5)
+            return dict(symbol=symbol, last=1.0)
+
+        self.api.fetch_ticker.side_effect = fetch_ticker
+
+        results = []
+
+        def call():
+            results.append(
+                self.scheduler.call('fetch_ticker', symbol='ETH/BTC')
+            )
+
+        threads = [Thread(target=call)]
+        threads[0].start()
+        sent.wait(5)
+
+        threads += [Thread(target=call) for _ in range(2)]
+        for thread in threads[1:]:
+            thread.start()
+
+        # The followers register before the request completes
+        while self.scheduler._in_flight and \
+                list(self.scheduler._in_flight.values())[0].followers < 2:
+            pass
+
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert_equals(self.api.fetch_ticker.call_count, 1)
+        assert_equals(results, [dict(symbol='ETH/BTC', last=1.0)] * 3)
+        assert results[0] is not results[1]
+
+        metrics = self.scheduler.metrics['fetch_ticker']
+        assert_equals(metrics['requests'], 1)
+        assert_equals(metrics['merged'], 2)
+
+    def test_orders_are_not_merged(self):
+        self.scheduler.call('create_order', symbol='ETH/BTC', amount=1)
+        self.scheduler.call('create_order', symbol='ETH/BTC', amount=1)
+
+        assert_equals(self.api.create_order.call_count, 2)
+
+    def test_rate_limited(self):
+        self.api.fetch_balance.side_effect = RateLimitError('429')
+        self.scheduler.bucket.pause = MagicMock()
+
+        with assert_raises(RateLimitError):
+            self.scheduler.call('fetch_balance')
+
+        assert_equals(self.scheduler.bucket.pause.call_count, 1)
+
+        metrics = self.scheduler.metrics['fetch_balance']
+        assert_equals(metrics['errors'], 1)
+        assert_equals(metrics['rate_limited_rate'], 1.0)
+
+
+class TestTokenBucket(object):
+    def test_priorities(self):
+        bucket = TokenBucket(rate_limit=200)
+        bucket.acquire()
+
+        order = []
+
+        def acquire(priority):
+            bucket.acquire(priority)
+            order.append(priority)
+
+        threads = [Thread(target=acquire, args=(priority,))
+                   for priority in (2, 1, 0)]
+        for thread in threads:
+            thread.start()
+
+        # Starting the waiters while the bucket is empty
+        while len(bucket._waiting) < 3:
+            pass
+
+        for thread in threads:
+            thread.join()
+
+        assert_equals(order, [0, 1, 2])
@@ -0,0 +1,99 @@
+import os
+import tempfile
+
+import pandas as pd
+from mock import MagicMock, patch
+from nose.tools import assert_equals
+
+from catalyst.exchange.utils.stats_utils import StatsBuffer, prepare_stats, \
+    append_stats_to_algo_folder
+
+
+def period_stats(minute, assets=(), **recorded):
+    stats = dict(
+        period_close=pd.Timestamp('2018-01-01', tz='UTC') +
+        pd.Timedelta(minutes=minute),
+        starting_cash=1000.0,
+        ending_cash=1000.0 - minute,
+        portfolio_value=1000.0,
+        pnl=0.0,
+        long_exposure=float(minute),
+        short_exposure=0.0,
+        orders=[dict()] * (minute % 2),
+        transactions=[],
+        positions=[
+            dict(sid=asset, amount=minute, cost_basis=1.0,
+                 last_sale_price=1.0 + minute)
+            for asset in assets
+        ],
+    )
+    stats.update(recorded)
+    return stats
+
+
+class TestStatsBuffer(object):
+    def setup(self):
+        self.assets = [
+            MagicMock(symbol='eth_btc'), MagicMock(symbol='neo_btc')
+        ]
+
+    def test_tail(self):
+        buffer = StatsBuffer(capacity=8)
+        stats = [
+            period_stats(minute, self.assets, signal=minute * 2)
+            for minute in range(10)
+        ]
+        for row in stats:
+            buffer.append(row, ['signal'])
+
+        assert_equals(buffer.rows, 20)
+        assert_equals(buffer.periods, 10)
+
+        observed, observed_columns = buffer.tail(3)
+        expected, expected_columns = prepare_stats(stats[-3:], ['signal'])
+
+        # The rows of a period may come in any order from prepare_stats
+        assert_equals(observed_columns, expected_columns)
+        assert_equals(
+            sorted(observed[observed_columns].values.tolist()),
+            sorted(expected[expected_columns].values.tolist()),
+        )
+        assert_equals(sorted(observed.index), sorted(expected.index))
+
+    def test_to_frame(self):
+        buffer = StatsBuffer(capacity=4)
+        for minute in range(6):
+            buffer.append(period_stats(minute))
+
+        df = buffer.to_frame()
+        assert_equals(list(df['ending_cash']), [998.0, 997.0, 996.0, 995.0])
+        assert_equals(list(df['orders']), [0, 1, 0, 1])
+
+        df = buffer.to_frame(start=5)
+        assert_equals(list(df['ending_cash']), [995.0])
+
+    def test_append_to_algo_folder(self):
+        folder = tempfile.mkdtemp()
+        buffer = StatsBuffer()
+
+        with patch('catalyst.exchange.utils.stats_utils.get_algo_folder',
+                   return_value=folder):
+            for minute in range(3):
+                buffer.append(period_stats(minute))
+                filename = append_stats_to_algo_folder(
+                    buffer, 'algo', 'stats_live'
+                )
+
+            df = pd.read_csv(filename)
+            assert_equals(len(df), 3)
+            assert 'symbol' not in df.columns
+
+            # The first position changes the columns of the file
+            buffer.append(period_stats(3, self.assets[:1]))
+            append_stats_to_algo_folder(buffer, 'algo', 'stats_live')
+
+        df = pd.read_csv(filename)
+        assert_equals(len(df), 4)
+        assert_equals(list(df['symbol'].fillna('')), ['', '', '', 'eth_btc'])
+        assert_equals(os.path.dirname(filename),
+                      os.path.join(folder, 'stats_live'))
@@ -0,0 +1,84 @@
+import pandas as pd
+import six
+from mock import MagicMock
+from nose.tools import assert_equals, assert_raises
+
+from catalyst.exchange.exchange import Exchange
+from catalyst.exchange.exchange_errors import ExchangeRequestError
+from catalyst.exchange.exchange_tickers import TickerSnapshot
+
+
+class TestTickerSnapshot(object):
+    def setup(self):
+        self.eth_btc = MagicMock(symbol='eth_btc')
+        self.neo_btc = MagicMock(symbol='neo_btc')
+        self.xrp_btc = MagicMock(symbol='xrp_btc')
+
+        self.exchange = MagicMock(
+            ticker_snapshot=TickerSnapshot(ttl=30),
+            has_bulk_tickers=True,
+            feed=None,
+        )
+        self.exchange.tickers.side_effect = lambda assets, **kwargs: {
+            asset: dict(last=1.0) for asset in assets
+            if asset is not self.xrp_btc
+        }
+        self.get_tickers = six.get_unbound_function(Exchange.get_tickers)
+
+    def test_snapshot(self):
+        snapshot = TickerSnapshot(ttl=30)
+        snapshot.advance(pd.Timestamp('2018-01-01 00:01', tz='UTC'))
+        snapshot.update({self.eth_btc: dict(last=1.0)}, now=100)
+
+        assert_equals(snapshot.get(self.eth_btc, now=110), dict(last=1.0))
+        assert_equals(snapshot.get(self.eth_btc, now=140), None)
+        assert_equals(snapshot.get(self.neo_btc, now=110), None)
+
+        snapshot.advance(pd.Timestamp('2018-01-01 00:01', tz='UTC'))
+        assert_equals(snapshot.get(self.eth_btc, now=110), dict(last=1.0))
+
+        snapshot.advance(pd.Timestamp('2018-01-01 00:02', tz='UTC'))
+        assert_equals(snapshot.get(self.eth_btc, now=110), None)
+
+    def test_single_request_per_bar(self):
+        snapshot = self.exchange.ticker_snapshot
+        snapshot.advance(pd.Timestamp('2018-01-01 00:01', tz='UTC'))
+
+        self.get_tickers(self.exchange, [self.eth_btc])
+        self.get_tickers(self.exchange, [self.neo_btc])
+        self.get_tickers(self.exchange, [self.eth_btc, self.neo_btc])
+        assert_equals(self.exchange.tickers.call_count, 2)
+
+        # The next bar fetches all the assets watched so far at once
+        snapshot.advance(pd.Timestamp('2018-01-01 00:02', tz='UTC'))
+        self.get_tickers(self.exchange, [self.eth_btc])
+        tickers = self.get_tickers(self.exchange, [self.neo_btc])
+
+        assert_equals(tickers, {self.neo_btc: dict(last=1.0)})
+        assert_equals(self.exchange.tickers.call_count, 3)
+
+        requested = self.exchange.tickers.call_args[0][0]
+        assert_equals(set(requested), {self.eth_btc, self.neo_btc})
+
+    def test_watched_expire(self):
+        snapshot = TickerSnapshot(ttl=30, watch_bars=2)
+        snapshot.advance(pd.Timestamp('2018-01-01 00:01', tz='UTC'))
+        snapshot.watch([self.eth_btc, self.neo_btc])
+
+        snapshot.advance(pd.Timestamp('2018-01-01 00:02', tz='UTC'))
+        snapshot.watch([self.eth_btc])
+        snapshot.advance(pd.Timestamp('2018-01-01 00:03', tz='UTC'))
+        assert_equals(set(snapshot.watched), {self.eth_btc, self.neo_btc})
+
+        # Not requested in the last 2 bars
+        snapshot.advance(pd.Timestamp('2018-01-01 00:04', tz='UTC'))
+        assert_equals(set(snapshot.watched), {self.eth_btc})
+
+    def test_ticker_not_found(self):
+        with assert_raises(ExchangeRequestError):
+            self.get_tickers(self.exchange, [self.xrp_btc])
+
+        tickers = self.get_tickers(
+            self.exchange, [self.xrp_btc], on_ticker_error='warn'
+        )
+        assert_equals(tickers, dict())
@@ -718,7 +718,7 @@ class ConstantInputTestCase(WithConstantInputs, CatalystTestCase):
                 )
                 assert_frame_equal(output_results, output_expected)
 
-    def _test_loader_given_multiple_columns(self):
+    def test_loader_given_multiple_columns(self):
 
         class Loader1DataSet1(DataSet):
             col1 = Column(float)
@@ -815,6 +815,112 @@ class ConstantInputTestCase(WithConstantInputs, CatalystTestCase):
                          {ColumnArgs.sorted_by_ds(Loader2DataSet.col1,
                                                   Loader2DataSet.col2)})
 
+    def test_concurrent_terms(self):
+        loader = RecordingPrecomputedLoader(
+            constants=self.constants,
+            dates=self.dates,
+            sids=self.asset_ids,
+        )
+        high, low = USEquityPricing.high, USEquityPricing.low
+        open, close = USEquityPricing.open, USEquityPricing.close
+
+        columns = {}
+        for window_length in range(1, 6):
+            high_minus_low = RollingSumDifference(
+                inputs=[high, low], window_length=window_length,
+            )
+            open_minus_close = RollingSumDifference(
+                inputs=[open, close], window_length=window_length,
+            )
+            columns['high_low_%d' % window_length] = high_minus_low
+            columns['open_close_%d' % window_length] = open_minus_close
+            columns['avg_%d' % window_length] = \
+                (high_minus_low + open_minus_close) / 2
+        pipeline = Pipeline(columns=columns)
+
+        dates = self.dates[10:15]
+        results = []
+        for num_threads in (1, 4):
+            del loader.load_calls[:]
+            engine = SimplePipelineEngine(
+                lambda column: loader, self.dates, self.asset_finder,
+                num_threads=num_threads,
+            )
+            results.append(engine.run_pipeline(pipeline, dates[0], dates[-1]))
+
+            # Each loader group is loaded once
+            self.assertEqual(
+                len(loader.load_calls), len(set(loader.load_calls))
+            )
+
+        assert_frame_equal(results[0], results[1])
+        assert_frame_equal(
+            results[1]['avg_5'].unstack(),
+            DataFrame(5.0, index=dates, columns=self.assets),
+        )
+
+        # The following runs reuse the threads of the engine
+        pool = engine._pool
+        engine.run_pipeline(pipeline, dates[0], dates[-1])
+        self.assertIs(engine._pool, pool)
+
+    def test_chunked_pipeline_processes(self):
+        loader = self.loader
+        engine = SimplePipelineEngine(
+            lambda column: loader, self.dates, self.asset_finder,
+        )
+        pipeline = Pipeline(columns={'f': RollingSumDifference()})
+        dates = self.dates[10:20]
+
+        expected = engine.run_pipeline(pipeline, dates[0], dates[-1])
+
+        result = engine.run_chunked_pipeline(
+            pipeline, dates[0], dates[-1], chunksize=3, processes=2,
+        )
+        assert_frame_equal(result, expected)
+
+        result = engine.run_chunked_pipeline(
+            pipeline, dates[0], dates[-1], chunksize=None, processes=2,
+            memory_budget=4096,
+        )
+        assert_frame_equal(result, expected)
+
+    def test_chunked_pipeline_processes_after_threads(self):
+        loader = self.loader
+        engine = SimplePipelineEngine(
+            lambda column: loader, self.dates, self.asset_finder,
+            num_threads=2,
+        )
+        pipeline = Pipeline(columns={'f': RollingSumDifference()})
+        dates = self.dates[10:20]
+
+        # The forked processes inherit the pool of the engine without its
+        # threads
+        expected = engine.run_pipeline(pipeline, dates[0], dates[-1])
+        self.assertIsNotNone(engine._pool)
+
+        result = engine.run_chunked_pipeline(
+            pipeline, dates[0], dates[-1], chunksize=3, processes=2,
+        )
+        assert_frame_equal(result, expected)
+
+    def test_chunksize_for_budget(self):
+        loader = self.loader
+        engine = SimplePipelineEngine(
+            lambda column: loader, self.dates, self.asset_finder,
+        )
+        pipeline = Pipeline(columns={'f': RollingSumDifference()})
+        dates = self.dates[10:20]
+
+        chunksizes = [
+            engine._chunksize_for_budget(
+                pipeline, dates[0], dates[-1], budget,
+            )
+            for budget in (0, 4096, 8192)
+        ]
+        self.assertEqual(chunksizes[0], 1)
+        self.assertLess(chunksizes[1], chunksizes[2])
+
 
 class FrameInputTestCase(WithTradingEnvironment, CatalystTestCase):
     asset_ids = ASSET_FINDER_EQUITY_SIDS = 1, 2, 3
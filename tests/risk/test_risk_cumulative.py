@@ -13,9 +13,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from unittest import TestCase
+
 import numpy as np
 import pandas as pd
 import catalyst.finance.risk as risk
+from catalyst.finance.risk.online import ReturnsMoments
+from catalyst.patches import stats
 from catalyst.utils import factory
 
 from catalyst.testing.fixtures import WithTradingEnvironment, CatalystTestCase
@@ -144,3 +148,36 @@ class TestRisk(WithTradingEnvironment, CatalystTestCase):
     def test_representation(self):
         assert all([metric in self.cumulative_metrics.__repr__() for metric in
                    self.cumulative_metrics.METRIC_NAMES])
+
+
+class TestReturnsMoments(TestCase):
+
+    def test_matches_stats(self):
+        random_state = np.random.RandomState(42)
+        returns = random_state.normal(0.001, 0.02, 300)
+        benchmark = random_state.normal(0.0005, 0.01, 300)
+        returns[5] = np.nan
+        benchmark[9] = np.nan
+
+        moments = ReturnsMoments()
+        for algo_return, benchmark_return in zip(returns, benchmark):
+            moments.add(algo_return, benchmark_return)
+
+        alpha, beta = stats.alpha_beta_aligned(returns, benchmark)
+        expected = {
+            'algorithm_cumulative_return': stats.cum_returns(returns)[-1],
+            'benchmark_cumulative_return': stats.cum_returns(benchmark)[-1],
+            'algorithm_volatility': stats.annual_volatility(returns),
+            'benchmark_volatility': stats.annual_volatility(benchmark),
+            'alpha': alpha,
+            'beta': beta,
+            'sharpe': stats.sharpe_ratio(returns),
+            'downside_risk': stats.downside_risk(returns),
+            'sortino': stats.sortino_ratio(returns),
+            'information': stats.information_ratio(returns, benchmark),
+            'max_drawdown': stats.max_drawdown(returns),
+        }
+        for name, value in expected.items():
+            np.testing.assert_allclose(
+                getattr(moments, name), value, rtol=1e-10, err_msg=name
+            )
@@ -2168,3 +2168,38 @@ class TestPositionTracker(WithTradingEnvironment,
         # Test gross and net exposures.
         self.assertEqual(100, pos_stats.gross_exposure)
         self.assertEqual(100, pos_stats.net_exposure)
+
+    def test_sync_last_sale_prices(self):
+        pt = perf.PositionTracker('minute')
+        dt = pd.Timestamp('2017/01/04 3:00PM', tz='UTC')
+
+        for asset, amount in ((self.EQUITY1, 10.0), (self.EQUITY2, -20.0),
+                              (self.FUTURE5, 30.0)):
+            pt.update_position(
+                asset, amount=amount, last_sale_date=dt, last_sale_price=10
+            )
+
+        # Closing a position moves the last slot
+        pt.execute_transaction(create_txn(self.EQUITY1, dt, 10, -10))
+
+        prices = {self.EQUITY2: 11.0, self.FUTURE5: np.nan}
+        requests = []
+
+        class DataPortal(object):
+            def get_spot_value(self, assets, field, dt, data_frequency):
+                requests.append(list(assets))
+                return [prices[asset] for asset in assets]
+
+        pt.sync_last_sale_prices(dt, False, DataPortal())
+
+        self.assertEqual(len(requests), 1)
+        self.assertEqual(
+            sorted(requests[0]), sorted([self.EQUITY2, self.FUTURE5])
+        )
+        self.assertEqual(pt.positions[self.EQUITY2].last_sale_price, 11.0)
+        self.assertEqual(pt.positions[self.FUTURE5].last_sale_price, 10)
+
+        pos_stats = pt.stats()
+        self.assertEqual(-220, pos_stats.short_value)
+        self.assertEqual(30 * 10 * 50, pos_stats.long_exposure)
+        self.assertEqual(1, pos_stats.longs_count)